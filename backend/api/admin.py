@@ -31,10 +31,11 @@ class UserAdmin(admin.ModelAdmin):
 
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
-    list_display = ['title', 'teacher', 'difficulty_level', 'fee', 'enrolled_students_count', 'is_active']
+    list_display = ['title', 'teacher', 'difficulty_level', 'fee', 'enrolled_students_count', 'average_rating', 'is_active']
     list_filter = ['difficulty_level', 'is_active', 'created_at', 'teacher']
+    list_select_related = ['teacher']
     search_fields = ['title', 'description', 'teacher__username']
-    readonly_fields = ['created_at', 'updated_at', 'enrolled_students_count']
+    readonly_fields = ['created_at', 'updated_at', 'enrolled_students_count', 'average_rating']
     fieldsets = (
         ('Basic Information', {
             'fields': ('title', 'description', 'teacher', 'difficulty_level')
@@ -0,0 +1,274 @@
+import logging
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db.models import Count, DateField, Q, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from .caching import get_or_compute
+from .models import (
+    User, Course, Enrollment, FeeTransaction, ExamAttempt,
+    DailyEnrollmentStat, DailyRevenueStat, DailyStudentStat
+)
+
+# Get logger for analytics
+logger = logging.getLogger('api.analytics')
+
+ADMIN_STATS_CACHE_KEY = 'admin:stats'
+
+
+def compute_admin_stats():
+    """
+    Compute the admin dashboard statistics in four queries.
+
+    User and course counts come back together from one conditional
+    aggregation over users joined to the courses they teach (every course
+    has a teacher, so the join reaches all of them; distinct counts undo
+    the fan-out). Revenue and recent transactions share one aggregation
+    over fee transactions. Popular courses rank by all enrollments,
+    inactive ones included, as the dashboard always has; that is one
+    grouped count with the teachers joined in, not the stored counters,
+    which only cover active enrollments.
+    """
+    week_ago = timezone.now() - timedelta(days=7)
+
+    counts = User.objects.aggregate(
+        total_users=Count('id', distinct=True),
+        total_students=Count('id', filter=Q(role='student'), distinct=True),
+        total_teachers=Count('id', filter=Q(role='teacher'), distinct=True),
+        total_courses=Count('courses_taught', distinct=True),
+        active_courses=Count('courses_taught', filter=Q(courses_taught__is_active=True), distinct=True),
+    )
+
+    transactions = FeeTransaction.objects.aggregate(
+        total_revenue=Sum('amount', filter=Q(payment_status='completed')),
+        recent_transactions=Count('id', filter=Q(transaction_date__gte=week_ago)),
+    )
+
+    recent_enrollments = Enrollment.objects.filter(enrolled_at__gte=week_ago).count()
+
+    popular_courses = Course.objects.select_related('teacher').only(
+        'id', 'title', 'teacher__first_name', 'teacher__last_name', 'teacher__username'
+    ).annotate(enrollment_count=Count('enrollments')).order_by('-enrollment_count', 'id')[:5]
+
+    logger.debug("Computed admin stats: %s", counts)
+    return {
+        **counts,
+        'total_revenue': float(transactions['total_revenue'] or 0),
+        'recent_enrollments': recent_enrollments,
+        'recent_transactions': transactions['recent_transactions'],
+        'popular_courses': [
+            {
+                'id': course.id,
+                'title': course.title,
+                'enrollment_count': course.enrollment_count,
+                'teacher': course.teacher.full_name
+            }
+            for course in popular_courses
+        ],
+        'computed_at': timezone.now(),
+    }
+
+
+def get_admin_stats():
+    """
+    Admin dashboard statistics, cached for ADMIN_STATS_CACHE_TIMEOUT seconds.
+
+    Concurrent dashboard loads on a cold cache share one computation.
+    """
+    timeout = getattr(settings, 'ADMIN_STATS_CACHE_TIMEOUT', 30)
+    return get_or_compute(ADMIN_STATS_CACHE_KEY, compute_admin_stats, timeout)
+
+
+def _percent_change(current, previous):
+    if not previous:
+        return 0
+    return round(float((current - previous) / previous * 100), 2)
+
+
+def compute_period_analytics(days):
+    """
+    Compare the last `days` days (today included) with the period before.
+
+    Enrollment, revenue and new-student totals are summed from the daily
+    rollup tables, so the cost grows with the number of days rather than
+    with raw history.
+    Retention still needs a distinct scan of the enrollments in the window.
+    """
+    today = timezone.localdate()
+    start = today - timedelta(days=days)
+    previous_start = start - timedelta(days=days)
+    current, previous = Q(date__gt=start), Q(date__gt=previous_start, date__lte=start)
+
+    enrollments = DailyEnrollmentStat.objects.filter(date__gt=previous_start).aggregate(
+        current=Sum('enrollments', filter=current),
+        previous=Sum('enrollments', filter=previous),
+    )
+    revenue = DailyRevenueStat.objects.filter(date__gt=previous_start).aggregate(
+        current=Sum('amount', filter=current),
+        previous=Sum('amount', filter=previous),
+    )
+    new_students = DailyStudentStat.objects.filter(date__gt=previous_start).aggregate(
+        current=Sum('new_students', filter=current),
+        previous=Sum('new_students', filter=previous),
+    )
+    total_enrollments = enrollments['current'] or 0
+    total_revenue = revenue['current'] or 0
+    total_new_students = new_students['current'] or 0
+
+    window_start = timezone.now() - timedelta(days=days)
+    courses = Course.objects.aggregate(
+        active=Count('id', filter=Q(is_active=True)),
+        previous=Count('id', filter=Q(
+            created_at__gte=window_start - timedelta(days=days), created_at__lt=window_start
+        )),
+    )
+
+    total_students = User.objects.filter(role='student').count()
+    active_students = Enrollment.objects.filter(
+        enrolled_at__gte=window_start, student__role='student'
+    ).values('student').distinct().count()
+    retention_rate = (active_students / total_students) * 100 if total_students else 0
+
+    return {
+        'total_enrollments': total_enrollments,
+        'enrollment_change': _percent_change(total_enrollments, enrollments['previous']),
+        'total_revenue': float(total_revenue),
+        'revenue_change': _percent_change(total_revenue, revenue['previous']),
+        'new_students': total_new_students,
+        'new_student_change': _percent_change(total_new_students, new_students['previous']),
+        'active_courses': courses['active'],
+        'course_change': _percent_change(courses['active'], courses['previous']),
+        'retention_rate': round(retention_rate, 2),
+        'retention_change': 0,  # Placeholder for retention change calculation
+    }
+
+
+def compute_financial_summary():
+    """
+    Revenue totals for the admin dashboard, summed from DailyRevenueStat.
+
+    All-time revenue is the sum of the per-type totals, so it costs no
+    extra query.
+    """
+    month_start = timezone.localdate().replace(day=1)
+    monthly_revenue = DailyRevenueStat.objects.filter(date__gte=month_start).aggregate(
+        total=Sum('amount')
+    )['total'] or 0
+
+    revenue_by_type = list(
+        DailyRevenueStat.objects.order_by().values('transaction_type').annotate(
+            total=Sum('amount'), count=Sum('transactions')
+        ).filter(count__gt=0).order_by('transaction_type')
+    )
+
+    pending_payments = FeeTransaction.objects.filter(payment_status='pending').count()
+
+    return {
+        'monthly_revenue': float(monthly_revenue),
+        'total_revenue': float(sum(item['total'] for item in revenue_by_type)),
+        'revenue_by_type': [
+            {
+                'type': item['transaction_type'],
+                'total': float(item['total'])
+            }
+            for item in revenue_by_type
+        ],
+        'pending_payments': pending_payments
+    }
+
+
+TIMESERIES_BUCKETS = ('day', 'week', 'month')
+MAX_TIMESERIES_BUCKETS = 400
+
+
+def bucket_floor(day, bucket):
+    """First day of the bucket containing day (weeks start on Monday)."""
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def bucket_starts(start, end, bucket):
+    """First day of every bucket from the one containing start up to end."""
+    starts = []
+    day = bucket_floor(start, bucket)
+    while day <= end:
+        starts.append(day)
+        if bucket == 'month':
+            day = (day + timedelta(days=32)).replace(day=1)
+        else:
+            day += timedelta(days=7 if bucket == 'week' else 1)
+    return starts
+
+
+def _grouped(queryset, field, bucket, **aggregates):
+    """Aggregate queryset per bucket of field, keyed by the bucket's first day."""
+    rows = queryset.annotate(
+        bucket=Trunc(field, bucket, output_field=DateField())
+    ).order_by().values('bucket').annotate(**aggregates)
+    return {row.pop('bucket'): row for row in rows}
+
+
+def compute_timeseries(start, end, bucket='day'):
+    """
+    Bucketed series of enrollments, completed revenue, new users, new
+    students and exam attempts between the start and end dates (inclusive).
+
+    Each metric is one grouped query. Enrollments, revenue and new students
+    are read from the daily rollup tables; new users of every role and exam
+    attempts are grouped from their own tables over the indexed timestamp
+    range. The payload is
+    array-oriented: `timestamps` holds the first day of each bucket and
+    every metric is a list aligned with it, with empty buckets as zero.
+    """
+    if bucket not in TIMESERIES_BUCKETS:
+        raise ValueError(f"bucket must be one of {', '.join(TIMESERIES_BUCKETS)}")
+    if start > end:
+        raise ValueError("start must not be after end")
+    starts = bucket_starts(start, end, bucket)
+    if len(starts) > MAX_TIMESERIES_BUCKETS:
+        raise ValueError(f"range spans more than {MAX_TIMESERIES_BUCKETS} buckets")
+
+    first = starts[0]
+    tz = timezone.get_current_timezone()
+    since = timezone.make_aware(datetime.combine(first, time.min), tz)
+    until = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min), tz)
+
+    enrollments = _grouped(
+        DailyEnrollmentStat.objects.filter(date__gte=first, date__lte=end),
+        'date', bucket, value=Sum('enrollments')
+    )
+    revenue = _grouped(
+        DailyRevenueStat.objects.filter(date__gte=first, date__lte=end),
+        'date', bucket, value=Sum('amount')
+    )
+    new_students = _grouped(
+        DailyStudentStat.objects.filter(date__gte=first, date__lte=end),
+        'date', bucket, value=Sum('new_students')
+    )
+    new_users = _grouped(
+        User.objects.filter(created_at__gte=since, created_at__lt=until),
+        'created_at', bucket, value=Count('id')
+    )
+    exam_attempts = _grouped(
+        ExamAttempt.objects.filter(started_at__gte=since, started_at__lt=until),
+        'started_at', bucket, value=Count('id')
+    )
+
+    def series(groups, cast=int):
+        return [cast(groups[day]['value'] or 0) if day in groups else cast(0) for day in starts]
+
+    return {
+        'bucket': bucket,
+        'start': first,
+        'end': end,
+        'timestamps': starts,
+        'enrollments': series(enrollments),
+        'revenue': series(revenue, float),
+        'new_users': series(new_users),
+        'new_students': series(new_students),
+        'exam_attempts': series(exam_attempts),
+    }
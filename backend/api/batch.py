@@ -0,0 +1,184 @@
+import json
+import logging
+import queue
+import threading
+from contextlib import ExitStack
+from io import BytesIO
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.urls import Resolver404, resolve
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.response import Response
+from .middleware import QueryStats
+
+# Get logger for batch requests
+logger = logging.getLogger('api.batch')
+
+# Sub-requests skip the middleware stack, so only API views may be targeted
+URL_PREFIX = '/api/'
+# Login and logout read and rotate the session, which sub-requests do not have
+EXCLUDED_PREFIXES = ('/api/auth/',)
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+ALLOWED_METHODS = SAFE_METHODS + ('POST', 'PUT', 'PATCH', 'DELETE')
+# Response headers passed through to the client
+FORWARDED_HEADERS = ('ETag', 'Last-Modified', 'Location')
+# Request headers of the batch request that must not leak into sub-requests
+_DROPPED_META = ('CONTENT_TYPE', 'CONTENT_LENGTH', 'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE',
+                 'HTTP_IF_MATCH', 'HTTP_IF_UNMODIFIED_SINCE')
+
+
+def parse_batch(payload):
+    """
+    Validate a batch payload, {"requests": [{"method", "url", "body", "id"}]}.
+    Returns the list of sub-requests; raises ValueError with a message for
+    the client otherwise.
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get('requests'), list):
+        raise ValueError('Expected {"requests": [...]}')
+    subrequests = payload['requests']
+    max_requests = getattr(settings, 'BATCH_MAX_REQUESTS', 20)
+    if not subrequests:
+        raise ValueError('requests must not be empty')
+    if len(subrequests) > max_requests:
+        raise ValueError(f'At most {max_requests} requests per batch')
+    for position, subrequest in enumerate(subrequests):
+        if not isinstance(subrequest, dict) or not isinstance(subrequest.get('url'), str) \
+                or not subrequest['url'].startswith(URL_PREFIX):
+            raise ValueError(f'requests[{position}] needs a url starting with {URL_PREFIX}')
+        if urlsplit(subrequest['url']).path.startswith(EXCLUDED_PREFIXES):
+            raise ValueError(f'requests[{position}]: {subrequest["url"]} cannot be batched; call it directly')
+        subrequest['method'] = str(subrequest.get('method', 'GET')).upper()
+        if subrequest['method'] not in ALLOWED_METHODS:
+            raise ValueError(f"requests[{position}]: method must be one of {', '.join(ALLOWED_METHODS)}")
+    return subrequests
+
+
+class BatchSubrequestAuthentication(BaseAuthentication):
+    """
+    Authenticates a batch sub-request as the user who sent the batch.
+
+    The user is attached by _build_request() to the sub-request object
+    itself, so nothing a client sends can select it. Requests that are not
+    batch sub-requests fall through to the next authenticator.
+    """
+
+    def authenticate(self, request):
+        user = getattr(request._request, 'batch_user', None)
+        if user is None:
+            return None
+        return (user, None)
+
+
+def _build_request(request, subrequest):
+    """A WSGIRequest for subrequest, authenticated as the batch request's user."""
+    url = urlsplit(subrequest['url'])
+    body = b''
+    environ = {key: value for key, value in request.META.items() if key not in _DROPPED_META}
+    if subrequest.get('body') is not None:
+        body = json.dumps(subrequest['body']).encode()
+        environ['CONTENT_TYPE'] = 'application/json'
+    environ.update({
+        'REQUEST_METHOD': subrequest['method'],
+        'PATH_INFO': url.path,
+        'QUERY_STRING': url.query,
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': BytesIO(body),
+    })
+    sub = WSGIRequest(environ)
+    # Read by BatchSubrequestAuthentication. There is no session: parse_batch()
+    # rejects the auth endpoints, whose login and logout are the views that use it
+    sub.batch_user = request.user
+    sub.user = request.user
+    sub.is_batch_subrequest = True
+    return sub
+
+
+def run_subrequest(request, subrequest):
+    """Resolve and run one sub-request; returns its entry in the batch response."""
+    result = {'status': 500, 'headers': {}, 'body': None}
+    if 'id' in subrequest:
+        result['id'] = subrequest['id']
+    sub = _build_request(request, subrequest)
+    try:
+        match = resolve(sub.path_info)
+    except Resolver404:
+        result.update(status=404, body={'detail': 'Not found.'})
+        return result
+
+    try:
+        response = match.func(sub, *match.args, **match.kwargs)
+    except Exception as e:
+        logger.error("Batch sub-request %s %s failed: %s", subrequest['method'], subrequest['url'], e)
+        result['body'] = {'error': 'Internal server error'}
+        return result
+
+    result['status'] = response.status_code
+    result['headers'] = {header: response[header] for header in FORWARDED_HEADERS if response.has_header(header)}
+    if subrequest['method'] != 'HEAD':
+        result['body'] = _response_body(response)
+    return result
+
+
+def _response_body(response):
+    if isinstance(response, Response):
+        # Not rendered yet: the batch response renders the data once
+        return response.data
+    if response.get('Content-Type', '').startswith('application/json') and not response.streaming:
+        return json.loads(response.content) if response.content else None
+    return None
+
+
+def execute_batch(request, subrequests, parallel=False):
+    """
+    Run subrequests and return their results in order.
+
+    Sub-requests skip the middleware stack: they run directly against the
+    resolved views, authenticated as the batch request's user, on the batch
+    request's database connection. With parallel=True and only read-only
+    sub-requests, up to BATCH_MAX_WORKERS threads share the work; each
+    worker opens one connection of its own and closes it when the batch is
+    done. Worker queries are counted in their own QueryStats and merged into
+    the batch request's afterwards. Batches with writes always run in order.
+    """
+    if not parallel or len(subrequests) < 2 or any(sub['method'] not in SAFE_METHODS for sub in subrequests):
+        return [run_subrequest(request, subrequest) for subrequest in subrequests]
+
+    results = [None] * len(subrequests)
+    batch_stats = getattr(request._request, 'db_stats', None)
+    worker_stats = []
+    pending = queue.SimpleQueue()
+    for position, subrequest in enumerate(subrequests):
+        pending.put((position, subrequest))
+
+    def worker():
+        # A new thread starts with empty context: its own database connection
+        # and no read-your-writes pinning, which read-only work does not need
+        stats = QueryStats(batch_stats.slow_query_limit) if batch_stats is not None else None
+        try:
+            with ExitStack() as stack:
+                if stats is not None:
+                    worker_stats.append(stats)
+                    for connection in connections.all():
+                        stack.enter_context(connection.execute_wrapper(stats))
+                while True:
+                    try:
+                        position, subrequest = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    results[position] = run_subrequest(request, subrequest)
+        finally:
+            connections.close_all()
+
+    workers = [
+        threading.Thread(target=worker, name=f'batch-worker-{number}')
+        for number in range(min(getattr(settings, 'BATCH_MAX_WORKERS', 4), len(subrequests)))
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    for stats in worker_stats:
+        batch_stats.merge(stats)
+    return results
@@ -0,0 +1,54 @@
+import logging
+import threading
+import time
+from django.core.cache import cache
+
+# Get logger for caching
+logger = logging.getLogger('api.caching')
+
+# Striped locks: bounded memory however many keys are computed
+_LOCK_STRIPES = 64
+_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+
+def _local_lock(key):
+    return _locks[hash(key) % _LOCK_STRIPES]
+
+
+def get_or_compute(key, compute, timeout, lock_timeout=10, poll_interval=0.05):
+    """
+    Return the cached value for key, computing and caching it on a miss.
+
+    Concurrent misses are coalesced so only one caller runs compute():
+    threads in this process wait on a local lock, and processes sharing the
+    cache wait for whichever one took the `<key>:lock` entry, polling until
+    the value appears. If that holder takes longer than lock_timeout
+    seconds, the waiter computes the value itself.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    with _local_lock(key):
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        lock_key = f"{key}:lock"
+        acquired = cache.add(lock_key, 1, lock_timeout)
+        if not acquired:
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(poll_interval)
+                value = cache.get(key)
+                if value is not None:
+                    return value
+            logger.warning("Timed out waiting for %s, computing it locally", key)
+
+        try:
+            value = compute()
+            cache.set(key, value, timeout)
+        finally:
+            if acquired:
+                cache.delete(lock_key)
+        return value
@@ -0,0 +1,185 @@
+import functools
+import logging
+from types import SimpleNamespace
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import serializers
+from rest_framework.fields import empty
+from rest_framework.relations import PrimaryKeyRelatedField
+
+from .models import Course, User
+from .timing import add_serializer_time
+
+# Get logger for compiled serializers
+logger = logging.getLogger('api.compiled_serializers')
+
+# Model properties the compiled path can evaluate from plain columns:
+# (model, property) -> the columns the property reads. The property itself
+# is called on a namespace holding those columns, so output stays identical.
+DERIVED_ATTRIBUTES = {
+    (User, 'full_name'): ('id', 'first_name', 'last_name'),
+    (Course, 'enrolled_students_count'): ('active_enrollment_count',),
+}
+
+
+class CompiledSerializer:
+    """
+    Read-only fast path for a ModelSerializer: rows are read with
+    values_list() and turned into dicts by a function generated once per
+    serializer class and field set, so no model instances, get_attribute()
+    walks or per-row to_representation() calls are involved.
+
+    The output is identical to serializer_class(queryset, many=True).data
+    as long as the serializer's to_representation() only adds logging, as
+    every serializer in serializers.py does. Supported fields: model columns, primary-key related
+    fields, and dotted sources through foreign keys ending in a column or
+    in one of DERIVED_ATTRIBUTES. Anything else raises TypeError when the
+    serializer is compiled.
+    """
+
+    def __init__(self, serializer_class, fields=None):
+        self.serializer_class = serializer_class
+        self.model = serializer_class.Meta.model
+        readable = [
+            field for field in serializer_class().fields.values()
+            if not field.write_only and (fields is None or field.field_name in fields)
+        ]
+        self.field_names = [field.field_name for field in readable]
+        self.lookups = []
+        self._file_fields = {}
+        lines = []
+        for position, field in enumerate(readable):
+            lines.extend(self._compile_field(position, field))
+
+        source = '\n'.join([
+            'def make_row_to_dict(converters, derived, fields):',
+            '    def row_to_dict(row):',
+            '        data = {}',
+            *('        ' + line for line in lines),
+            '        return data',
+            '    return row_to_dict',
+        ])
+        namespace = {}
+        exec(compile(source, f'<compiled {serializer_class.__name__}>', 'exec'), namespace)
+        self._make_row_to_dict = namespace['make_row_to_dict']
+        self._derived = [self._derived_getter(field) for field in readable]
+
+    def _column(self, lookup):
+        """Index of lookup in the values_list() row, adding it if needed."""
+        if lookup not in self.lookups:
+            self.lookups.append(lookup)
+        return self.lookups.index(lookup)
+
+    def _resolve(self, field):
+        """
+        Walk field's source through the model: returns the lookup prefix,
+        the model the last attribute lives on, that attribute, and the
+        lookup of the first nullable foreign key on the way (or None).
+        """
+        model, prefix, nullable = self.model, [], None
+        *relations, attr = field.source_attrs
+        for name in relations:
+            try:
+                relation = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                relation = None
+            if relation is None or not relation.many_to_one:
+                raise TypeError(f'{self.serializer_class.__name__}.{field.field_name}: '
+                                f'only foreign keys can be followed, not {model.__name__}.{name}')
+            prefix.append(name)
+            if relation.null and nullable is None:
+                nullable = '__'.join(prefix)
+            model = relation.related_model
+        return prefix, model, attr, nullable
+
+    def _compile_field(self, position, field):
+        name = repr(field.field_name)
+        if field.source == '*' or not isinstance(field, serializers.Field) \
+                or isinstance(field, (serializers.BaseSerializer, serializers.SerializerMethodField)):
+            raise TypeError(f'{self.serializer_class.__name__}.{field.field_name} cannot be compiled')
+        prefix, model, attr, nullable = self._resolve(field)
+
+        if (model, attr) in DERIVED_ATTRIBUTES:
+            columns = [self._column('__'.join(prefix + [column])) for column in DERIVED_ATTRIBUTES[model, attr]]
+            value = f"derived[{position}]({', '.join(f'row[{column}]' for column in columns)})"
+        else:
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                model_field = None
+            if model_field is None or not model_field.concrete or model_field.many_to_many:
+                raise TypeError(f'{self.serializer_class.__name__}.{field.field_name}: '
+                                f'{model.__name__}.{attr} is not a column')
+            if model_field.is_relation and not isinstance(field, PrimaryKeyRelatedField):
+                raise TypeError(f'{self.serializer_class.__name__}.{field.field_name} cannot be compiled')
+            if isinstance(model_field, models.FileField):
+                self._file_fields[position] = model_field
+            value = f'row[{self._column("__".join(prefix + [attr]))}]'
+
+        # Serializer.to_representation(): None skips the field's conversion
+        body = [
+            f'value = {value}',
+            f'data[{name}] = None if value is None else converters[{position}](value)',
+        ]
+        if nullable is None:
+            return body
+        # Following a null foreign key raises AttributeError in get_attribute()
+        missing = f'row[{self._column(nullable)}] is None'
+        if field.default is not empty:
+            fallback = [f'data[{name}] = fields[{position}].get_default()']
+        elif field.allow_null:
+            fallback = [f'data[{name}] = None']
+        else:
+            fallback = ['pass']
+        return [f'if {missing}:', *('    ' + line for line in fallback),
+                'else:', *('    ' + line for line in body)]
+
+    def _derived_getter(self, field):
+        prefix, model, attr, nullable = self._resolve(field)
+        if (model, attr) not in DERIVED_ATTRIBUTES:
+            return None
+        getter, columns = getattr(model, attr).fget, DERIVED_ATTRIBUTES[model, attr]
+        return lambda *values: getter(SimpleNamespace(**dict(zip(columns, values))))
+
+    def _converter(self, position, field):
+        """
+        The field's to_representation(), or an equivalent builtin where the
+        column already has the right type.
+        """
+        to_representation = type(field).to_representation
+        if isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None:
+            return _identity
+        if to_representation is serializers.CharField.to_representation:
+            return str
+        if to_representation is serializers.IntegerField.to_representation:
+            return int
+        model_field = self._file_fields.get(position)
+        if model_field is not None:
+            # values_list() gives the stored name; wrap it the way the model would
+            return lambda name: field.to_representation(model_field.attr_class(None, model_field, name))
+        return field.to_representation
+
+    def serialize(self, queryset, context=None):
+        """The serialized rows of queryset, in order."""
+        all_fields = self.serializer_class(context=context or {}).fields
+        fields = [all_fields[name] for name in self.field_names]
+        converters = [self._converter(position, field) for position, field in enumerate(fields)]
+        row_to_dict = self._make_row_to_dict(converters, self._derived, fields)
+        rows = queryset.values_list(*self.lookups)
+        return add_serializer_time(lambda: [row_to_dict(row) for row in rows])
+
+
+def _identity(value):
+    return value
+
+
+# Bounded: field sets come from query parameters
+@functools.lru_cache(maxsize=256)
+def _compile(serializer_class, fields):
+    logger.debug("Compiling %s for fields %s", serializer_class.__name__, fields)
+    return CompiledSerializer(serializer_class, fields)
+
+
+def compiled_serializer(serializer_class, fields=None):
+    """The CompiledSerializer for serializer_class and fields, built once."""
+    return _compile(serializer_class, tuple(fields) if fields is not None else None)
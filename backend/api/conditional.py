@@ -0,0 +1,138 @@
+import hashlib
+import logging
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+# Get logger for conditional requests
+logger = logging.getLogger('api.conditional')
+
+
+class ConditionalGetMixin:
+    """
+    Answers If-None-Match / If-Modified-Since on list and retrieve with 304,
+    before anything is serialized.
+
+    Lists are validated by one aggregate over the filtered queryset,
+    MAX(updated_at) plus COUNT(*), so edits, additions and deletions all
+    change the ETag. Lists get no Last-Modified, because a deletion does not
+    move MAX(updated_at). Details are validated by the row's updated_at,
+    which is read together with the permission-checked object.
+
+    Serializers also embed related objects (e.g. a course's teacher_name),
+    so the updated_at of every relation the queryset select_related()s is
+    folded in as well: MAX() per relation in the list aggregate, the loaded
+    objects' values for details. Views whose model, or one of whose
+    relations, has no `validator_field` behave as before.
+    """
+    validator_field = 'updated_at'
+    conditional_methods = ('GET', 'HEAD')
+
+    def has_validator_field(self, model):
+        try:
+            model._meta.get_field(self.validator_field)
+        except FieldDoesNotExist:
+            return False
+        return True
+
+    def related_validator_paths(self, queryset):
+        """
+        Lookup paths of the relations queryset select_related()s, e.g.
+        ['course', 'course__teacher'], or None when the model or one of
+        those relations has no validator_field and changes there could go
+        unnoticed.
+        """
+        if not self.has_validator_field(queryset.model):
+            return None
+        select_related = queryset.query.select_related
+        if select_related is True:
+            return None
+        paths = []
+        pending = [(queryset.model, [], select_related or {})]
+        while pending:
+            model, prefix, tree = pending.pop()
+            for name, subtree in tree.items():
+                related_model = model._meta.get_field(name).related_model
+                if not self.has_validator_field(related_model):
+                    return None
+                paths.append('__'.join(prefix + [name]))
+                pending.append((related_model, prefix + [name], subtree))
+        return sorted(paths)
+
+    def make_etag(self, request, *parts):
+        # Representations differ per user (visibility) and per renderer
+        raw = '|'.join(map(str, (
+            self.get_queryset().model._meta.label,
+            request.get_full_path(),
+            getattr(request.accepted_renderer, 'format', ''),
+            request.user.pk,
+            *parts,
+        )))
+        return f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+    def not_modified(self, request, etag, last_modified=None):
+        """
+        The 304 (or 412) answer to the request's preconditions, carrying the
+        validators, or None when the full response must be sent.
+        """
+        validators = HttpResponse()
+        validators['ETag'] = etag
+        if last_modified is not None:
+            validators['Last-Modified'] = http_date(last_modified)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified, response=validators)
+        if response is validators:
+            return None
+        logger.debug("Conditional request answered with %s: %s", response.status_code, request.path)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        if request.method not in self.conditional_methods:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        paths = self.related_validator_paths(queryset)
+        if paths is None:
+            return super().list(request, *args, **kwargs)
+        stats = queryset.order_by().aggregate(
+            last_modified=Max(self.validator_field), count=Count('pk'),
+            **{f'related_{number}': Max(f'{path}__{self.validator_field}') for number, path in enumerate(paths)}
+        )
+        etag = self.make_etag(request, 'list', *(stats[name] for name in sorted(stats)))
+        not_modified = self.not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        paths = None
+        if request.method in self.conditional_methods:
+            paths = self.related_validator_paths(self.filter_queryset(self.get_queryset()))
+        if paths is None:
+            return Response(self.get_serializer(instance).data)
+
+        # The related objects were loaded with the instance
+        timestamps = [getattr(instance, self.validator_field, None)]
+        for path in paths:
+            related = instance
+            for name in path.split('__'):
+                related = getattr(related, name) if related is not None else None
+            if related is not None:
+                timestamps.append(getattr(related, self.validator_field))
+        if timestamps[0] is None:
+            return Response(self.get_serializer(instance).data)
+
+        etag = self.make_etag(request, 'detail', instance.pk, *(value and value.isoformat() for value in timestamps))
+        last_modified = int(max(value for value in timestamps if value is not None).timestamp())
+        not_modified = self.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        response = Response(self.get_serializer(instance).data)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
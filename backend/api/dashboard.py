@@ -0,0 +1,126 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .analytics import compute_period_analytics, get_admin_stats
+from .compiled_serializers import compiled_serializer
+from .db_routers import analytics_reads
+from .models import Course, Enrollment, Exam, FeeTransaction, StudentProgress, TeacherSalary
+from .serializers import (
+    CourseSerializer, EnrollmentSerializer, ExamSerializer, FeeTransactionSerializer,
+    StudentProgressSerializer, TeacherSalarySerializer
+)
+
+# Get logger for dashboards
+logger = logging.getLogger('api.dashboard')
+
+# Sections per role: (always included, included on request via ?include=).
+# Each matches the endpoint the dashboard used to call separately.
+DASHBOARD_SECTIONS = {
+    'student': (
+        ['courses', 'enrollments', 'upcoming_exams', 'ongoing_exams'],  # my_courses, my_enrollments, ...
+        ['progress', 'transactions'],  # student-progress/my_progress, fee-transactions/my_transactions
+    ),
+    'teacher': (
+        ['courses', 'upcoming_exams', 'ongoing_exams'],
+        ['salaries'],  # teacher-salaries/my_salary
+    ),
+    'admin': (
+        ['stats', 'upcoming_exams', 'ongoing_exams'],  # admin/stats
+        ['analytics'],  # admin/analytics, last 30 days
+    ),
+}
+
+
+def _exam_sections(exams, now, context):
+    """
+    Split one query's worth of exams into the upcoming_exams and
+    ongoing_exams sections, keeping the exam ordering. Also returns when
+    the split next changes: the earliest start of an upcoming exam or end
+    of an ongoing one (None if no exam is listed).
+    """
+    exams = list(exams.filter(
+        Q(start_time__gt=now) | Q(start_time__lte=now, end_time__gte=now),
+        is_active=True,
+    ).select_related('course', 'created_by'))
+    upcoming = [exam for exam in exams if exam.start_time > now]
+    ongoing = [exam for exam in exams if exam.start_time <= now]
+    boundaries = [exam.start_time for exam in upcoming] + [exam.end_time for exam in ongoing]
+    return {
+        'upcoming_exams': ExamSerializer(upcoming, many=True, context=context).data,
+        'ongoing_exams': ExamSerializer(ongoing, many=True, context=context).data,
+    }, min(boundaries, default=None)
+
+
+def build_dashboard(user, include=(), context=None):
+    """
+    Everything a role's dashboard shows, in one dict keyed by section.
+
+    Sections share their lookups instead of repeating the role branching
+    of the separate endpoints: a student's active enrollments give the
+    course ids for the courses and exam sections, a teacher's courses give
+    the ids for the exam sections, and upcoming and ongoing exams come
+    from a single query. Optional sections are only built when named in
+    include. Lists use the compiled serializers, so the output matches
+    the endpoints the sections replace.
+
+    Returns (data, changes_at), where changes_at is when an exam next
+    moves between upcoming, ongoing and finished, or for admins when the
+    stats snapshot expires if that is sooner; the dashboard must not be
+    cached past it.
+    """
+    context = context or {}
+    always, optional = DASHBOARD_SECTIONS[user.role]
+    sections = always + [name for name in optional if name in include]
+    now = timezone.now()
+    data = {'role': user.role}
+
+    if user.role == 'student':
+        data['enrollments'] = compiled_serializer(EnrollmentSerializer).serialize(
+            Enrollment.objects.filter(student=user, is_active=True), context
+        )
+        course_ids = [enrollment['course'] for enrollment in data['enrollments']]
+        data['courses'] = compiled_serializer(CourseSerializer).serialize(
+            Course.objects.filter(pk__in=course_ids), context
+        )
+        exam_sections, changes_at = _exam_sections(Exam.objects.filter(course_id__in=course_ids), now, context)
+        data.update(exam_sections)
+        if 'progress' in sections:
+            data['progress'] = compiled_serializer(StudentProgressSerializer).serialize(
+                StudentProgress.objects.filter(student=user), context
+            )
+        if 'transactions' in sections:
+            data['transactions'] = compiled_serializer(FeeTransactionSerializer).serialize(
+                FeeTransaction.objects.filter(student=user), context
+            )
+
+    elif user.role == 'teacher':
+        data['courses'] = compiled_serializer(CourseSerializer).serialize(
+            Course.objects.filter(teacher=user), context
+        )
+        course_ids = [course['id'] for course in data['courses']]
+        exam_sections, changes_at = _exam_sections(Exam.objects.filter(course_id__in=course_ids), now, context)
+        data.update(exam_sections)
+        if 'salaries' in sections:
+            data['salaries'] = compiled_serializer(TeacherSalarySerializer).serialize(
+                TeacherSalary.objects.filter(teacher=user), context
+            )
+
+    else:
+        with analytics_reads():
+            data['stats'] = get_admin_stats()
+            if 'analytics' in sections:
+                data['analytics'] = compute_period_analytics(30)
+        exam_sections, changes_at = _exam_sections(Exam.objects.all(), now, context)
+        data.update(exam_sections)
+        # No response cache tag follows the writes behind stats and analytics,
+        # so they may lag by at most ADMIN_STATS_CACHE_TIMEOUT, as stats alone do
+        stats_expire_at = data['stats']['computed_at'] + timedelta(
+            seconds=getattr(settings, 'ADMIN_STATS_CACHE_TIMEOUT', 30)
+        )
+        changes_at = stats_expire_at if changes_at is None else min(changes_at, stats_expire_at)
+
+    logger.debug("Built %s dashboard for user %s: %s", user.role, user.pk, sections)
+    return data, changes_at
@@ -0,0 +1,93 @@
+import functools
+import logging
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+
+# Get logger for database routing
+logger = logging.getLogger('api.db_routers')
+
+ANALYTICS_DB = 'analytics'
+
+# Set while a view marked with analytics_replica runs
+_analytics_reads = ContextVar('analytics_reads', default=False)
+# Per-request routing state, reset when each request starts (see signals.py)
+_request_state = ContextVar('db_request_state', default=None)
+
+
+def start_request():
+    """Begin routing for a new request: nothing written yet."""
+    _request_state.set({'wrote': False})
+
+
+def analytics_replica_path():
+    """Filesystem path of the analytics replica, or None if none is configured."""
+    database = settings.DATABASES.get(ANALYTICS_DB)
+    return str(database['NAME']) if database else None
+
+
+def analytics_replica_ready():
+    path = analytics_replica_path()
+    # Until the first sync the file does not exist; keep reading from default
+    return path is not None and os.path.exists(path)
+
+
+@contextmanager
+def analytics_reads():
+    """Route reads inside the block to the analytics replica when it is available."""
+    token = _analytics_reads.set(True)
+    try:
+        yield
+    finally:
+        _analytics_reads.reset(token)
+
+
+def analytics_replica(view_method):
+    """Decorator for read-only reporting views: run their reads on the replica."""
+    @functools.wraps(view_method)
+    def wrapper(*args, **kwargs):
+        with analytics_reads():
+            return view_method(*args, **kwargs)
+    return wrapper
+
+
+class AnalyticsReplicaRouter:
+    """
+    Sends reads made inside analytics_reads() to the `analytics` database,
+    a periodically synced copy of default (see sync_analytics_replica).
+
+    The replica lags default, so once a request has written anything its
+    remaining reads are pinned to default (read-your-writes). Everything
+    else, and every write, goes to default.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _analytics_reads.get():
+            return None
+        state = _request_state.get()
+        if state is not None and state['wrote']:
+            return None
+        if not analytics_replica_ready():
+            return None
+        return ANALYTICS_DB
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None and not state['wrote']:
+            logger.debug("Pinning request reads to default after a write to %s", model._meta.label)
+            state['wrote'] = True
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        databases = {'default', ANALYTICS_DB}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema from the backup copy
+        if db == ANALYTICS_DB:
+            return False
+        return None
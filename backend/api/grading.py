@@ -0,0 +1,219 @@
+import logging
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Question, QuestionOption, Exam, ExamAttempt, Answer
+
+# Get logger for grading
+logger = logging.getLogger('api.grading')
+
+# Answer keys are versioned in the database, so they can live for a long time
+ANSWER_KEY_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def answer_key_cache_key(exam_id, version):
+    return f"exam:{exam_id}:answer_key:{version}"
+
+
+def build_answer_key(exam_id):
+    """
+    Load an exam's questions and options into an in-memory answer key.
+
+    Returns a dict mapping question id to a tuple of
+    (question_type, marks, correct option ids, all option ids).
+    Costs two queries regardless of the number of questions.
+    """
+    logger.debug("Building answer key for exam_id=%s", exam_id)
+    questions = list(Question.objects.filter(exam_id=exam_id).values_list('id', 'question_type', 'marks'))
+    correct = {}
+    options = {}
+    for question_id, question_type, marks in questions:
+        correct[question_id] = set()
+        options[question_id] = set()
+
+    option_rows = QuestionOption.objects.filter(
+        question__exam_id=exam_id
+    ).values_list('id', 'question_id', 'is_correct')
+    for option_id, question_id, is_correct in option_rows:
+        options[question_id].add(option_id)
+        if is_correct:
+            correct[question_id].add(option_id)
+
+    return {
+        question_id: (question_type, marks, frozenset(correct[question_id]), frozenset(options[question_id]))
+        for question_id, question_type, marks in questions
+    }
+
+
+def get_answer_key(exam_id):
+    """
+    Return the answer key for an exam, building and caching it on a miss.
+
+    Cached keys are stored under the exam's answer_key_version, which is
+    read from the database on every call. The Question/QuestionOption
+    signal handlers bump it, so every process stops using an outdated key
+    as soon as the change commits, whatever the cache backend.
+    """
+    version = Exam.objects.filter(pk=exam_id).values_list('answer_key_version', flat=True).first()
+    cache_key = answer_key_cache_key(exam_id, version)
+    answer_key = cache.get(cache_key)
+    if answer_key is None:
+        answer_key = build_answer_key(exam_id)
+        cache.set(cache_key, answer_key, ANSWER_KEY_CACHE_TIMEOUT)
+    return answer_key
+
+
+def invalidate_answer_key(exam_id):
+    """
+    Bump the exam's answer key version in the current transaction, so the
+    new version becomes visible together with the question change. Keys
+    cached under older versions are no longer read and age out.
+    """
+    logger.debug("Invalidating answer key for exam_id=%s", exam_id)
+    Exam.objects.filter(pk=exam_id).update(answer_key_version=F('answer_key_version') + 1)
+
+
+def _mark(entry, selected_option_id):
+    """Return (marks obtained, is correct) for a selected option."""
+    question_type, marks, correct_ids, option_ids = entry
+    # Only multiple choice questions are graded automatically
+    if question_type == 'multiple_choice' and selected_option_id in correct_ids:
+        return marks, True
+    return 0, False
+
+
+def _to_id(value, label):
+    """Coerce an id from the request payload to an int."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {label}: {value!r}")
+
+
+def score_answers(attempt, answers_data, answer_key):
+    """
+    Score a submission payload against an answer key in a single pass.
+
+    Returns a tuple of (unsaved Answer instances, total score). Raises
+    ValueError when the payload references questions or options that do
+    not belong to the exam. If a question is answered more than once the
+    last answer wins.
+    """
+    answers = {}
+    total_score = 0
+    if not isinstance(answers_data, list):
+        raise ValueError('answers must be a list')
+    for answer_data in answers_data:
+        if not isinstance(answer_data, dict):
+            raise ValueError(f"Invalid answer: {answer_data!r}")
+        question_id = _to_id(answer_data.get('question_id'), 'question_id')
+        selected_option_id = answer_data.get('selected_option_id')
+        text_answer = answer_data.get('text_answer', '')
+
+        if question_id not in answer_key:
+            raise ValueError(f"Question {question_id} does not belong to this exam")
+        option_ids = answer_key[question_id][3]
+
+        answer = Answer(
+            exam_attempt=attempt,
+            question_id=question_id,
+            text_answer=text_answer
+        )
+
+        if selected_option_id:
+            selected_option_id = _to_id(selected_option_id, 'selected_option_id')
+            if selected_option_id not in option_ids:
+                raise ValueError(f"Option {selected_option_id} does not belong to question {question_id}")
+            answer.selected_option_id = selected_option_id
+            answer.marks_obtained, answer.is_correct = _mark(answer_key[question_id], selected_option_id)
+
+        if question_id in answers:
+            total_score -= answers[question_id].marks_obtained
+        answers[question_id] = answer
+        total_score += answer.marks_obtained
+
+    return list(answers.values()), total_score
+
+
+def grade_submission(attempt, answers_data):
+    """
+    Grade and persist a full exam submission.
+
+    The answer key comes from the cache, every Answer row is written with a
+    single bulk_create and the ExamAttempt is updated in the same
+    transaction, so the query count does not grow with the exam size.
+    """
+    exam = attempt.exam
+    answer_key = get_answer_key(exam.id)
+    answers, total_score = score_answers(attempt, answers_data, answer_key)
+
+    with transaction.atomic():
+        # Lock the attempt so concurrent submissions cannot both be graded
+        locked = ExamAttempt.objects.select_for_update().only('completed_at').get(pk=attempt.pk)
+        if locked.completed_at:
+            raise ValueError('Exam already submitted')
+
+        Answer.objects.bulk_create(answers)
+
+        attempt.completed_at = timezone.now()
+        attempt.score = total_score
+        attempt.is_passed = total_score >= exam.passing_marks
+        attempt.status = 'completed'
+        attempt.save()
+
+    logger.info("Graded attempt_id=%s: %s answers, score=%s, passed=%s", attempt.id, len(answers), total_score, attempt.is_passed)
+    return attempt
+
+
+def regrade_exam(exam):
+    """
+    Re-score every completed attempt of an exam against its current key.
+
+    Used after a teacher corrects a question or option. Stored answers are
+    read in one query and only the rows whose marks changed are written.
+    Returns the number of attempts whose score changed.
+    """
+    answer_key = get_answer_key(exam.id)
+    attempts = {
+        attempt.id: attempt
+        for attempt in ExamAttempt.objects.filter(exam=exam, status='completed').only(
+            'id', 'score', 'is_passed', 'status'
+        )
+    }
+    scores = dict.fromkeys(attempts, 0)
+    changed_answers = []
+
+    answers = Answer.objects.filter(exam_attempt__in=attempts.keys()).only(
+        'id', 'exam_attempt_id', 'question_id', 'selected_option_id', 'marks_obtained', 'is_correct'
+    )
+    for answer in answers:
+        entry = answer_key.get(answer.question_id)
+        if entry is None or entry[0] != 'multiple_choice':
+            # Keep marks on questions that are not graded automatically
+            scores[answer.exam_attempt_id] += answer.marks_obtained
+            continue
+        marks, is_correct = _mark(entry, answer.selected_option_id)
+        scores[answer.exam_attempt_id] += marks
+        if (marks, is_correct) != (answer.marks_obtained, answer.is_correct):
+            answer.marks_obtained, answer.is_correct = marks, is_correct
+            changed_answers.append(answer)
+
+    changed_attempts = []
+    now = timezone.now()
+    for attempt_id, score in scores.items():
+        attempt = attempts[attempt_id]
+        if attempt.score != score:
+            attempt.score = score
+            attempt.is_passed = score >= exam.passing_marks
+            # bulk_update() skips auto_now; conditional GETs validate on updated_at
+            attempt.updated_at = now
+            changed_attempts.append(attempt)
+
+    with transaction.atomic():
+        Answer.objects.bulk_update(changed_answers, ['marks_obtained', 'is_correct'])
+        ExamAttempt.objects.bulk_update(changed_attempts, ['score', 'is_passed', 'updated_at'])
+
+    logger.info("Regraded exam_id=%s: %s of %s attempts changed", exam.id, len(changed_attempts), len(attempts))
+    return len(changed_attempts)
@@ -0,0 +1,219 @@
+import atexit
+import copy
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from collections import Counter
+
+
+def _get_handler_by_name(name):
+    # logging.getHandlerByName() only exists on Python 3.12+
+    get_handler = getattr(logging, 'getHandlerByName', None)
+    if get_handler is not None:
+        return get_handler(name)
+    return logging._handlers.get(name)
+
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that does not flush after every record.
+
+    Meant to sit behind an AsyncQueueHandler, whose listener writes a whole
+    batch of records and then calls flush_batch() once.
+    """
+
+    def flush(self):
+        # StreamHandler.emit() flushes after each record; defer to the batch
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    Non-blocking logging handler.
+
+    Request threads only put records on a bounded queue; a background thread
+    drains it in batches and hands them to the target handlers named in
+    `handlers`. Those must be configured earlier in LOGGING; dictConfig
+    builds handlers in sorted name order, so give this handler a name that
+    sorts after its targets (e.g. "queue_api"). Configure it with a '()'
+    factory rather than 'class': for QueueHandler classes, dictConfig on
+    Python 3.12+ builds the queue itself and passes it in place of
+    `handlers`. When the queue is more than
+    `debug_headroom` full, DEBUG records are dropped so INFO and above still
+    fit; when it is completely full every new record is dropped. Dropped
+    records are counted per level and reported through the targets.
+    """
+
+    def __init__(self, handlers, maxsize=10000, batch_size=500, debug_headroom=0.2):
+        super().__init__(queue.Queue(maxsize))
+        # Hold strong references: logging only keeps weak ones by name
+        self.targets = []
+        for name in handlers:
+            handler = _get_handler_by_name(name)
+            if handler is None:
+                raise ValueError(f"Log handler {name!r} is not configured yet")
+            self.targets.append(handler)
+        self.batch_size = batch_size
+        self.debug_limit = int(maxsize * (1 - debug_headroom))
+        self.dropped = Counter()
+        self._reported_drops = Counter()
+        # Not self.lock: logging.shutdown() holds that while close() joins the writer
+        self._drop_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        self._atexit_registered = False
+        self._start_lock = threading.Lock()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        # The writer thread does not survive a fork (e.g. preforking servers);
+        # start over with a fresh queue and let the next record restart it
+        self.queue = queue.Queue(self.queue.maxsize)
+        self._thread = None
+        self._stopped = False
+        self._start_lock = threading.Lock()
+        self._drop_lock = threading.Lock()
+
+    def emit(self, record):
+        if self._thread is None and not self.start():
+            # Stopped (close() or interpreter exit): nothing drains the queue
+            # any more, so write the record straight through
+            try:
+                self._write([self.prepare(record)])
+            except Exception:
+                self.handleError(record)
+            return
+        super().emit(record)
+
+    def prepare(self, record):
+        """
+        Merge the message arguments and render any traceback, leaving full
+        formatting (timestamps, layout) to the target handlers.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks have to be rendered while the frames still exist
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        if record.levelno <= logging.DEBUG and self.queue.qsize() >= self.debug_limit:
+            self._count_drop(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._count_drop(record)
+
+    def _count_drop(self, record):
+        # Request threads and the writer's drop report share the counter
+        with self._drop_lock:
+            self.dropped[record.levelname] += 1
+
+    def start(self):
+        """Start the background thread; return False once the handler is stopped."""
+        with self._start_lock:
+            if self._stopped:
+                return False
+            if self._thread is not None:
+                return True
+            self._thread = threading.Thread(target=self._monitor, name='log-writer', daemon=True)
+            self._thread.start()
+            # The registration survives a fork, so children must not repeat it
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+            return True
+
+    def stop(self):
+        """Flush everything still queued and stop the background thread for good."""
+        with self._start_lock:
+            self._stopped = True
+            thread = self._thread
+            if thread is None:
+                return
+            # Blocking put: the sentinel must not be dropped
+            self.queue.put(None)
+            thread.join()
+            self._thread = None
+
+        # Records enqueued by emit() calls that raced with the sentinel
+        leftovers = []
+        while True:
+            try:
+                leftovers.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if leftovers:
+            self._write(leftovers)
+
+    def close(self):
+        self.stop()
+        super().close()
+
+    def _monitor(self):
+        while True:
+            record = self.queue.get()
+            batch = []
+            stopping = record is None
+            if not stopping:
+                batch.append(record)
+            while len(batch) < self.batch_size:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            self._write(batch)
+            if stopping:
+                return
+
+    def _write(self, batch):
+        drop_record = self._drop_report()
+        if drop_record is not None:
+            batch.append(drop_record)
+
+        for handler in self.targets:
+            try:
+                for record in batch:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+                getattr(handler, 'flush_batch', handler.flush)()
+            except Exception:
+                # Never let a broken handler kill the writer thread
+                sys.stderr.write(f"AsyncQueueHandler failed writing to {handler!r}\n")
+
+    def _drop_report(self):
+        """Build a WARNING record for drops since the last report, if any."""
+        with self._drop_lock:
+            dropped = self.dropped.copy()
+        new_drops = dropped - self._reported_drops
+        if not new_drops:
+            return None
+        self._reported_drops = dropped
+        details = ', '.join(f"{level}: {count}" for level, count in sorted(new_drops.items()))
+        return logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'funcName': 'enqueue',
+            'msg': f"Log queue full, dropped {sum(new_drops.values())} records ({details})",
+        })
@@ -0,0 +1,76 @@
+import logging
+import time
+from decimal import Decimal
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from api.compiled_serializers import compiled_serializer
+from api.models import Course, Enrollment, User
+from api.serializers import EnrollmentSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compare EnrollmentSerializer list serialization with the compiled values() path'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=5000,
+            help='Number of enrollments serialized per run'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per path; the fastest one is reported'
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+
+        # Scratch rows, rolled back at the end
+        with transaction.atomic():
+            teacher = User.objects.create(username='benchmark-teacher', role='teacher', first_name='Ada')
+            course = Course.objects.create(title='Benchmark', description='', teacher=teacher, fee=Decimal('10.00'))
+            students = User.objects.bulk_create(
+                User(username=f'benchmark-student-{i}', role='student', first_name='Student', last_name=str(i))
+                for i in range(rows)
+            )
+            Enrollment.objects.bulk_create(Enrollment(student=student, course=course) for student in students)
+            queryset = Enrollment.objects.filter(course=course)
+
+            # Per-row debug logging would be measured too; keep both paths at INFO
+            logging.disable(logging.DEBUG)
+            try:
+                expected = EnrollmentSerializer(EnrollmentSerializer.setup_eager_loading(queryset), many=True).data
+                if JSONRenderer().render(compiled_serializer(EnrollmentSerializer).serialize(queryset)) \
+                        != JSONRenderer().render(expected):
+                    raise CommandError('Compiled output differs from EnrollmentSerializer output')
+
+                results = {
+                    'serializer': min(self.time_serializer(queryset) for _ in range(repeat)),
+                    'compiled': min(self.time_compiled(queryset) for _ in range(repeat)),
+                }
+            finally:
+                logging.disable(logging.NOTSET)
+                transaction.set_rollback(True)
+
+        for name, elapsed in results.items():
+            self.stdout.write(
+                f"{name:<10}  {rows} rows in {elapsed * 1000:8.2f}ms  ({elapsed / rows * 1e6:6.2f}us/row)"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Compiled serializer benchmark complete: {results['serializer'] / results['compiled']:.1f}x faster"
+        ))
+
+    def time_serializer(self, queryset):
+        start = time.perf_counter()
+        EnrollmentSerializer(EnrollmentSerializer.setup_eager_loading(queryset.all()), many=True).data
+        return time.perf_counter() - start
+
+    def time_compiled(self, queryset):
+        start = time.perf_counter()
+        compiled_serializer(EnrollmentSerializer).serialize(queryset.all())
+        return time.perf_counter() - start
@@ -0,0 +1,89 @@
+import logging
+import time
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from api.models import Course, FeeTransaction, User
+from api.renderers import FastJSONParser, FastJSONRenderer, orjson
+from api.serializers import FeeTransactionSerializer
+
+
+class Command(BaseCommand):
+    help = 'Measure JSON rendering and parsing of a FeeTransactionSerializer payload, stock vs orjson'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=10000,
+            help='Number of fee transactions in the payload'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per renderer; the fastest one is reported'
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+        if orjson is None:
+            raise CommandError('orjson is not installed; FastJSONRenderer would only measure the stock encoder')
+
+        # Unsaved instances keep the database out of the measurement
+        student = User(id=1, username='student', first_name='Grace', last_name='Hopper', role='student')
+        course = Course(id=1, title='Data Structures', teacher_id=2, fee=Decimal('499.00'))
+        now = timezone.now()
+        transactions = [
+            FeeTransaction(
+                id=i,
+                student=student,
+                course=course,
+                transaction_type='payment',
+                amount=Decimal('499.00') + i,
+                payment_status='completed',
+                transaction_date=now - timedelta(minutes=i),
+                description=f'Installment {i} – semester fee',
+            )
+            for i in range(1, rows + 1)
+        ]
+        # Serializer debug logging would dominate the setup, not the measurement
+        logging.disable(logging.DEBUG)
+        try:
+            data = FeeTransactionSerializer(transactions, many=True).data
+        finally:
+            logging.disable(logging.NOTSET)
+
+        stock, fast = JSONRenderer(), FastJSONRenderer()
+        expected = stock.render(data)
+        if fast.render(data) != expected:
+            raise CommandError('FastJSONRenderer output differs from JSONRenderer output')
+
+        self.stdout.write(f'Payload: {rows} rows, {len(expected) / 1024:.0f}KB')
+        results = {}
+        for name, renderer in (('stock', stock), ('orjson', fast)):
+            results[name] = min(self.time_render(renderer, data) for _ in range(repeat))
+            self.stdout.write(f'render  {name:<6}  {results[name] * 1000:8.2f}ms')
+        for name, parser in (('stock', JSONParser()), ('orjson', FastJSONParser())):
+            best = min(self.time_parse(parser, expected) for _ in range(repeat))
+            self.stdout.write(f'parse   {name:<6}  {best * 1000:8.2f}ms')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Renderer benchmark complete: orjson renders {results['stock'] / results['orjson']:.1f}x faster"
+        ))
+
+    def time_render(self, renderer, data):
+        start = time.perf_counter()
+        renderer.render(data)
+        return time.perf_counter() - start
+
+    def time_parse(self, parser, content):
+        stream = BytesIO(content)
+        start = time.perf_counter()
+        parser.parse(stream, 'application/json', {'encoding': 'utf-8'})
+        return time.perf_counter() - start
@@ -0,0 +1,186 @@
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory, override_settings
+from django.urls import path
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class PingView(APIView):
+    """Cheapest possible API view, so the middleware dominates the timing."""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response({'ok': True})
+
+
+# Requests built by this command resolve against this module
+urlpatterns = [
+    path('api/ping/', PingView.as_view(), name='benchmark-ping'),
+]
+
+# Run in a checkout of --compare-ref: measures that tree's MIDDLEWARE with this
+# file's code, so both sides are timed the same way
+COMPARE_SCRIPT = '''
+import importlib.util, json, os, sys
+import django
+sys.path.insert(0, os.getcwd())
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'eduportal.settings')
+django.setup()
+spec = importlib.util.spec_from_file_location('benchmark_middleware', sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+print(json.dumps(module.Command().measure(json.loads(sys.argv[2]))))
+'''
+
+
+class Command(BaseCommand):
+    help = 'Measure the per-request overhead of the logging/observability middleware'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=2000,
+            help='Requests per run'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per stack; the fastest one is reported'
+        )
+        parser.add_argument(
+            '--without',
+            action='append',
+            help='Middleware to leave out of the baseline stack (repeatable). '
+                 'Defaults to every api.middleware entry in MIDDLEWARE'
+        )
+        parser.add_argument(
+            '--compare-ref',
+            type=str,
+            help='Also measure the stack of this git commit, checked out into a temporary worktree '
+                 '(e.g. the commit before ObservabilityMiddleware)'
+        )
+        parser.add_argument(
+            '--mode',
+            type=str,
+            default='structured',
+            choices=['structured', 'verbose'],
+            help='REQUEST_LOG_MODE used while measuring'
+        )
+        parser.add_argument(
+            '--session',
+            action='store_true',
+            help='Send an anonymous session cookie, so loading the user costs a query'
+        )
+
+    def handle(self, *args, **options):
+        count = options['requests']
+        results = {'current tree': self.measure(options)}
+        if options['compare_ref']:
+            results[options['compare_ref']] = self.measure_at_ref(options['compare_ref'], options)
+
+        for label, (without, baseline, stack) in results.items():
+            self.stdout.write(f"{label}:")
+            self.stdout.write(f"  baseline (without {', '.join(without)}): {baseline / count * 1e6:8.1f}us/request")
+            self.stdout.write(f"  full stack: {stack / count * 1e6:8.1f}us/request")
+            self.stdout.write(self.style.SUCCESS(f"  Middleware overhead: {(stack - baseline) / count * 1e6:.1f}us/request"))
+
+    def measure(self, options):
+        """Best times of the configured MIDDLEWARE with and without options['without']."""
+        full = list(settings.MIDDLEWARE)
+        without = options['without'] or [name for name in full if name.startswith('api.middleware.')]
+        stacks = {'baseline': [name for name in full if name not in without], 'full': full}
+
+        cookies = {}
+        session = None
+        if options['session']:
+            session = SessionStore()
+            session.create()
+            cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+        try:
+            with override_settings(REQUEST_LOG_MODE=options['mode']):
+                handlers = {label: self.build_handler(middleware) for label, middleware in stacks.items()}
+
+            best = dict.fromkeys(handlers, float('inf'))
+            for _ in range(options['repeat']):
+                # Alternate stacks so drift affects both equally
+                for label, handler in handlers.items():
+                    best[label] = min(best[label], self.time_run(handler, options['requests'], cookies))
+        finally:
+            if session is not None:
+                session.delete()
+        return without, best['baseline'], best['full']
+
+    def measure_at_ref(self, ref, options):
+        """measure() run in a temporary git worktree of ref, in a separate process."""
+        backend = os.path.abspath(settings.BASE_DIR)
+        try:
+            root = subprocess.run(
+                ['git', 'rev-parse', '--show-toplevel'], cwd=backend, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise CommandError(f'--compare-ref needs a git checkout: {e}')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            worktree = os.path.join(tmp, 'tree')
+            try:
+                subprocess.run(['git', 'worktree', 'add', '--detach', worktree, ref],
+                               cwd=root, capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError as e:
+                raise CommandError(f'Cannot check out {ref}: {e.stderr.strip()}')
+            try:
+                child_options = {key: options[key] for key in ('requests', 'repeat', 'without', 'mode', 'session')}
+                result = subprocess.run(
+                    [sys.executable, '-c', COMPARE_SCRIPT, os.path.abspath(__file__), json.dumps(child_options)],
+                    cwd=os.path.join(worktree, os.path.relpath(backend, root)),
+                    capture_output=True, text=True,
+                )
+                if result.returncode:
+                    raise CommandError(f'Measuring {ref} failed:\n{result.stderr}')
+                return json.loads(result.stdout.splitlines()[-1])
+            finally:
+                subprocess.run(['git', 'worktree', 'remove', '--force', worktree], cwd=root, capture_output=True)
+
+    def build_handler(self, middleware):
+        with override_settings(MIDDLEWARE=middleware):
+            handler = BaseHandler()
+            handler.load_middleware()
+        return handler
+
+    def time_run(self, handler, count, cookies):
+        # Any concrete allowed host, so CommonMiddleware accepts the requests
+        host = next((host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')), 'localhost')
+        factory = RequestFactory(HTTP_HOST=host)
+        for name, value in cookies.items():
+            factory.cookies[name] = value
+        requests = []
+        for _ in range(count):
+            request = factory.get('/api/ping/')
+            request.urlconf = __name__
+            requests.append(request)
+
+        # Like timeit, keep garbage collection out of the measurement
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for request in requests:
+                handler.get_response(request)
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
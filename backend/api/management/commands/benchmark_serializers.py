@@ -0,0 +1,86 @@
+import logging
+import time
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from api.models import Course, User
+from api.serializers import CourseSerializer
+
+# Loggers hit while serializing a course
+BENCHMARK_LOGGERS = ['api.models', 'api.serializers']
+
+
+class DiscardHandler(logging.Handler):
+    """Format every record like a real handler would, then throw it away."""
+
+    def emit(self, record):
+        self.format(record)
+
+
+class Command(BaseCommand):
+    help = 'Measure CourseSerializer throughput with api logging off, at INFO and at DEBUG'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='Number of courses serialized per run'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per level; the fastest one is reported'
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+
+        # Unsaved instances keep the database out of the measurement
+        teacher = User(id=1, username='teacher', first_name='Ada', last_name='Lovelace', role='teacher')
+        courses = [
+            Course(
+                id=i,
+                title=f'Course {i}',
+                description='Description ' * 20,
+                teacher=teacher,
+                fee=Decimal('499.00'),
+                syllabus='Syllabus ' * 20,
+                prerequisites='None',
+            )
+            for i in range(1, rows + 1)
+        ]
+
+        handler = DiscardHandler()
+        handler.setFormatter(logging.Formatter('[{asctime}] {levelname} {name} {funcName}:{lineno} - {message}', style='{'))
+        loggers = [logging.getLogger(name) for name in BENCHMARK_LOGGERS]
+        saved = [(logger.level, logger.handlers, logger.propagate) for logger in loggers]
+
+        try:
+            for logger in loggers:
+                logger.handlers = [handler]
+                logger.propagate = False
+
+            # OFF is the floor: every call, including the INFO ones, is filtered out
+            for label, level in (('OFF', logging.CRITICAL + 1), ('INFO', logging.INFO), ('DEBUG', logging.DEBUG)):
+                for logger in loggers:
+                    logger.setLevel(level)
+
+                best = min(self.time_run(courses) for _ in range(repeat))
+                self.stdout.write(
+                    f"{label:<5}  {rows} rows in {best * 1000:8.2f}ms  "
+                    f"({rows / best:10.0f} rows/s)"
+                )
+        finally:
+            for logger, (level, handlers, propagate) in zip(loggers, saved):
+                logger.setLevel(level)
+                logger.handlers = handlers
+                logger.propagate = propagate
+
+        self.stdout.write(self.style.SUCCESS('Serializer benchmark complete'))
+
+    def time_run(self, courses):
+        start = time.perf_counter()
+        CourseSerializer(courses, many=True).data
+        return time.perf_counter() - start
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import threading
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections, transaction
+
+# Each profile runs against its own scratch database; journal_mode=WAL is
+# persistent, so the profiles must not share a file
+PROFILES = {
+    'stock': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'OPTIONS': {},
+    },
+    'production': {
+        'ENGINE': 'eduportal.sqlite_backend',
+        'OPTIONS': {
+            'init_command': ';'.join(settings.SQLITE_PRODUCTION_PRAGMAS),
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+}
+
+
+class Command(BaseCommand):
+    help = 'Run N parallel writers against scratch SQLite databases and report lock errors and throughput per profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--writers',
+            type=int,
+            default=8,
+            help='Parallel writer threads, each with its own connection'
+        )
+        parser.add_argument(
+            '--transactions',
+            type=int,
+            default=200,
+            help='Write transactions per writer'
+        )
+        parser.add_argument(
+            '--profile',
+            action='append',
+            choices=list(PROFILES),
+            help='Profile to measure (repeatable). Defaults to all of them'
+        )
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in options['profile'] or list(PROFILES):
+                alias = f'benchmark_{name}'
+                path = os.path.join(directory, f'{name}.sqlite3')
+                # configure_settings fills in the defaults Django expects
+                connections.settings[alias] = connections.configure_settings({
+                    'default': {**PROFILES[name], 'NAME': path},
+                })['default']
+                try:
+                    self.setup(alias)
+                    elapsed, committed, errors = self.run(alias, options['writers'], options['transactions'])
+                finally:
+                    connections[alias].close()
+                    del connections.settings[alias]
+                self.stdout.write(
+                    f"{name:>10}: {committed / elapsed:8.1f} commits/s, "
+                    f"{committed} committed, {errors} lock errors in {elapsed:.2f}s"
+                )
+
+    def setup(self, alias):
+        with connections[alias].cursor() as cursor:
+            cursor.execute('CREATE TABLE enrollment (id INTEGER PRIMARY KEY, writer INTEGER, n INTEGER)')
+            cursor.execute('CREATE TABLE course (id INTEGER PRIMARY KEY, enrollments INTEGER NOT NULL)')
+            cursor.execute('INSERT INTO course (id, enrollments) VALUES (1, 0)')
+
+    def run(self, alias, writers, transactions):
+        results = []
+        barrier = threading.Barrier(writers + 1)
+
+        def writer(number):
+            committed = errors = 0
+            barrier.wait()
+            try:
+                for n in range(transactions):
+                    try:
+                        # The shape of an enrollment: read, insert, bump a counter
+                        with transaction.atomic(using=alias):
+                            with connections[alias].cursor() as cursor:
+                                cursor.execute('SELECT enrollments FROM course WHERE id = 1')
+                                cursor.fetchone()
+                                cursor.execute('INSERT INTO enrollment (writer, n) VALUES (%s, %s)', [number, n])
+                                cursor.execute('UPDATE course SET enrollments = enrollments + 1 WHERE id = 1')
+                        committed += 1
+                    except OperationalError:
+                        errors += 1
+            finally:
+                connections[alias].close()
+                results.append((committed, errors))
+
+        threads = [threading.Thread(target=writer, args=(number,)) for number in range(writers)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        return elapsed, sum(c for c, _ in results), sum(e for _, e in results)
@@ -0,0 +1,69 @@
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from api.models import Course, Enrollment, Exam, FeeTransaction, StudentProgress, StudyMaterial
+
+# A plan step that reads a whole table, e.g. "SCAN enrollments" but not
+# "SCAN enrollments USING INDEX ..." or "SEARCH enrollments ..."
+TABLE_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+def hot_queries():
+    """The filters the API runs on every dashboard load, keyed by a label."""
+    now = timezone.now()
+    enrolled_courses = Course.objects.filter(enrollments__student=1, enrollments__is_active=True)
+    return {
+        'active enrollments of a student': Enrollment.objects.filter(student=1, is_active=True),
+        'active enrollments of a course': Enrollment.objects.filter(course=1, is_active=True),
+        'upcoming exams of enrolled courses': Exam.objects.filter(
+            course__in=enrolled_courses, is_active=True, start_time__gt=now
+        ),
+        'ongoing exams of enrolled courses': Exam.objects.filter(
+            course__in=enrolled_courses, is_active=True, start_time__lte=now, end_time__gte=now
+        ),
+        'ongoing exams (admin)': Exam.objects.filter(is_active=True, start_time__lte=now, end_time__gte=now),
+        'completed revenue this month': FeeTransaction.objects.filter(
+            payment_status='completed', transaction_date__gte=now.replace(day=1)
+        ),
+        'pending payments': FeeTransaction.objects.filter(payment_status='pending'),
+        'course progress by week': StudentProgress.objects.filter(course=1, week_number=1),
+        'public materials of a course': StudyMaterial.objects.filter(course=1, is_public=True),
+        'public materials': StudyMaterial.objects.filter(is_public=True),
+    }
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the hot API queries and fail if any of them falls back to a full table scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verbose-plans',
+            action='store_true',
+            help='Print the full plan of every query',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError(f'Plan checks are written for SQLite, not {connection.vendor}')
+
+        failures = []
+        for label, queryset in hot_queries().items():
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+                steps = [row[-1] for row in cursor.fetchall()]
+
+            scans = [step for step in steps if TABLE_SCAN.match(step)]
+            if scans:
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f'{label}: {"; ".join(scans)}'))
+            else:
+                self.stdout.write(f'{label}: ok')
+            if options['verbose_plans'] or scans:
+                for step in steps:
+                    self.stdout.write(f'    {step}')
+
+        if failures:
+            raise CommandError(f'{len(failures)} hot queries scan a whole table: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('All hot queries use an index'))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from api.models import Course
+from api.response_cache import response_cache
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized enrollment and rating counters on every course'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--course',
+            type=int,
+            action='append',
+            help='Only rebuild the given course id (can be repeated)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Course.objects.all()
+        if options['course']:
+            queryset = queryset.filter(pk__in=options['course'])
+
+        updated = Course.rebuild_enrollment_counters(queryset)
+        if updated:
+            # The UPDATE sends no signals; drop the cached course lists here
+            response_cache.invalidate('courses')
+        self.stdout.write(
+            self.style.SUCCESS(f'Repaired drifted enrollment counters on {updated} courses')
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.models import DailyEnrollmentStat, DailyRevenueStat, DailyStudentStat
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily enrollment, revenue and new student rollup tables from raw history'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            enrollments = DailyEnrollmentStat.rebuild()
+            revenue = DailyRevenueStat.rebuild()
+            students = DailyStudentStat.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Rebuilt {enrollments} enrollment, {revenue} revenue and {students} new student rollup rows'
+            )
+        )
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from api.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index over courses and study materials'
+
+    def handle(self, *args, **options):
+        documents = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {documents} documents'))
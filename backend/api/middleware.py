@@ -1,11 +1,25 @@
+import heapq
 import logging
+import random
+import re
+import threading
 import time
 import json
+from collections import Counter, defaultdict, deque
+from contextlib import ExitStack
+from django.conf import settings
+from django.db import connections
 from django.utils.deprecation import MiddlewareMixin
 from django.http import JsonResponse
+from django.utils.functional import SimpleLazyObject, empty
+from .timing import RequestTimings, current_timings
 
 # Get logger for middleware
 logger = logging.getLogger('api.middleware')
+# One JSON line per request in structured mode
+request_logger = logging.getLogger('api.requests')
+
+KNOWN_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH', 'DELETE'))
 
 
 def safe_serialize_headers(headers):
@@ -25,23 +39,299 @@ def safe_serialize_headers(headers):
     return safe_headers
 
 
-class RequestLoggingMiddleware(MiddlewareMixin):
+def get_loaded_user_id(request):
     """
-    Middleware to log all HTTP requests and responses.
+    Return the id of the request's user without triggering a session or
+    user lookup: None unless authentication already resolved a user.
     """
-    
-    def process_request(self, request):
-        """Log incoming request details."""
-        request.start_time = time.time()
+    user = getattr(request, 'user', None)
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return None
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+_SQL_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*%s\s*,?)+\)", re.IGNORECASE)
+_SQL_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def fingerprint_sql(sql):
+    """
+    Normalize a SQL statement so repeated queries that only differ in
+    literal values or IN-list length map to the same fingerprint.
+    """
+    sql = _SQL_IN_LIST_RE.sub('IN (...)', sql)
+    sql = _SQL_LITERAL_RE.sub('?', sql)
+    return ' '.join(sql.split())
+
+
+class QueryStats:
+    """
+    Per-request database statistics, collected by installing an instance as
+    a connection execute wrapper. Does not rely on DEBUG query capture.
+    """
+
+    def __init__(self, slow_query_limit=5):
+        self.count = 0
+        self.time = 0.0
+        self.slow_query_limit = slow_query_limit
+        # ORM SQL is already parameterized, so counting raw statements is
+        # cheap; fingerprinting happens once per distinct statement later
+        self._statements = Counter()
+        self._slowest = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, time.perf_counter() - start)
+
+    def record(self, sql, duration):
+        self.count += 1
+        self.time += duration
+        self._statements[sql] += 1
+        entry = (duration, self.count, sql)
+        if len(self._slowest) < self.slow_query_limit:
+            heapq.heappush(self._slowest, entry)
+        elif duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def merge(self, other):
+        """Add the statements recorded by other, e.g. a batch worker thread's stats."""
+        self.count += other.count
+        self.time += other.time
+        self._statements.update(other._statements)
+        for entry in other._slowest:
+            if len(self._slowest) < self.slow_query_limit:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def duplicates(self, threshold):
+        """Return {fingerprint: count} for statements repeated at least threshold times."""
+        fingerprints = Counter()
+        for sql, count in self._statements.items():
+            fingerprints[fingerprint_sql(sql)] += count
+        return {fingerprint: count for fingerprint, count in fingerprints.items() if count >= threshold}
+
+    @property
+    def slowest(self):
+        """The slowest statements as (duration, sql), slowest first."""
+        return [(duration, sql) for duration, _, sql in sorted(self._slowest, reverse=True)]
+
+
+class EndpointDatabaseSummary:
+    """
+    Rolling per-endpoint database summary over the last `window` requests.
+    """
+
+    def __init__(self, window=100):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+
+    def add(self, endpoint, queries, db_time, n_plus_one):
+        with self._lock:
+            self._samples[endpoint].append((queries, db_time, n_plus_one))
+
+    def snapshot(self):
+        with self._lock:
+            samples = {endpoint: list(rows) for endpoint, rows in self._samples.items()}
+
+        summary = {}
+        for endpoint, rows in samples.items():
+            requests = len(rows)
+            summary[endpoint] = {
+                'requests': requests,
+                'avg_queries': round(sum(row[0] for row in rows) / requests, 2),
+                'max_queries': max(row[0] for row in rows),
+                'avg_db_time_ms': round(sum(row[1] for row in rows) / requests * 1000, 3),
+                'max_db_time_ms': round(max(row[1] for row in rows) * 1000, 3),
+                'n_plus_one_requests': sum(1 for row in rows if row[2]),
+            }
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+endpoint_db_summary = EndpointDatabaseSummary(getattr(settings, 'DB_STATS_WINDOW', 100))
+
+
+class ObservabilityMiddleware:
+    """
+    Single request timing, logging and database instrumentation middleware.
+
+    Sits outermost in MIDDLEWARE. It takes one monotonic timestamp when the
+    request arrives and stamps the view and render phases into a
+    RequestTimings object (request.timings); serializers add their own time
+    to it. Every connection is wrapped with a QueryStats execute hook
+    (request.db_stats) for the duration of the request.
+
+    Responses carry X-DB-Queries, X-DB-Time and Server-Timing headers.
+    Repeated statements are flagged as possible N+1 patterns and fed into the
+    rolling per-endpoint summary. The user is never loaded just for logging.
+
+    Logging follows settings.REQUEST_LOG_MODE:
+
+    - 'structured' (default outside DEBUG): one compact JSON line per
+      request on the api.requests logger, sampled per status class with
+      REQUEST_LOG_SAMPLE_RATES. Requests slower than
+      REQUEST_LOG_SLOW_THRESHOLD seconds are always logged.
+    - 'verbose': logs headers, bodies, the user and error responses line by
+      line. Expensive; meant for local debugging only.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.verbose = getattr(settings, 'REQUEST_LOG_MODE', 'structured') == 'verbose'
+        self.sample_rates = getattr(settings, 'REQUEST_LOG_SAMPLE_RATES', {})
+        self.slow_threshold = getattr(settings, 'REQUEST_LOG_SLOW_THRESHOLD', 1.0)
+        self.slow_query_limit = getattr(settings, 'DB_SLOW_QUERY_LIMIT', 5)
+        self.duplicate_threshold = getattr(settings, 'DB_DUPLICATE_QUERY_THRESHOLD', 5)
+
+    def __call__(self, request):
+        timings = RequestTimings()
+        stats = QueryStats(self.slow_query_limit)
+        request.timings = timings
+        request.db_stats = stats
+
+        token = current_timings.set(timings)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(stats))
+                response = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        timings.mark('end')
+
+        request.db_query_count = stats.count
+        request.db_query_time = stats.time
+        response['X-DB-Queries'] = str(stats.count)
+        response['X-DB-Time'] = f"{stats.time * 1000:.2f}ms"
+        response['Server-Timing'] = timings.server_timing(db=stats.time)
+
+        endpoint = self.get_endpoint(request)
+        duplicates = stats.duplicates(self.duplicate_threshold)
+        endpoint_db_summary.add(endpoint, stats.count, stats.time, bool(duplicates))
+        for fingerprint, count in duplicates.items():
+            logger.warning("Possible N+1 on %s: %dx %s", endpoint, count, fingerprint[:200])
+
+        if self.verbose:
+            self.log_response_verbose(request, response, timings, stats)
+        else:
+            self.log_structured(request, response, timings, stats)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Runs after every middleware's request phase, so request.user is set
+        if self.verbose:
+            self.log_request_verbose(request)
+        request.timings.mark('view_start')
+        return None
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after this hook returns
+        request.timings.mark('view_end')
+        response.add_post_render_callback(request.timings.rendered)
+        return response
+
+    def process_exception(self, request, exception):
+        """Log exceptions."""
+        request.timings.mark('view_end')
+        request.log_exception = type(exception).__name__
+        if not self.verbose:
+            # django.request logs the traceback; the JSON line names the error
+            return None
+
+        logger.error("=== EXCEPTION ===")
+        logger.error("Exception Type: %s", type(exception).__name__)
+        logger.error("Exception Message: %s", exception)
+        logger.error("Request URL: %s", request.path)
+        logger.error("Request Method: %s", request.method)
+        logger.error("User: %s", request.user.username if request.user.is_authenticated else 'Anonymous')
         
+        # Log stack trace
+        import traceback
+        logger.error("Stack Trace: %s", traceback.format_exc())
+        
+        return None
+
+    def get_endpoint(self, request):
+        """
+        Name the endpoint by its URL pattern rather than the concrete path.
+        Unresolved paths and unknown methods share one name each, so clients
+        cannot grow the per-endpoint summary with junk requests.
+        """
+        method = request.method if request.method in KNOWN_METHODS else 'OTHER'
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match and resolver_match.view_name:
+            return f"{method} {resolver_match.view_name}"
+        return f"{method} <unresolved>"
+
+    def should_log(self, status_code, duration):
+        """Apply the per-status-class sampling rate; slow requests always pass."""
+        if duration >= self.slow_threshold:
+            return True, 1.0
+        rate = self.sample_rates.get(f"{status_code // 100}xx", 1.0)
+        return random.random() < rate, rate
+
+    def log_structured(self, request, response, timings, stats):
+        """Write one compact JSON line describing the request."""
+        status_code = response.status_code
+        duration = timings.total
+        sampled, rate = self.should_log(status_code, duration)
+        if not sampled:
+            return
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        entry = {
+            'method': request.method,
+            'route': resolver_match.route if resolver_match else None,
+            'view': resolver_match.view_name if resolver_match else None,
+            'status': status_code,
+            'duration_ms': round(duration * 1000, 2),
+            'phases_ms': {name: round(value * 1000, 2) for name, value in timings.phases().items()},
+            'user_id': get_loaded_user_id(request),
+            'db_queries': stats.count,
+            'db_time_ms': round(stats.time * 1000, 2),
+            'request_bytes': int(request.META.get('CONTENT_LENGTH') or 0),
+            'response_bytes': None if response.streaming else len(response.content),
+            'sample_rate': rate,
+        }
+        if hasattr(request, 'log_exception'):
+            entry['exception'] = request.log_exception
+
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400 or duration >= self.slow_threshold:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        request_logger.log(level, '%s', json.dumps(entry, separators=(',', ':')))
+
+    def log_request_verbose(self, request):
         # Log request details
-        logger.info(f"=== REQUEST START ===")
-        logger.info(f"Method: {request.method}")
-        logger.info(f"URL: {request.path}")
-        logger.info(f"User: {request.user.username if request.user.is_authenticated else 'Anonymous'}")
-        logger.info(f"User Role: {getattr(request.user, 'role', 'N/A')}")
-        logger.info(f"IP Address: {self.get_client_ip(request)}")
-        logger.info(f"User Agent: {request.META.get('HTTP_USER_AGENT', 'N/A')}")
+        logger.info("=== REQUEST START ===")
+        logger.info("Method: %s", request.method)
+        logger.info("URL: %s", request.path)
+        logger.info("User: %s", request.user.username if request.user.is_authenticated else 'Anonymous')
+        logger.info("User Role: %s", getattr(request.user, 'role', 'N/A'))
+        logger.info("IP Address: %s", self.get_client_ip(request))
+        logger.info("User Agent: %s", request.META.get('HTTP_USER_AGENT', 'N/A'))
+
+        # The rest is DEBUG detail; skip copying headers and decoding bodies otherwise
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        # Log API version if present
+        api_version = request.META.get('HTTP_ACCEPT_VERSION')
+        if api_version:
+            logger.debug("API Version: %s", api_version)
         
         # Log request headers (sensitive ones filtered)
         try:
@@ -53,9 +343,9 @@ class RequestLoggingMiddleware(MiddlewareMixin):
             
             # Safely serialize headers
             safe_headers = safe_serialize_headers(headers)
-            logger.debug(f"Request Headers: {json.dumps(safe_headers, indent=2)}")
+            logger.debug("Request Headers: %s", json.dumps(safe_headers, indent=2))
         except Exception as e:
-            logger.warning(f"Could not log request headers: {str(e)}")
+            logger.warning("Could not log request headers: %s", e)
         
         # Log request body for POST/PUT/PATCH requests
         if request.method in ['POST', 'PUT', 'PATCH']:
@@ -70,9 +360,9 @@ class RequestLoggingMiddleware(MiddlewareMixin):
                             # Filter sensitive data
                             if 'password' in body.lower():
                                 body = '[REDACTED - CONTAINS PASSWORD]'
-                            logger.debug(f"Request Body (JSON): {body}")
+                            logger.debug("Request Body (JSON): %s", body)
                         except Exception as e:
-                            logger.debug(f"Request Body (JSON decode error): {str(e)}")
+                            logger.debug("Request Body (JSON decode error): %s", e)
                     
                     elif 'multipart/form-data' in content_type:
                         # For file uploads, just log the form data keys
@@ -83,7 +373,7 @@ class RequestLoggingMiddleware(MiddlewareMixin):
                             for field in sensitive_fields:
                                 if field in form_data:
                                     form_data[field] = '[REDACTED]'
-                            logger.debug(f"Request Form Data: {form_data}")
+                            logger.debug("Request Form Data: %s", form_data)
                         
                         # Log file information if present
                         if hasattr(request, 'FILES') and request.FILES:
@@ -94,67 +384,55 @@ class RequestLoggingMiddleware(MiddlewareMixin):
                                     'size': file_obj.size,
                                     'content_type': file_obj.content_type
                                 }
-                            logger.debug(f"Request Files: {file_info}")
+                            logger.debug("Request Files: %s", file_info)
                     
                     else:
                         # For other content types, just log the size
                         body_size = len(request.body)
-                        logger.debug(f"Request Body Size: {body_size} bytes")
+                        logger.debug("Request Body Size: %d bytes", body_size)
                         
             except Exception as e:
-                logger.warning(f"Could not log request body: {str(e)}")
+                logger.warning("Could not log request body: %s", e)
         
         # Log query parameters
         if request.GET:
-            logger.debug(f"Query Parameters: {dict(request.GET)}")
-        
-        return None
-    
-    def process_response(self, request, response):
-        """Log response details."""
-        if hasattr(request, 'start_time'):
-            duration = time.time() - request.start_time
-        else:
-            duration = 0
-        
+            logger.debug("Query Parameters: %s", dict(request.GET))
+
+    def log_response_verbose(self, request, response, timings, stats):
+        duration = timings.total
         # Log response details
-        logger.info(f"=== RESPONSE END ===")
-        logger.info(f"Status Code: {response.status_code}")
-        logger.info(f"Duration: {duration:.3f}s")
-        logger.info(f"Content Type: {response.get('Content-Type', 'N/A')}")
+        logger.info("=== RESPONSE END ===")
+        logger.info("Status Code: %d", response.status_code)
+        logger.info("Duration: %.3fs", duration)
+        logger.info("Content Type: %s", response.get('Content-Type', 'N/A'))
         
         # Log response size
         if hasattr(response, 'content'):
             size = len(response.content)
-            logger.info(f"Response Size: {size} bytes")
+            logger.info("Response Size: %d bytes", size)
         
         # Log error details for 4xx and 5xx responses
         if response.status_code >= 400:
-            logger.error(f"Error Response: {response.status_code}")
+            logger.error("Error Response: %d", response.status_code)
             if hasattr(response, 'content'):
                 try:
                     error_content = response.content.decode('utf-8')
-                    logger.error(f"Error Details: {error_content}")
+                    logger.error("Error Details: %s", error_content)
                 except Exception as e:
-                    logger.error(f"Could not decode error content: {str(e)}")
-        
-        return response
-    
-    def process_exception(self, request, exception):
-        """Log exceptions."""
-        logger.error(f"=== EXCEPTION ===")
-        logger.error(f"Exception Type: {type(exception).__name__}")
-        logger.error(f"Exception Message: {str(exception)}")
-        logger.error(f"Request URL: {request.path}")
-        logger.error(f"Request Method: {request.method}")
-        logger.error(f"User: {request.user.username if request.user.is_authenticated else 'Anonymous'}")
-        
-        # Log stack trace
-        import traceback
-        logger.error(f"Stack Trace: {traceback.format_exc()}")
-        
-        return None
-    
+                    logger.error("Could not decode error content: %s", e)
+
+        logger.info("Database Queries: %d queries", stats.count)
+        logger.info("Database Time: %.3fs", stats.time)
+        if logger.isEnabledFor(logging.DEBUG):
+            for query_duration, sql in stats.slowest:
+                logger.debug("Top query (%.2fms): %s", query_duration * 1000, sql[:500])
+
+        # Log performance metrics
+        phases = ', '.join(f"{name} {value:.3f}s" for name, value in timings.phases().items())
+        if duration > self.slow_threshold:
+            logger.warning("SLOW REQUEST: %s %s took %.3fs", request.method, request.path, duration)
+        logger.info("Performance: %s %s - %.3fs (%s)", request.method, request.path, duration, phases)
+
     def get_client_ip(self, request):
         """Get the client IP address."""
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -165,98 +443,6 @@ class RequestLoggingMiddleware(MiddlewareMixin):
         return ip
 
 
-class PerformanceLoggingMiddleware(MiddlewareMixin):
-    """
-    Middleware to log performance metrics.
-    """
-    
-    def process_request(self, request):
-        """Start timing the request."""
-        request.start_time = time.time()
-        return None
-    
-    def process_response(self, request, response):
-        """Log performance metrics."""
-        if hasattr(request, 'start_time'):
-            duration = time.time() - request.start_time
-            
-            # Log slow requests
-            if duration > 1.0:  # More than 1 second
-                logger.warning(f"SLOW REQUEST: {request.method} {request.path} took {duration:.3f}s")
-            
-            # Log performance metrics
-            logger.info(f"Performance: {request.method} {request.path} - {duration:.3f}s")
-        
-        return response
-
-
-class DatabaseLoggingMiddleware(MiddlewareMixin):
-    """
-    Middleware to log database queries.
-    """
-    
-    def process_request(self, request):
-        """Initialize query count."""
-        request.db_query_count = 0
-        request.db_query_time = 0
-        return None
-    
-    def process_response(self, request, response):
-        """Log database performance."""
-        if hasattr(request, 'db_query_count'):
-            logger.info(f"Database Queries: {request.db_query_count} queries")
-            logger.info(f"Database Time: {request.db_query_time:.3f}s")
-        
-        return response
-
-
-class AuthenticationLoggingMiddleware(MiddlewareMixin):
-    """
-    Middleware to log authentication events.
-    """
-    
-    def process_request(self, request):
-        """Log authentication status."""
-        if request.user.is_authenticated:
-            logger.debug(f"Authenticated User: {request.user.username} (Role: {request.user.role})")
-        else:
-            logger.debug("Anonymous User")
-        
-        return None
-
-
-class APILoggingMiddleware(MiddlewareMixin):
-    """
-    Middleware specifically for API request logging.
-    """
-    
-    def process_request(self, request):
-        """Log API-specific request details."""
-        if request.path.startswith('/api/'):
-            logger.info(f"API Request: {request.method} {request.path}")
-            logger.debug(f"API User: {request.user.username if request.user.is_authenticated else 'Anonymous'}")
-            logger.debug(f"API User Role: {getattr(request.user, 'role', 'N/A')}")
-            
-            # Log API version if present
-            api_version = request.META.get('HTTP_ACCEPT_VERSION', 'N/A')
-            if api_version != 'N/A':
-                logger.debug(f"API Version: {api_version}")
-        
-        return None
-    
-    def process_response(self, request, response):
-        """Log API-specific response details."""
-        if request.path.startswith('/api/'):
-            logger.info(f"API Response: {request.method} {request.path} - {response.status_code}")
-            
-            # Log API response time
-            if hasattr(request, 'start_time'):
-                duration = time.time() - request.start_time
-                logger.info(f"API Duration: {duration:.3f}s")
-        
-        return response 
-
-
 class CSRFExemptMiddleware(MiddlewareMixin):
     """
     Middleware to exempt API endpoints from CSRF protection.
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-16 19:56
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_enrollment_counters(apps, schema_editor):
+    Course = apps.get_model('api', 'Course')
+    Enrollment = apps.get_model('api', 'Enrollment')
+    active = Enrollment.objects.filter(course=OuterRef('pk'), is_active=True).order_by().values('course')
+    rated = active.filter(rating__isnull=False)
+    Course.objects.update(
+        active_enrollment_count=Coalesce(Subquery(active.annotate(n=Count('pk')).values('n')), Value(0)),
+        rating_count=Coalesce(Subquery(rated.annotate(n=Count('pk')).values('n')), Value(0)),
+        rating_sum=Coalesce(Subquery(rated.annotate(total=Sum('rating')).values('total')), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_alter_course_options_alter_enrollment_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='active_enrollment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_enrollment_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:18
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+import django.db.models.deletion
+
+
+def backfill_daily_rollups(apps, schema_editor):
+    User = apps.get_model('api', 'User')
+    Enrollment = apps.get_model('api', 'Enrollment')
+    FeeTransaction = apps.get_model('api', 'FeeTransaction')
+    DailyEnrollmentStat = apps.get_model('api', 'DailyEnrollmentStat')
+    DailyRevenueStat = apps.get_model('api', 'DailyRevenueStat')
+    DailyStudentStat = apps.get_model('api', 'DailyStudentStat')
+
+    enrollments = Enrollment.objects.annotate(day=TruncDate('enrolled_at')).order_by().values(
+        'day', 'course_id'
+    ).annotate(total=Count('id'))
+    DailyEnrollmentStat.objects.bulk_create(
+        DailyEnrollmentStat(date=row['day'], course_id=row['course_id'], enrollments=row['total'])
+        for row in enrollments
+    )
+
+    revenue = FeeTransaction.objects.filter(payment_status='completed').annotate(
+        day=TruncDate('transaction_date')
+    ).order_by().values('day', 'transaction_type').annotate(total=Sum('amount'), count=Count('id'))
+    DailyRevenueStat.objects.bulk_create(
+        DailyRevenueStat(date=row['day'], transaction_type=row['transaction_type'], amount=row['total'], transactions=row['count'])
+        for row in revenue
+    )
+
+    students = User.objects.filter(role='student').annotate(day=TruncDate('created_at')).order_by().values(
+        'day'
+    ).annotate(total=Count('id'))
+    DailyStudentStat.objects.bulk_create(
+        DailyStudentStat(date=row['day'], new_students=row['total']) for row in students
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_course_enrollment_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStudentStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('new_students', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'daily_student_stats',
+                'ordering': ['date'],
+                'unique_together': {('date',)},
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyRevenueStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('transaction_type', models.CharField(choices=[('course', 'Course Fee'), ('exam', 'Exam Fee'), ('material', 'Study Material'), ('other', 'Other')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('transactions', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'daily_revenue_stats',
+                'ordering': ['date'],
+                'unique_together': {('date', 'transaction_type')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyEnrollmentStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('enrollments', models.IntegerField(default=0)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_enrollment_stats', to='api.course')),
+            ],
+            options={
+                'db_table': 'daily_enrollment_stats',
+                'ordering': ['date'],
+                'unique_together': {('date', 'course')},
+            },
+        ),
+        migrations.RunPython(backfill_daily_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_daily_rollups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['-enrolled_at', '-id'], name='enrollment_enrolled_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examattempt',
+            index=models.Index(fields=['-started_at', '-id'], name='attempt_started_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feetransaction',
+            index=models.Index(fields=['-transaction_date', '-id'], name='fee_tx_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fileupload',
+            index=models.Index(fields=['-created_at', '-id'], name='file_upload_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['student', 'course'], name='enrollment_active_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['course', 'student'], name='enrollment_active_course_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['course', 'start_time', 'end_time'], name='exam_course_window_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['start_time', 'end_time'], name='exam_active_window_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feetransaction',
+            index=models.Index(fields=['payment_status', 'transaction_date'], name='fee_tx_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprogress',
+            index=models.Index(fields=['course', 'week_number'], name='progress_course_week_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studymaterial',
+            index=models.Index(fields=['course', 'is_public'], name='material_course_public_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studymaterial',
+            index=models.Index(condition=models.Q(('is_public', True)), fields=['-created_at'], name='material_public_created_idx'),
+        ),
+    ]
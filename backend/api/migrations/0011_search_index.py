@@ -0,0 +1,50 @@
+from django.db import migrations
+
+# api.search.document_rowid(): object_id * ROWID_STRIDE + KIND_CODES[kind]
+ROWID_STRIDE = 8
+KIND_CODES = {'course': 1, 'material': 2}
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'sqlite':
+        # FTS5 is SQLite-only; other backends keep LIKE search
+        return
+    Course = apps.get_model('api', 'Course')
+    StudyMaterial = apps.get_model('api', 'StudyMaterial')
+    rows = [
+        [course.pk * ROWID_STRIDE + KIND_CODES['course'], 'course', course.pk, course.title, '\n'.join(
+            filter(None, (course.description, course.syllabus, course.prerequisites))
+        )]
+        for course in Course.objects.only('title', 'description', 'syllabus', 'prerequisites')
+    ] + [
+        [material.pk * ROWID_STRIDE + KIND_CODES['material'], 'material', material.pk, material.title,
+         material.description or '']
+        for material in StudyMaterial.objects.only('title', 'description')
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+            "kind UNINDEXED, object_id UNINDEXED, title, body, tokenize = 'porter unicode61')"
+        )
+        cursor.executemany(
+            "INSERT INTO search_index (rowid, kind, object_id, title, body) VALUES (%s, %s, %s, %s, %s)", rows
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS search_index")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:17
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Coalesce
+
+
+def populate_updated_at(apps, schema_editor):
+    # Existing rows were stamped with the migration time; use the latest time each row is known to have changed
+    apps.get_model('api', 'Enrollment').objects.update(updated_at=Coalesce(F('completed_at'), F('enrolled_at')))
+    apps.get_model('api', 'ExamAttempt').objects.update(updated_at=Coalesce(F('completed_at'), F('started_at')))
+    apps.get_model('api', 'FeeTransaction').objects.update(updated_at=F('transaction_date'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_exam_answer_key_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='enrollment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='examattempt',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='feetransaction',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(populate_updated_at, migrations.RunPython.noop),
+    ]
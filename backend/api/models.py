@@ -1,15 +1,128 @@
 import logging
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
-from django.db.models import Avg
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
 import os
 
 # Get logger for models
 logger = logging.getLogger('api.models')
 
-class User(AbstractUser):
+
+class DirtyFieldsMixin:
+    """
+    Snapshot field values when an instance is loaded from the database.
+
+    Exposes `changed_fields` for change logging and makes save() write only
+    the columns that actually changed, so updates no longer need to re-fetch
+    the row first. Saving an instance with no changes still touches its
+    auto_now timestamps, or is a full save when it has none, as without the
+    mixin: Django skips both the write and the pre_save and post_save
+    signals when update_fields is empty.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_fields()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        # Loading a deferred field must not discard other pending changes
+        self._snapshot_fields(fields)
+
+    def _snapshot_fields(self, fields=None):
+        # Deferred fields are absent from __dict__ and are not tracked
+        loaded_values = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+            and (fields is None or field.name in fields or field.attname in fields)
+        }
+        if fields is None or getattr(self, '_loaded_values', None) is None:
+            self._loaded_values = loaded_values
+        else:
+            self._loaded_values.update(loaded_values)
+
+    @property
+    def changed_fields(self):
+        """
+        Map of field name to (old value, new value) for every field modified
+        since the instance was loaded or last saved. Empty for new instances.
+        """
+        loaded_values = getattr(self, '_loaded_values', None)
+        if loaded_values is None:
+            return {}
+
+        changed = {}
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname not in self.__dict__:
+                continue
+            value = self.__dict__[field.attname]
+            if field.attname not in loaded_values:
+                # Deferred on load but assigned since
+                changed[field.name] = (None, value)
+            elif loaded_values[field.attname] != value:
+                changed[field.name] = (loaded_values[field.attname], value)
+        return changed
+
+    def save(self, *args, **kwargs):
+        if (
+            not args
+            and not self._state.adding
+            and getattr(self, '_loaded_values', None) is not None
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            # Only write changed columns, plus auto_now timestamps
+            update_fields = list(self.changed_fields)
+            for field in self._meta.concrete_fields:
+                if getattr(field, 'auto_now', False) and field.name not in update_fields:
+                    update_fields.append(field.name)
+            if update_fields:
+                kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+        self._snapshot_fields()
+
+
+def _exclude_from_update(instance, field_names, kwargs):
+    """
+    Leave field_names out of the UPDATE a plain save() issues. These columns
+    are only changed with F() expressions, so writing back the values loaded
+    earlier would undo every increment made since.
+    """
+    if instance._state.adding or kwargs.get('force_insert') or kwargs.get('update_fields') is not None:
+        return
+    deferred = instance.get_deferred_fields()
+    kwargs['update_fields'] = [
+        field.name for field in instance._meta.concrete_fields
+        if not field.primary_key and field.attname not in deferred and field.name not in field_names
+    ]
+
+
+def _loaded_or_current(instance, loaded):
+    """Field values as last loaded from the database, or as currently set."""
+    values = getattr(instance, '_loaded_values', None) if loaded else None
+    return instance.__dict__ if values is None else values
+
+
+def _rollup_values(instance, names, loaded=False):
+    """
+    Values of the named fields for rollup bookkeeping. Deferred fields that
+    were never loaded are fetched, since their stored value is still current.
+    """
+    values = _loaded_or_current(instance, loaded)
+    return [values[name] if name in values else getattr(instance, name) for name in names]
+
+
+def _rollup_date(value):
+    return timezone.localdate(value) if value is not None else None
+
+
+class User(DirtyFieldsMixin, AbstractUser):
     """
     Custom User model with role-based access control.
     """
@@ -53,38 +166,54 @@ class User(AbstractUser):
         verbose_name_plural = 'Users'
 
     def __str__(self):
-        logger.debug(f"User.__str__ called for user_id={self.id}, username={self.username}")
+        logger.debug("User.__str__ called for user_id=%s, username=%s", self.id, self.username)
         return f"{self.get_full_name()} ({self.role})"
 
     def save(self, *args, **kwargs):
-        logger.info(f"User.save called for user_id={self.id if self.id else 'NEW'}, username={self.username}")
+        logger.info("User.save called for user_id=%s, username=%s", self.id if self.id else 'NEW', self.username)
         
         # Automatically set admin role for superusers
         if self.is_superuser and self.role != 'admin':
-            logger.info(f"Setting admin role for superuser: {self.username}")
+            logger.info("Setting admin role for superuser: %s", self.username)
             self.role = 'admin'
         
         # Log role changes
-        if self.pk:  # Existing user
-            try:
-                old_user = User.objects.get(pk=self.pk)
-                if old_user.role != self.role:
-                    logger.info(f"Role changed for user {self.username}: {old_user.role} -> {self.role}")
-            except User.DoesNotExist:
-                logger.warning(f"Could not find existing user with pk={self.pk} for role comparison")
+        changes = self.changed_fields
+        if 'role' in changes:
+            old_role, new_role = changes['role']
+            logger.info("Role changed for user %s: %s -> %s", self.username, old_role, new_role)
         
-        super().save(*args, **kwargs)
-        logger.info(f"User saved successfully: {self.username} (ID: {self.id})")
+        previous_rollup = self.rollup_state(loaded=True) if not self._state.adding else None
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_rollups(previous_rollup, self.rollup_state())
+        logger.info("User saved successfully: %s (ID: %s)", self.username, self.id)
+
+    def rollup_state(self, loaded=False):
+        """Return the DailyStudentStat date this user counts in, or None if not a student."""
+        role, created_at = _rollup_values(self, ['role', 'created_at'], loaded)
+        if role != 'student':
+            return None
+        return _rollup_date(created_at)
+
+    @staticmethod
+    def update_rollups(previous_state, new_state):
+        """Move this user between DailyStudentStat rows."""
+        if previous_state == new_state:
+            return
+        for day, sign in ((previous_state, -1), (new_state, 1)):
+            if day is not None:
+                DailyStudentStat.bump({'date': day}, new_students=sign)
 
     @property
     def full_name(self):
-        logger.debug(f"User.full_name property accessed for user_id={self.id}")
+        logger.debug("User.full_name property accessed for user_id=%s", self.id)
         return f"{self.first_name} {self.last_name}".strip()
 
     def delete(self, *args, **kwargs):
-        logger.warning(f"User.delete called for user_id={self.id}, username={self.username}")
+        logger.warning("User.delete called for user_id=%s, username=%s", self.id, self.username)
         super().delete(*args, **kwargs)
-        logger.info(f"User deleted: {self.username} (ID: {self.id})")
+        logger.info("User deleted: %s (ID: %s)", self.username, self.id)
 
 
 class Course(models.Model):
@@ -109,6 +238,12 @@ class Course(models.Model):
     prerequisites = models.TextField(blank=True, null=True)
     max_students = models.PositiveIntegerField(default=50)
     schedule_info = models.TextField(blank=True, null=True)  # Course schedule information
+    # Denormalized counters over active enrollments, maintained by Enrollment
+    # through adjust_enrollment_counters(); save() never writes them
+    COUNTER_FIELDS = ('active_enrollment_count', 'rating_count', 'rating_sum')
+    active_enrollment_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -117,41 +252,71 @@ class Course(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        logger.debug(f"Course.__str__ called for course_id={self.id}, title={self.title}")
+        logger.debug("Course.__str__ called for course_id=%s, title=%s", self.id, self.title)
         return self.title
 
     @property
     def enrolled_students_count(self):
-        logger.debug(f"Course.enrolled_students_count accessed for course_id={self.id}")
-        count = self.enrollments.filter(is_active=True).count()
-        logger.debug(f"Enrolled students count for course {self.title}: {count}")
-        return count
+        return self.active_enrollment_count
 
     @property
     def average_rating(self):
-        logger.debug(f"Course.average_rating accessed for course_id={self.id}")
-        ratings = self.enrollments.filter(is_active=True, rating__isnull=False)
-        if ratings.exists():
-            avg_rating = ratings.aggregate(Avg('rating'))['rating__avg']
-            logger.debug(f"Average rating for course {self.title}: {avg_rating}")
-            return avg_rating
-        logger.debug(f"No ratings found for course {self.title}")
+        if self.rating_count:
+            return self.rating_sum / self.rating_count
         return None
 
+    @classmethod
+    def adjust_enrollment_counters(cls, course_id, enrollments=0, ratings=0, rating_sum=0):
+        """Apply a delta to a course's stored counters in a single UPDATE."""
+        if not (enrollments or ratings or rating_sum):
+            return
+        logger.debug("Adjusting counters for course_id=%s: enrollments=%+d, ratings=%+d, rating_sum=%+d", course_id, enrollments, ratings, rating_sum)
+        cls.objects.filter(pk=course_id).update(
+            active_enrollment_count=F('active_enrollment_count') + enrollments,
+            rating_count=F('rating_count') + ratings,
+            rating_sum=F('rating_sum') + rating_sum,
+            # The counters are part of the course's representation
+            updated_at=timezone.now(),
+        )
+
+    @classmethod
+    def rebuild_enrollment_counters(cls, queryset=None):
+        """
+        Recompute the stored counters from the enrollments table. Only courses
+        whose counters had drifted are written, and their updated_at is bumped
+        so conditional GETs see the change. Returns rows updated.
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        active = Enrollment.objects.filter(course=OuterRef('pk'), is_active=True).order_by().values('course')
+        rated = active.filter(rating__isnull=False)
+        counters = {
+            'active_enrollment_count': Coalesce(Subquery(active.annotate(n=Count('pk')).values('n')), Value(0)),
+            'rating_count': Coalesce(Subquery(rated.annotate(n=Count('pk')).values('n')), Value(0)),
+            'rating_sum': Coalesce(Subquery(rated.annotate(total=Sum('rating')).values('total')), Value(0)),
+        }
+        drifted = Q()
+        for field in counters:
+            drifted |= ~Q(**{field: F(f'expected_{field}')})
+        drifted_ids = queryset.annotate(
+            **{f'expected_{field}': expression for field, expression in counters.items()}
+        ).filter(drifted).values('pk')
+        return cls.objects.filter(pk__in=drifted_ids).update(**counters, updated_at=timezone.now())
+
     def save(self, *args, **kwargs):
-        logger.info(f"Course.save called for course_id={self.id if self.id else 'NEW'}, title={self.title}")
+        logger.info("Course.save called for course_id=%s, title=%s", self.id if self.id else 'NEW', self.title)
         
         # Log teacher assignment
         if self.teacher:
-            logger.info(f"Course '{self.title}' assigned to teacher: {self.teacher.username}")
+            logger.info("Course '%s' assigned to teacher: %s", self.title, self.teacher.username)
         
+        _exclude_from_update(self, self.COUNTER_FIELDS, kwargs)
         super().save(*args, **kwargs)
-        logger.info(f"Course saved successfully: {self.title} (ID: {self.id})")
+        logger.info("Course saved successfully: %s (ID: %s)", self.title, self.id)
 
     def delete(self, *args, **kwargs):
-        logger.warning(f"Course.delete called for course_id={self.id}, title={self.title}")
+        logger.warning("Course.delete called for course_id=%s, title=%s", self.id, self.title)
         super().delete(*args, **kwargs)
-        logger.info(f"Course deleted: {self.title} (ID: {self.id})")
+        logger.info("Course deleted: %s (ID: %s)", self.title, self.id)
 
 
 class WeeklyDetail(models.Model):
@@ -174,17 +339,17 @@ class WeeklyDetail(models.Model):
         ordering = ['week_number']
 
     def __str__(self):
-        logger.debug(f"WeeklyDetail.__str__ called for weekly_detail_id={self.id}")
+        logger.debug("WeeklyDetail.__str__ called for weekly_detail_id=%s", self.id)
         return f"Week {self.week_number} - {self.title}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"WeeklyDetail.save called for weekly_detail_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Course: {self.course.title}, Week: {self.week_number}")
+        logger.info("WeeklyDetail.save called for weekly_detail_id=%s", self.id if self.id else 'NEW')
+        logger.info("Course: %s, Week: %s", self.course.title, self.week_number)
         super().save(*args, **kwargs)
-        logger.info(f"WeeklyDetail saved successfully: {self}")
+        logger.info("WeeklyDetail saved successfully: %s", self)
 
 
-class Enrollment(models.Model):
+class Enrollment(DirtyFieldsMixin, models.Model):
     """
     Student enrollment in courses.
     """
@@ -202,40 +367,93 @@ class Enrollment(models.Model):
     review = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
     completed_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'enrollments'
         unique_together = ['student', 'course']
         ordering = ['-enrolled_at']
+        indexes = [
+            # Keyset pagination order
+            models.Index(fields=['-enrolled_at', '-id'], name='enrollment_enrolled_id_idx'),
+            # A student's / a course's active enrollments (my_courses, exam visibility, counters)
+            models.Index(fields=['student', 'course'], condition=Q(is_active=True), name='enrollment_active_student_idx'),
+            models.Index(fields=['course', 'student'], condition=Q(is_active=True), name='enrollment_active_course_idx'),
+        ]
 
     def __str__(self):
-        logger.debug(f"Enrollment.__str__ called for enrollment_id={self.id}")
+        logger.debug("Enrollment.__str__ called for enrollment_id=%s", self.id)
         return f"{self.student.username} - {self.course.title}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"Enrollment.save called for enrollment_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Student: {self.student.username}, Course: {self.course.title}")
+        logger.info("Enrollment.save called for enrollment_id=%s", self.id if self.id else 'NEW')
+        logger.info("Student: %s, Course: %s", self.student.username, self.course.title)
         
         # Log completion status changes
-        if self.pk:  # Existing enrollment
-            try:
-                old_enrollment = Enrollment.objects.get(pk=self.pk)
-                if old_enrollment.completion_percentage != self.completion_percentage:
-                    logger.info(f"Completion percentage changed for {self}: {old_enrollment.completion_percentage}% -> {self.completion_percentage}%")
-                
-                if old_enrollment.is_active != self.is_active:
-                    logger.info(f"Active status changed for {self}: {old_enrollment.is_active} -> {self.is_active}")
-            except Enrollment.DoesNotExist:
-                logger.warning(f"Could not find existing enrollment with pk={self.pk} for comparison")
+        changes = self.changed_fields
+        if 'completion_percentage' in changes:
+            old_percentage, new_percentage = changes['completion_percentage']
+            logger.info("Completion percentage changed for %s: %s%% -> %s%%", self, old_percentage, new_percentage)
         
-        super().save(*args, **kwargs)
-        logger.info(f"Enrollment saved successfully: {self}")
+        if 'is_active' in changes:
+            old_active, new_active = changes['is_active']
+            logger.info("Active status changed for %s: %s -> %s", self, old_active, new_active)
+        
+        adding = self._state.adding
+        previous_state = self.counter_state(loaded=True) if not adding else None
+        previous_rollup = self.rollup_state(loaded=True) if not adding else None
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_course_counters(previous_state, self.counter_state())
+            self.update_rollups(previous_rollup, self.rollup_state())
+        logger.info("Enrollment saved successfully: %s", self)
+
+    def counter_state(self, loaded=False):
+        """
+        Return (course_id, is_active, rating) used for the Course counters,
+        either as currently set or as last loaded from the database.
+        """
+        values = _loaded_or_current(self, loaded)
+        return values.get('course_id'), values.get('is_active'), values.get('rating')
+
+    def rollup_state(self, loaded=False):
+        """Return (date, course_id) of the DailyEnrollmentStat row this enrollment counts in."""
+        enrolled_at, course_id = _rollup_values(self, ['enrolled_at', 'course_id'], loaded)
+        return _rollup_date(enrolled_at), course_id
+
+    @staticmethod
+    def update_rollups(previous_state, new_state):
+        """Move this enrollment between DailyEnrollmentStat rows."""
+        if previous_state == new_state:
+            return
+        for state, sign in ((previous_state, -1), (new_state, 1)):
+            if state is not None and state[0] is not None:
+                day, course_id = state
+                DailyEnrollmentStat.bump({'date': day, 'course_id': course_id}, enrollments=sign)
+
+    @staticmethod
+    def update_course_counters(previous_state, new_state):
+        """Move this enrollment's contribution between Course counter states."""
+        deltas = {}
+        for state, sign in ((previous_state, -1), (new_state, 1)):
+            if state is None:
+                continue
+            course_id, is_active, rating = state
+            if not is_active:
+                continue
+            delta = deltas.setdefault(course_id, {'enrollments': 0, 'ratings': 0, 'rating_sum': 0})
+            delta['enrollments'] += sign
+            if rating is not None:
+                delta['ratings'] += sign
+                delta['rating_sum'] += sign * rating
+        for course_id, delta in deltas.items():
+            Course.adjust_enrollment_counters(course_id, **delta)
 
     def delete(self, *args, **kwargs):
-        logger.warning(f"Enrollment.delete called for enrollment_id={self.id}")
-        logger.warning(f"Student: {self.student.username}, Course: {self.course.title}")
+        logger.warning("Enrollment.delete called for enrollment_id=%s", self.id)
+        logger.warning("Student: %s, Course: %s", self.student.username, self.course.title)
         super().delete(*args, **kwargs)
-        logger.info(f"Enrollment deleted: {self}")
+        logger.info("Enrollment deleted: %s", self)
 
 
 class StudyMaterial(models.Model):
@@ -269,37 +487,42 @@ class StudyMaterial(models.Model):
     class Meta:
         db_table = 'study_materials'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['course', 'is_public'], name='material_course_public_idx'),
+            # public_materials, newest first
+            models.Index(fields=['-created_at'], condition=Q(is_public=True), name='material_public_created_idx'),
+        ]
 
     def __str__(self):
-        logger.debug(f"StudyMaterial.__str__ called for study_material_id={self.id}")
+        logger.debug("StudyMaterial.__str__ called for study_material_id=%s", self.id)
         return f"{self.title} - {self.course.title}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"StudyMaterial.save called for study_material_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Title: {self.title}, Course: {self.course.title}, Type: {self.material_type}")
+        logger.info("StudyMaterial.save called for study_material_id=%s", self.id if self.id else 'NEW')
+        logger.info("Title: %s, Course: %s, Type: %s", self.title, self.course.title, self.material_type)
         if self.file:
             self.file_size = self.file.size
         super().save(*args, **kwargs)
-        logger.info(f"StudyMaterial saved successfully: {self}")
+        logger.info("StudyMaterial saved successfully: %s", self)
 
     @property
     def file_extension(self):
-        logger.debug(f"StudyMaterial.file_extension accessed for study_material_id={self.id}")
+        logger.debug("StudyMaterial.file_extension accessed for study_material_id=%s", self.id)
         if self.file:
             ext = os.path.splitext(self.file.name)[1].lower()
-            logger.debug(f"File extension for {self.title}: {ext}")
+            logger.debug("File extension for %s: %s", self.title, ext)
             return ext
-        logger.debug(f"No file found for {self.title}")
+        logger.debug("No file found for %s", self.title)
         return None
 
     @property
     def file_name(self):
-        logger.debug(f"StudyMaterial.file_name accessed for study_material_id={self.id}")
+        logger.debug("StudyMaterial.file_name accessed for study_material_id=%s", self.id)
         if self.file:
             name = os.path.basename(self.file.name)
-            logger.debug(f"File name for {self.title}: {name}")
+            logger.debug("File name for %s: %s", self.title, name)
             return name
-        logger.debug(f"No file found for {self.title}")
+        logger.debug("No file found for %s", self.title)
         return None
 
 
@@ -318,47 +541,56 @@ class Exam(models.Model):
     is_active = models.BooleanField(default=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_exams')
     instructions = models.TextField(blank=True, null=True)  # Exam instructions
+    # Bumped whenever a question or option changes; part of the answer key cache key
+    answer_key_version = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'exams'
         ordering = ['-created_at']
+        indexes = [
+            # Upcoming / ongoing exams of given courses
+            models.Index(fields=['course', 'start_time', 'end_time'], condition=Q(is_active=True), name='exam_course_window_idx'),
+            # Upcoming / ongoing exams across all courses (admins)
+            models.Index(fields=['start_time', 'end_time'], condition=Q(is_active=True), name='exam_active_window_idx'),
+        ]
 
     def __str__(self):
-        logger.debug(f"Exam.__str__ called for exam_id={self.id}")
+        logger.debug("Exam.__str__ called for exam_id=%s", self.id)
         return f"{self.title} - {self.course.title}"
 
     @property
     def is_ongoing(self):
-        logger.debug(f"Exam.is_ongoing accessed for exam_id={self.id}")
+        logger.debug("Exam.is_ongoing accessed for exam_id=%s", self.id)
         now = timezone.now()
         is_ongoing = self.start_time <= now <= self.end_time
-        logger.debug(f"Exam {self.title} ongoing status: {is_ongoing}")
+        logger.debug("Exam %s ongoing status: %s", self.title, is_ongoing)
         return is_ongoing
 
     @property
     def is_upcoming(self):
-        logger.debug(f"Exam.is_upcoming accessed for exam_id={self.id}")
+        logger.debug("Exam.is_upcoming accessed for exam_id=%s", self.id)
         now = timezone.now()
         is_upcoming = now < self.start_time
-        logger.debug(f"Exam {self.title} upcoming status: {is_upcoming}")
+        logger.debug("Exam %s upcoming status: %s", self.title, is_upcoming)
         return is_upcoming
 
     @property
     def is_completed(self):
-        logger.debug(f"Exam.is_completed accessed for exam_id={self.id}")
+        logger.debug("Exam.is_completed accessed for exam_id=%s", self.id)
         now = timezone.now()
         is_completed = now > self.end_time
-        logger.debug(f"Exam {self.title} completed status: {is_completed}")
+        logger.debug("Exam %s completed status: %s", self.title, is_completed)
         return is_completed
 
     def save(self, *args, **kwargs):
-        logger.info(f"Exam.save called for exam_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Title: {self.title}, Course: {self.course.title}")
-        logger.info(f"Duration: {self.duration_minutes} minutes, Total Marks: {self.total_marks}")
+        logger.info("Exam.save called for exam_id=%s", self.id if self.id else 'NEW')
+        logger.info("Title: %s, Course: %s", self.title, self.course.title)
+        logger.info("Duration: %s minutes, Total Marks: %s", self.duration_minutes, self.total_marks)
+        _exclude_from_update(self, ('answer_key_version',), kwargs)
         super().save(*args, **kwargs)
-        logger.info(f"Exam saved successfully: {self}")
+        logger.info("Exam saved successfully: %s", self)
 
 
 class Question(models.Model):
@@ -384,14 +616,14 @@ class Question(models.Model):
         ordering = ['order']
 
     def __str__(self):
-        logger.debug(f"Question.__str__ called for question_id={self.id}")
+        logger.debug("Question.__str__ called for question_id=%s", self.id)
         return f"Question {self.order} - {self.exam.title}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"Question.save called for question_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Exam: {self.exam.title}, Type: {self.question_type}, Marks: {self.marks}")
+        logger.info("Question.save called for question_id=%s", self.id if self.id else 'NEW')
+        logger.info("Exam: %s, Type: %s, Marks: %s", self.exam.title, self.question_type, self.marks)
         super().save(*args, **kwargs)
-        logger.info(f"Question saved successfully: {self}")
+        logger.info("Question saved successfully: %s", self)
 
 
 class QuestionOption(models.Model):
@@ -408,17 +640,17 @@ class QuestionOption(models.Model):
         ordering = ['order']
 
     def __str__(self):
-        logger.debug(f"QuestionOption.__str__ called for option_id={self.id}")
+        logger.debug("QuestionOption.__str__ called for option_id=%s", self.id)
         return f"{self.option_text} - {self.question.question_text[:50]}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"QuestionOption.save called for option_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Question: {self.question.question_text[:50]}, Correct: {self.is_correct}")
+        logger.info("QuestionOption.save called for option_id=%s", self.id if self.id else 'NEW')
+        logger.info("Question: %s, Correct: %s", self.question.question_text[:50], self.is_correct)
         super().save(*args, **kwargs)
-        logger.info(f"QuestionOption saved successfully: {self}")
+        logger.info("QuestionOption saved successfully: %s", self)
 
 
-class ExamAttempt(models.Model):
+class ExamAttempt(DirtyFieldsMixin, models.Model):
     """
     Student attempts for exams.
     """
@@ -434,34 +666,37 @@ class ExamAttempt(models.Model):
         ('completed', 'Completed'),
         ('abandoned', 'Abandoned'),
     ], default='in_progress')
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'exam_attempts'
         unique_together = ['student', 'exam']
         ordering = ['-started_at']
+        indexes = [
+            # Keyset pagination order
+            models.Index(fields=['-started_at', '-id'], name='attempt_started_id_idx'),
+        ]
 
     def __str__(self):
-        logger.debug(f"ExamAttempt.__str__ called for attempt_id={self.id}")
+        logger.debug("ExamAttempt.__str__ called for attempt_id=%s", self.id)
         return f"{self.student.username} - {self.exam.title}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"ExamAttempt.save called for attempt_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Student: {self.student.username}, Exam: {self.exam.title}, Status: {self.status}")
+        logger.info("ExamAttempt.save called for attempt_id=%s", self.id if self.id else 'NEW')
+        logger.info("Student: %s, Exam: %s, Status: %s", self.student.username, self.exam.title, self.status)
         
         # Log status changes
-        if self.pk:  # Existing attempt
-            try:
-                old_attempt = ExamAttempt.objects.get(pk=self.pk)
-                if old_attempt.status != self.status:
-                    logger.info(f"Status changed for {self}: {old_attempt.status} -> {self.status}")
-                
-                if old_attempt.score != self.score:
-                    logger.info(f"Score changed for {self}: {old_attempt.score} -> {self.score}")
-            except ExamAttempt.DoesNotExist:
-                logger.warning(f"Could not find existing attempt with pk={self.pk} for comparison")
+        changes = self.changed_fields
+        if 'status' in changes:
+            old_status, new_status = changes['status']
+            logger.info("Status changed for %s: %s -> %s", self, old_status, new_status)
+        
+        if 'score' in changes:
+            old_score, new_score = changes['score']
+            logger.info("Score changed for %s: %s -> %s", self, old_score, new_score)
         
         super().save(*args, **kwargs)
-        logger.info(f"ExamAttempt saved successfully: {self}")
+        logger.info("ExamAttempt saved successfully: %s", self)
 
 
 class Answer(models.Model):
@@ -480,11 +715,11 @@ class Answer(models.Model):
         unique_together = ['exam_attempt', 'question']
 
     def __str__(self):
-        logger.debug(f"Answer.__str__ called for answer_id={self.id}")
+        logger.debug("Answer.__str__ called for answer_id=%s", self.id)
         return f"Answer for {self.question.question_text[:50]}"
 
 
-class FeeTransaction(models.Model):
+class FeeTransaction(DirtyFieldsMixin, models.Model):
     """
     Fee transactions for courses.
     """
@@ -519,33 +754,65 @@ class FeeTransaction(models.Model):
     transaction_id = models.CharField(max_length=100, blank=True, null=True)
     description = models.TextField(blank=True, null=True)
     transaction_date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'fee_transactions'
         ordering = ['-transaction_date']
+        indexes = [
+            # Keyset pagination order
+            models.Index(fields=['-transaction_date', '-id'], name='fee_tx_date_id_idx'),
+            # Revenue and pending payment totals by status over a date range
+            models.Index(fields=['payment_status', 'transaction_date'], name='fee_tx_status_date_idx'),
+        ]
 
     def __str__(self):
-        logger.debug(f"FeeTransaction.__str__ called for transaction_id={self.id}")
+        logger.debug("FeeTransaction.__str__ called for transaction_id=%s", self.id)
         return f"{self.student.username} - {self.amount} - {self.transaction_type}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"FeeTransaction.save called for transaction_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Student: {self.student.username}, Type: {self.transaction_type}, Amount: ${self.amount}")
+        logger.info("FeeTransaction.save called for transaction_id=%s", self.id if self.id else 'NEW')
+        logger.info("Student: %s, Type: %s, Amount: $%s", self.student.username, self.transaction_type, self.amount)
         
         # Log payment status changes
-        if self.pk:  # Existing transaction
-            try:
-                old_transaction = FeeTransaction.objects.get(pk=self.pk)
-                if old_transaction.payment_status != self.payment_status:
-                    logger.info(f"Payment status changed for {self}: {old_transaction.payment_status} -> {self.payment_status}")
-            except FeeTransaction.DoesNotExist:
-                logger.warning(f"Could not find existing transaction with pk={self.pk} for comparison")
+        changes = self.changed_fields
+        if 'payment_status' in changes:
+            old_status, new_status = changes['payment_status']
+            logger.info("Payment status changed for %s: %s -> %s", self, old_status, new_status)
         
-        super().save(*args, **kwargs)
-        logger.info(f"FeeTransaction saved successfully: {self}")
-
-
-class TeacherSalary(models.Model):
+        previous_rollup = self.rollup_state(loaded=True) if not self._state.adding else None
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_rollups(previous_rollup, self.rollup_state())
+        logger.info("FeeTransaction saved successfully: %s", self)
+
+    def rollup_state(self, loaded=False):
+        """
+        Return (date, transaction_type, amount) counted in DailyRevenueStat,
+        or None when the transaction is not completed.
+        """
+        status, transaction_date, transaction_type, amount = _rollup_values(
+            self, ['payment_status', 'transaction_date', 'transaction_type', 'amount'], loaded
+        )
+        if status != 'completed':
+            return None
+        return _rollup_date(transaction_date), transaction_type, self._meta.get_field('amount').to_python(amount)
+
+    @staticmethod
+    def update_rollups(previous_state, new_state):
+        """Move this transaction's revenue between DailyRevenueStat rows."""
+        if previous_state == new_state:
+            return
+        for state, sign in ((previous_state, -1), (new_state, 1)):
+            if state is not None and state[0] is not None:
+                day, transaction_type, amount = state
+                DailyRevenueStat.bump(
+                    {'date': day, 'transaction_type': transaction_type},
+                    amount=sign * amount, transactions=sign
+                )
+
+
+class TeacherSalary(DirtyFieldsMixin, models.Model):
     """
     Teacher salary management.
     """
@@ -574,30 +841,27 @@ class TeacherSalary(models.Model):
         ordering = ['-month']
 
     def __str__(self):
-        logger.debug(f"TeacherSalary.__str__ called for salary_id={self.id}")
+        logger.debug("TeacherSalary.__str__ called for salary_id=%s", self.id)
         return f"{self.teacher.username} - {self.month.strftime('%B %Y')}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"TeacherSalary.save called for salary_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Teacher: {self.teacher.username}, Month: {self.month}, Total: ${self.total_salary}")
+        logger.info("TeacherSalary.save called for salary_id=%s", self.id if self.id else 'NEW')
+        logger.info("Teacher: %s, Month: %s, Total: $%s", self.teacher.username, self.month, self.total_salary)
         
         # Calculate total salary
         self.total_salary = self.base_salary + self.bonus - self.deductions
         
         # Log payment status changes
-        if self.pk:  # Existing salary
-            try:
-                old_salary = TeacherSalary.objects.get(pk=self.pk)
-                if old_salary.payment_status != self.payment_status:
-                    logger.info(f"Payment status changed for {self}: {old_salary.payment_status} -> {self.payment_status}")
-            except TeacherSalary.DoesNotExist:
-                logger.warning(f"Could not find existing salary with pk={self.pk} for comparison")
+        changes = self.changed_fields
+        if 'payment_status' in changes:
+            old_status, new_status = changes['payment_status']
+            logger.info("Payment status changed for %s: %s -> %s", self, old_status, new_status)
         
         super().save(*args, **kwargs)
-        logger.info(f"TeacherSalary saved successfully: {self}")
+        logger.info("TeacherSalary saved successfully: %s", self)
 
 
-class StudentProgress(models.Model):
+class StudentProgress(DirtyFieldsMixin, models.Model):
     """
     Student progress tracking.
     """
@@ -632,14 +896,18 @@ class StudentProgress(models.Model):
         db_table = 'student_progress'
         unique_together = ['student', 'course', 'week_number']
         ordering = ['week_number']
+        indexes = [
+            # A course's progress by week (teachers); student lookups use the unique index
+            models.Index(fields=['course', 'week_number'], name='progress_course_week_idx'),
+        ]
 
     def __str__(self):
-        logger.debug(f"StudentProgress.__str__ called for progress_id={self.id}")
+        logger.debug("StudentProgress.__str__ called for progress_id=%s", self.id)
         return f"{self.student.username} - Week {self.week_number} - {self.course.title}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"StudentProgress.save called for progress_id={self.id if self.id else 'NEW'}")
-        logger.info(f"Student: {self.student.username}, Course: {self.course.title}, Week: {self.week_number}")
+        logger.info("StudentProgress.save called for progress_id=%s", self.id if self.id else 'NEW')
+        logger.info("Student: %s, Course: %s, Week: %s", self.student.username, self.course.title, self.week_number)
         
         # Calculate overall score
         scores = []
@@ -656,16 +924,13 @@ class StudentProgress(models.Model):
             self.overall_score = self.attendance_percentage
         
         # Log score changes
-        if self.pk:  # Existing progress
-            try:
-                old_progress = StudentProgress.objects.get(pk=self.pk)
-                if old_progress.overall_score != self.overall_score:
-                    logger.info(f"Overall score changed for {self}: {old_progress.overall_score}% -> {self.overall_score}%")
-            except StudentProgress.DoesNotExist:
-                logger.warning(f"Could not find existing progress with pk={self.pk} for comparison")
+        changes = self.changed_fields
+        if 'overall_score' in changes:
+            old_score, new_score = changes['overall_score']
+            logger.info("Overall score changed for %s: %s%% -> %s%%", self, old_score, new_score)
         
         super().save(*args, **kwargs)
-        logger.info(f"StudentProgress saved successfully: {self}")
+        logger.info("StudentProgress saved successfully: %s", self)
 
 
 class FileUpload(models.Model):
@@ -693,16 +958,127 @@ class FileUpload(models.Model):
     class Meta:
         db_table = 'file_uploads'
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination order
+            models.Index(fields=['-created_at', '-id'], name='file_upload_created_id_idx'),
+        ]
 
     def __str__(self):
-        logger.debug(f"FileUpload.__str__ called for file_id={self.id}")
+        logger.debug("FileUpload.__str__ called for file_id=%s", self.id)
         return f"{self.file_name} - {self.file_type}"
 
     def save(self, *args, **kwargs):
-        logger.info(f"FileUpload.save called for file_id={self.id if self.id else 'NEW'}")
+        logger.info("FileUpload.save called for file_id=%s", self.id if self.id else 'NEW')
         if not self.file_name and self.file:
             self.file_name = os.path.basename(self.file.name)
         if not self.file_size and self.file:
             self.file_size = self.file.size
         super().save(*args, **kwargs) 
-        logger.info(f"FileUpload saved successfully: {self}") 
\ No newline at end of file
+        logger.info("FileUpload saved successfully: %s", self)
+
+
+class DailyRollup(models.Model):
+    """
+    Base for pre-aggregated per-day tables.
+
+    Rows are kept up to date incrementally by the save()/delete paths of the
+    models they summarize. QuerySet.update() and bulk_create() bypass those
+    paths; run the rebuild_rollups management command after such bulk changes.
+    """
+    date = models.DateField()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def bump(cls, keys, **deltas):
+        """
+        Add deltas to the row identified by keys in a single UPDATE, creating
+        the row on first use. Decrements never create rows, so a row that was
+        already removed (e.g. by a cascade) is left alone.
+        """
+        deltas = {name: value for name, value in deltas.items() if value}
+        if not deltas:
+            return
+        updates = {name: F(name) + value for name, value in deltas.items()}
+        if cls.objects.filter(**keys).update(**updates):
+            return
+        if not any(value > 0 for value in deltas.values()):
+            return
+        row, created = cls.objects.get_or_create(**keys, defaults=deltas)
+        if not created:
+            # Lost a race with a concurrent insert
+            cls.objects.filter(pk=row.pk).update(**updates)
+
+
+class DailyEnrollmentStat(DailyRollup):
+    """
+    Enrollments per course per day, by enrollment date.
+    """
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='daily_enrollment_stats')
+    enrollments = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_enrollment_stats'
+        unique_together = ['date', 'course']
+        ordering = ['date']
+
+    @classmethod
+    def rebuild(cls):
+        """Recompute every row from the enrollments table. Returns rows written."""
+        rows = Enrollment.objects.annotate(day=TruncDate('enrolled_at')).order_by().values(
+            'day', 'course_id'
+        ).annotate(total=Count('id'))
+        cls.objects.all().delete()
+        return len(cls.objects.bulk_create(
+            cls(date=row['day'], course_id=row['course_id'], enrollments=row['total']) for row in rows
+        ))
+
+
+class DailyRevenueStat(DailyRollup):
+    """
+    Completed fee transaction revenue per transaction type per day.
+    """
+    transaction_type = models.CharField(max_length=20, choices=FeeTransaction.TRANSACTION_TYPE_CHOICES)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    transactions = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_revenue_stats'
+        unique_together = ['date', 'transaction_type']
+        ordering = ['date']
+
+    @classmethod
+    def rebuild(cls):
+        """Recompute every row from the fee transactions table. Returns rows written."""
+        rows = FeeTransaction.objects.filter(payment_status='completed').annotate(
+            day=TruncDate('transaction_date')
+        ).order_by().values('day', 'transaction_type').annotate(total=Sum('amount'), count=Count('id'))
+        cls.objects.all().delete()
+        return len(cls.objects.bulk_create(
+            cls(date=row['day'], transaction_type=row['transaction_type'], amount=row['total'], transactions=row['count'])
+            for row in rows
+        ))
+
+
+class DailyStudentStat(DailyRollup):
+    """
+    New student accounts per day, by account creation date.
+    """
+    new_students = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_student_stats'
+        unique_together = ['date']
+        ordering = ['date']
+
+    @classmethod
+    def rebuild(cls):
+        """Recompute every row from the users table. Returns rows written."""
+        rows = User.objects.filter(role='student').annotate(day=TruncDate('created_at')).order_by().values(
+            'day'
+        ).annotate(total=Count('id'))
+        cls.objects.all().delete()
+        return len(cls.objects.bulk_create(
+            cls(date=row['day'], new_students=row['total']) for row in rows
+        ))
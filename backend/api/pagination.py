@@ -0,0 +1,181 @@
+import hashlib
+import json
+import logging
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .caching import get_or_compute
+
+# Get logger for pagination
+logger = logging.getLogger('api.pagination')
+
+
+def approximate_count(queryset):
+    """
+    Row count of queryset, cached for PAGINATION_COUNT_CACHE_TIMEOUT seconds.
+
+    Counts may lag recent writes by up to the timeout, in exchange for not
+    running COUNT(*) on every page of a large table.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.md5(f"{sql}|{params!r}".encode()).hexdigest()
+    timeout = getattr(settings, 'PAGINATION_COUNT_CACHE_TIMEOUT', 60)
+    return get_or_compute(f"pagination:count:{digest}", queryset.count, timeout)
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Page-number pagination with opt-in keyset (cursor) pagination.
+
+    Views set `cursor_ordering` to a (field, tiebreaker) pair such as
+    ('-transaction_date', '-id'). Requests without `?pagination=cursor` or
+    a `cursor` parameter are paginated by page number exactly as before;
+    `?page_size=` (up to max_cursor_page_size) is only read in cursor mode.
+
+    In cursor mode the page is selected with a range condition on the
+    ordering columns instead of OFFSET, so every page costs the same as the
+    first, and no COUNT(*) is run unless `?count=true` asks for one; that
+    count is approximate (see approximate_count). `?ordering=` is ignored
+    in cursor mode because the cursor encodes positions in cursor_ordering.
+    """
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    count_query_param = 'count'
+    # Only cursor mode lets the client choose the page size; page numbers
+    # keep PAGE_SIZE as before
+    cursor_page_size_query_param = 'page_size'
+    max_cursor_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = getattr(view, 'cursor_ordering', None)
+        self.cursor_mode = bool(ordering) and (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.cursor_query_param in request.query_params
+        )
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.field, self.tiebreaker = ordering
+
+        position, reverse = self.decode_cursor(request, queryset)
+        self.count = approximate_count(queryset) if self.count_requested(request) else None
+
+        order = [self.field, self.tiebreaker]
+        if reverse:
+            order = [self.invert(name) for name in order]
+        queryset = queryset.order_by(*order)
+        if position is not None:
+            queryset = queryset.filter(self.after(position, reverse))
+
+        # One extra row tells us whether there is a page beyond this one
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        first, last = (results[0], results[-1]) if results else (None, None)
+        if reverse:
+            self.next_position = self.position_of(last) if last is not None else position
+            self.previous_position = self.position_of(first) if has_more else None
+        else:
+            self.next_position = self.position_of(last) if has_more else None
+            self.previous_position = self.position_of(first) if position is not None and first is not None else None
+        return results
+
+    def get_page_size(self, request):
+        if not self.cursor_mode:
+            return super().get_page_size(request)
+        try:
+            page_size = int(request.query_params[self.cursor_page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_cursor_page_size)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        payload = {
+            'next': self.get_cursor_link(self.next_position, reverse=False),
+            'previous': self.get_cursor_link(self.previous_position, reverse=True),
+            'results': data,
+        }
+        if self.count is not None:
+            payload = {'count': self.count, **payload}
+        return Response(payload)
+
+    def get_next_link(self):
+        if not getattr(self, 'cursor_mode', False):
+            return super().get_next_link()
+        return self.get_cursor_link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if not getattr(self, 'cursor_mode', False):
+            return super().get_previous_link()
+        return self.get_cursor_link(self.previous_position, reverse=True)
+
+    def count_requested(self, request):
+        return request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes')
+
+    @staticmethod
+    def invert(name):
+        return name[1:] if name.startswith('-') else f'-{name}'
+
+    def after(self, position, reverse):
+        """
+        Rows strictly after position in the requested direction.
+
+        Written as `field <= value AND (field < value OR id < pk)` (for a
+        descending order) so the database can range-scan the ordering index.
+        """
+        value, pk = position
+        field, tiebreaker = self.field, self.tiebreaker
+        descending = field.startswith('-') != reverse
+        field, tiebreaker = field.lstrip('-'), tiebreaker.lstrip('-')
+        op = 'lt' if descending else 'gt'
+        return Q(**{f'{field}__{op}e': value}) & (
+            Q(**{f'{field}__{op}': value}) | Q(**{f'{tiebreaker}__{op}': pk})
+        )
+
+    def position_of(self, instance):
+        return (
+            getattr(instance, self.field.lstrip('-')),
+            getattr(instance, self.tiebreaker.lstrip('-')),
+        )
+
+    def get_cursor_link(self, position, reverse):
+        if position is None:
+            return None
+        value, pk = position
+        token = json.dumps([value.isoformat() if hasattr(value, 'isoformat') else value, pk, int(reverse)])
+        cursor = urlsafe_b64encode(token.encode()).decode().rstrip('=')
+        url = remove_query_param(self.base_url, self.mode_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, queryset):
+        """Return ((value, pk), reverse) from the cursor parameter, or (None, False)."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            token = urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)).decode()
+            value, pk, reverse = json.loads(token)
+            model_field = queryset.model._meta.get_field(self.field.lstrip('-'))
+            tiebreaker_field = queryset.model._meta.get_field(self.tiebreaker.lstrip('-'))
+            position = (model_field.to_python(value), tiebreaker_field.to_python(pk))
+        except Exception:
+            logger.debug("Rejected invalid cursor %r", encoded)
+            raise NotFound('Invalid cursor')
+        return position, bool(reverse)
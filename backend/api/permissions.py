@@ -12,15 +12,15 @@ class IsTeacherOrAdmin(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsTeacherOrAdmin.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsTeacherOrAdmin.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role in ['teacher', 'admin']
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
 
 
@@ -30,15 +30,15 @@ class IsEnrolledStudentOrTeacher(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsEnrolledStudentOrTeacher.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsEnrolledStudentOrTeacher.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role in ['student', 'teacher', 'admin']
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
 
 
@@ -48,23 +48,23 @@ class IsCourseTeacherOrAdmin(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsCourseTeacherOrAdmin.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsCourseTeacherOrAdmin.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role in ['teacher', 'admin']
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
     
     def has_object_permission(self, request, view, obj):
-        logger.debug(f"IsCourseTeacherOrAdmin.has_object_permission called for user: {request.user.username}")
-        logger.debug(f"Object type: {type(obj).__name__}, Object ID: {obj.id}")
+        logger.debug("IsCourseTeacherOrAdmin.has_object_permission called for user: %s", request.user.username)
+        logger.debug("Object type: %s, Object ID: %s", type(obj).__name__, obj.id)
         
         if request.user.role == 'admin':
-            logger.info(f"Admin permission granted for user {request.user.username}")
+            logger.info("Admin permission granted for user %s", request.user.username)
             return True
         
         if request.user.role == 'teacher':
@@ -74,14 +74,14 @@ class IsCourseTeacherOrAdmin(BasePermission):
             elif hasattr(obj, 'teacher'):
                 course = obj
             else:
-                logger.warning(f"Object does not have course or teacher attribute: {obj}")
+                logger.warning("Object does not have course or teacher attribute: %s", obj)
                 return False
             
             is_teacher = course.teacher == request.user
-            logger.info(f"Teacher permission {'granted' if is_teacher else 'denied'} for user {request.user.username} on course {course.title}")
+            logger.info("Teacher permission %s for user %s on course %s", 'granted' if is_teacher else 'denied', request.user.username, course.title)
             return is_teacher
         
-        logger.warning(f"Permission denied for user {request.user.username} (role: {request.user.role})")
+        logger.warning("Permission denied for user %s (role: %s)", request.user.username, request.user.role)
         return False
 
 
@@ -91,23 +91,23 @@ class IsOwnerOrAdmin(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsOwnerOrAdmin.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsOwnerOrAdmin.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role in ['student', 'teacher', 'admin']
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
     
     def has_object_permission(self, request, view, obj):
-        logger.debug(f"IsOwnerOrAdmin.has_object_permission called for user: {request.user.username}")
-        logger.debug(f"Object type: {type(obj).__name__}, Object ID: {obj.id}")
+        logger.debug("IsOwnerOrAdmin.has_object_permission called for user: %s", request.user.username)
+        logger.debug("Object type: %s, Object ID: %s", type(obj).__name__, obj.id)
         
         if request.user.role == 'admin':
-            logger.info(f"Admin permission granted for user {request.user.username}")
+            logger.info("Admin permission granted for user %s", request.user.username)
             return True
         
         # Check if the user is the owner of the object
@@ -122,11 +122,11 @@ class IsOwnerOrAdmin(BasePermission):
         elif hasattr(obj, 'uploaded_by'):
             owner = obj.uploaded_by
         else:
-            logger.warning(f"Object does not have user, student, teacher, created_by, or uploaded_by attribute: {obj}")
+            logger.warning("Object does not have user, student, teacher, created_by, or uploaded_by attribute: %s", obj)
             return False
         
         is_owner = owner == request.user
-        logger.info(f"Owner permission {'granted' if is_owner else 'denied'} for user {request.user.username} on object {obj}")
+        logger.info("Owner permission %s for user %s on object %s", 'granted' if is_owner else 'denied', request.user.username, obj)
         return is_owner
 
 
@@ -136,15 +136,15 @@ class IsStudentUser(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsStudentUser.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsStudentUser.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role == 'student'
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
 
 
@@ -154,15 +154,15 @@ class IsTeacherUser(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsTeacherUser.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsTeacherUser.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role == 'teacher'
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
 
 
@@ -172,15 +172,15 @@ class IsAdminUser(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsAdminUser.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsAdminUser.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role == 'admin'
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
 
 
@@ -190,34 +190,34 @@ class IsEnrolledStudent(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsEnrolledStudent.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsEnrolledStudent.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role == 'student'
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
     
     def has_object_permission(self, request, view, obj):
-        logger.debug(f"IsEnrolledStudent.has_object_permission called for user: {request.user.username}")
-        logger.debug(f"Object type: {type(obj).__name__}, Object ID: {obj.id}")
+        logger.debug("IsEnrolledStudent.has_object_permission called for user: %s", request.user.username)
+        logger.debug("Object type: %s, Object ID: %s", type(obj).__name__, obj.id)
         
         if request.user.role != 'student':
-            logger.warning(f"Permission denied - user is not a student: {request.user.username}")
+            logger.warning("Permission denied - user is not a student: %s", request.user.username)
             return False
         
         # Check if the student is enrolled in the course
         if hasattr(obj, 'course'):
             course = obj.course
         else:
-            logger.warning(f"Object does not have course attribute: {obj}")
+            logger.warning("Object does not have course attribute: %s", obj)
             return False
         
         is_enrolled = course.enrollments.filter(student=request.user, is_active=True).exists()
-        logger.info(f"Enrollment permission {'granted' if is_enrolled else 'denied'} for student {request.user.username} on course {course.title}")
+        logger.info("Enrollment permission %s for student %s on course %s", 'granted' if is_enrolled else 'denied', request.user.username, course.title)
         return is_enrolled
 
 
@@ -227,23 +227,23 @@ class IsCourseTeacher(BasePermission):
     """
     
     def has_permission(self, request, view):
-        logger.debug(f"IsCourseTeacher.has_permission called for user: {request.user.username}")
-        logger.debug(f"User role: {request.user.role}, Is authenticated: {request.user.is_authenticated}")
+        logger.debug("IsCourseTeacher.has_permission called for user: %s", request.user.username)
+        logger.debug("User role: %s, Is authenticated: %s", request.user.role, request.user.is_authenticated)
         
         if not request.user.is_authenticated:
-            logger.warning(f"Permission denied - user not authenticated: {request.user}")
+            logger.warning("Permission denied - user not authenticated: %s", request.user)
             return False
         
         has_permission = request.user.role == 'teacher'
-        logger.info(f"Permission {'granted' if has_permission else 'denied'} for user {request.user.username} (role: {request.user.role})")
+        logger.info("Permission %s for user %s (role: %s)", 'granted' if has_permission else 'denied', request.user.username, request.user.role)
         return has_permission
     
     def has_object_permission(self, request, view, obj):
-        logger.debug(f"IsCourseTeacher.has_object_permission called for user: {request.user.username}")
-        logger.debug(f"Object type: {type(obj).__name__}, Object ID: {obj.id}")
+        logger.debug("IsCourseTeacher.has_object_permission called for user: %s", request.user.username)
+        logger.debug("Object type: %s, Object ID: %s", type(obj).__name__, obj.id)
         
         if request.user.role != 'teacher':
-            logger.warning(f"Permission denied - user is not a teacher: {request.user.username}")
+            logger.warning("Permission denied - user is not a teacher: %s", request.user.username)
             return False
         
         # Check if the user is the teacher of the course
@@ -252,9 +252,9 @@ class IsCourseTeacher(BasePermission):
         elif hasattr(obj, 'teacher'):
             course = obj
         else:
-            logger.warning(f"Object does not have course or teacher attribute: {obj}")
+            logger.warning("Object does not have course or teacher attribute: %s", obj)
             return False
         
         is_teacher = course.teacher == request.user
-        logger.info(f"Teacher permission {'granted' if is_teacher else 'denied'} for user {request.user.username} on course {course.title}")
+        logger.info("Teacher permission %s for user %s on course %s", 'granted' if is_teacher else 'denied', request.user.username, course.title)
         return is_teacher 
\ No newline at end of file
@@ -0,0 +1,72 @@
+import logging
+from django.conf import settings
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib-based classes are used instead
+    orjson = None
+
+# Get logger for renderers
+logger = logging.getLogger('api.renderers')
+
+# JSONRenderer escapes these for JavaScript (JSONP) safety; keep doing so
+_LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer backed by orjson, producing the same bytes as DRF's compact
+    output, except that float exponents are spelled 1e16 instead of 1e+16.
+
+    Native types (str, int, float, dict, list, UUID) are encoded by orjson
+    itself. Everything else, including Decimal (as a number), datetime and
+    date (ISO 8601, offset kept, UTC as 'Z') and lazy translations, goes
+    through DRF's JSONEncoder.default, so values come out exactly as with
+    the stock renderer. Indented output, ASCII-only output and payloads
+    orjson cannot encode (e.g. integers wider than 64 bits) fall back to
+    the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError as exc:
+            logger.debug("orjson could not encode the response, using the stdlib encoder: %s", exc)
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for separator, escaped in _LINE_SEPARATORS:
+            ret = ret.replace(separator, escaped)
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser backed by orjson; same results and errors as the stock parser."""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read()
+            if encoding.lower().replace('-', '') != 'utf8':
+                body = body.decode(encoding).encode('utf-8')
+            return orjson.loads(body)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,295 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from .models import Enrollment
+
+# Get logger for response caching
+logger = logging.getLogger('api.response_cache')
+
+# Validator headers stored with an entry, so hits still answer conditional requests
+VALIDATOR_HEADERS = ('ETag', 'Last-Modified')
+
+# Cache backends that are private to one process; with these the bounded
+# LRU below is used instead, since its evictions can be counted
+LOCAL_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU with per-entry expiry, bounded to max_entries.
+    Evicting the least recently used entry to make room counts as an eviction.
+    """
+
+    def __init__(self, max_entries, on_evict=None):
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout):
+        expires = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                if self.on_evict is not None:
+                    self.on_evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Rendered responses keyed by endpoint, query params, the caller's
+    visibility class and the generations of the tags the endpoint depends on.
+
+    Invalidating a tag bumps its generation, so every entry built from the
+    old generation becomes unreachable at once and simply ages out; nothing
+    has to enumerate keys. Generations and entries live in the shared Django
+    cache when one is configured. Otherwise both live in this process, in a
+    bounded LRU; other processes then only see invalidations once their
+    entries expire after RESPONSE_CACHE_TIMEOUT.
+    """
+
+    def __init__(self):
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._local = None
+        self._generations = {}
+        self._generations_lock = threading.Lock()
+
+    @property
+    def shared(self):
+        backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+        return backend not in LOCAL_CACHE_BACKENDS
+
+    @property
+    def local(self):
+        if self._local is None:
+            self._local = LRUCache(
+                getattr(settings, 'RESPONSE_CACHE_MAX_ENTRIES', 1000),
+                on_evict=lambda: self.count('evictions')
+            )
+        return self._local
+
+    def count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def generations(self, tags):
+        if self.shared:
+            values = cache.get_many([f'resp:gen:{tag}' for tag in tags])
+            return [values.get(f'resp:gen:{tag}', 0) for tag in tags]
+        return [self._generations.get(tag, 0) for tag in tags]
+
+    def invalidate(self, *tags):
+        """Make every entry that depends on any of tags unreachable."""
+        for tag in tags:
+            if self.shared:
+                key = f'resp:gen:{tag}'
+                try:
+                    cache.incr(key)
+                except ValueError:
+                    # First invalidation: no entry can hold generation 1 yet
+                    cache.add(key, 1, None)
+            else:
+                with self._generations_lock:
+                    self._generations[tag] = self._generations.get(tag, 0) + 1
+            self.count('invalidations')
+        logger.debug("Invalidated response cache tags: %s", tags)
+
+    def invalidate_on_commit(self, *tags):
+        """
+        invalidate(*tags) once the current transaction commits, or right away
+        outside one. Bumping earlier would let a concurrent request cache
+        pre-commit data under the new generation, where it would be served
+        until it expires.
+        """
+        transaction.on_commit(lambda: self.invalidate(*tags))
+
+    def key(self, endpoint, request, visibility, tags):
+        params = sorted(
+            (name, value) for name in request.query_params for value in request.query_params.getlist(name)
+        )
+        generations = self.generations(tags)
+        raw = f"{endpoint}|{visibility}|{params!r}|{list(zip(tags, generations))!r}"
+        return f"resp:{endpoint}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+    def lookup(self, key):
+        """The value stored under key, or None, without counting a hit or miss."""
+        return cache.get(key) if self.shared else self.local.get(key)
+
+    def get(self, key):
+        value = self.lookup(key)
+        self.count('hits' if value is not None else 'misses')
+        return value
+
+    def set(self, key, value, timeout=None):
+        """Store value for RESPONSE_CACHE_TIMEOUT seconds, or for timeout if shorter."""
+        default = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 60)
+        timeout = default if timeout is None else min(default, int(timeout))
+        if timeout <= 0:
+            return
+        if self.shared:
+            cache.set(key, value, timeout)
+        else:
+            self.local.set(key, value, timeout)
+
+    def snapshot(self):
+        with self._stats_lock:
+            stats = dict(self.stats)
+        total = stats.get('hits', 0) + stats.get('misses', 0)
+        return {
+            'backend': 'shared' if self.shared else 'local-lru',
+            'entries': None if self.shared else len(self.local),
+            'hits': stats.get('hits', 0),
+            'misses': stats.get('misses', 0),
+            'evictions': stats.get('evictions', 0),
+            'invalidations': stats.get('invalidations', 0),
+            'hit_rate': round(stats.get('hits', 0) / total, 4) if total else None,
+        }
+
+
+response_cache = ResponseCache()
+
+
+def student_visibility(user):
+    """
+    The visibility class of a student's active enrollment set.
+
+    It is stored in the response cache under the generation of the
+    student's `user:<pk>` tag, which every enrollment change bumps, so
+    cache hits do not query the enrollments.
+    """
+    generation, = response_cache.generations([f'user:{user.pk}'])
+    key = f'resp:visibility:{user.pk}:{generation}'
+    visibility = response_cache.lookup(key)
+    if visibility is None:
+        course_ids = sorted(
+            Enrollment.objects.filter(student=user, is_active=True).values_list('course_id', flat=True)
+        )
+        visibility = 'student:' + hashlib.md5(','.join(map(str, course_ids)).encode()).hexdigest()
+        response_cache.set(key, visibility)
+    return visibility
+
+
+def visibility_class(request):
+    """
+    What the caller is allowed to see: admins share one class, teachers
+    get one each, and students are grouped by their active enrollments.
+    Memoized on the request.
+    """
+    visibility = getattr(request, '_visibility_class', None)
+    if visibility is not None:
+        return visibility
+    user = request.user
+    role = getattr(user, 'role', None)
+    if role == 'admin':
+        visibility = 'admin'
+    elif role == 'student':
+        visibility = student_visibility(user)
+    else:
+        visibility = f'{role}:{user.pk}'
+    request._visibility_class = visibility
+    return visibility
+
+
+def entry_etag(key, content):
+    """
+    ETag of a cached entry. It depends only on what every caller sharing
+    the entry has in common (the key: endpoint, query params, visibility
+    class and tag generations) and on the bytes themselves, never on the
+    user who filled it.
+    """
+    digest = hashlib.md5(key.encode())
+    digest.update(content)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def cached_response(endpoint, tags, per_user=False):
+    """
+    Cache successful JSON GET responses of a viewset method.
+
+    tags(request) lists the invalidation tags the response depends on; see
+    ResponseCache.invalidate and the receivers in signals.py. Hits are
+    returned pre-rendered, skipping the queries, the serializer and the
+    renderer. Entries are shared by callers of the same visibility class,
+    or kept per user with per_user=True. A view can shorten an entry's
+    lifetime by setting cache_timeout (seconds) on its response.
+
+    Responses carry the entry's ETag (see entry_etag) in place of the
+    view's own, which may be specific to the user who filled the entry,
+    and answer If-None-Match with it on hits and misses alike.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            renderer = getattr(request, 'accepted_renderer', None)
+            if request.method != 'GET' or renderer is None or renderer.format != 'json':
+                return view_method(self, request, *args, **kwargs)
+
+            visibility = f'user:{request.user.pk}' if per_user else visibility_class(request)
+            key = response_cache.key(endpoint, request, visibility, tags(request))
+            cached = response_cache.get(key)
+            if cached is not None:
+                content, content_type, validators = cached
+                response = HttpResponse(content, content_type=content_type)
+                for header, value in validators.items():
+                    response[header] = value
+                return get_conditional_response(
+                    request,
+                    etag=validators.get('ETag'),
+                    last_modified=parse_http_date_safe(validators.get('Last-Modified')),
+                    response=response,
+                )
+
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            # Render now, exactly as dispatch() would, so the bytes can be stored
+            response = self.finalize_response(request, response, *args, **kwargs)
+            response.render()
+            response['ETag'] = entry_etag(key, response.content)
+            validators = {header: response[header] for header in VALIDATOR_HEADERS if response.has_header(header)}
+            response_cache.set(
+                key, (response.content, response['Content-Type'], validators), getattr(response, 'cache_timeout', None)
+            )
+            return get_conditional_response(
+                request,
+                etag=validators['ETag'],
+                last_modified=parse_http_date_safe(validators.get('Last-Modified')),
+                response=response,
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,176 @@
+import logging
+import re
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from rest_framework.filters import SearchFilter
+
+from .models import Course, StudyMaterial
+
+# Get logger for search
+logger = logging.getLogger('api.search')
+
+# FTS5 table created by migration 0011
+SEARCH_TABLE = 'search_index'
+
+# Indexed documents: kind -> (model, title field, body fields)
+DOCUMENTS = {
+    'course': (Course, 'title', ('description', 'syllabus', 'prerequisites')),
+    'material': (StudyMaterial, 'title', ('description',)),
+}
+SEARCH_KINDS = {model: kind for kind, (model, title, body) in DOCUMENTS.items()}
+INDEXED_FIELDS = {model: {title, *body} for model, title, body in DOCUMENTS.values()}
+
+# A document's FTS rowid is derived from its kind and primary key, so it can
+# be replaced or deleted by rowid instead of scanning the UNINDEXED columns.
+# Migration 0011 derives the same rowids; changing these needs a migration
+# that renumbers the index.
+KIND_CODES = {'course': 1, 'material': 2}
+ROWID_STRIDE = 8
+
+# Column weights for bm25(): kind and object_id are not searched, a title
+# hit outranks a body hit
+_BM25_WEIGHTS = '0.0, 0.0, 10.0, 1.0'
+# Snippet markers: control characters stripped from indexed text, so they
+# survive HTML escaping and are swapped for <mark> afterwards
+_MARK_START, _MARK_END = '\x02', '\x03'
+_STRIP_MARKS = {ord(_MARK_START): None, ord(_MARK_END): None}
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+def search_available():
+    """The FTS5 index only exists on SQLite; other backends fall back to LIKE search."""
+    return connection.vendor == 'sqlite'
+
+
+def document_rowid(kind, object_id):
+    return int(object_id) * ROWID_STRIDE + KIND_CODES[kind]
+
+
+def _document(kind, instance):
+    model, title, body = DOCUMENTS[kind]
+    text = '\n'.join(filter(None, (getattr(instance, name) for name in body)))
+    return (getattr(instance, title) or '').translate(_STRIP_MARKS), text.translate(_STRIP_MARKS)
+
+
+def index_object(kind, instance):
+    """Add or replace one object in the search index."""
+    if not search_available():
+        return
+    title, body = _document(kind, instance)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, kind, object_id, title, body) "
+            f"VALUES (%s, %s, %s, %s, %s)",
+            [document_rowid(kind, instance.pk), kind, instance.pk, title, body]
+        )
+
+
+def remove_object(kind, object_id):
+    """Drop one object from the search index."""
+    if not search_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [document_rowid(kind, object_id)])
+
+
+def rebuild_index():
+    """Re-index every course and study material. Returns the number of documents."""
+    if not search_available():
+        return 0
+    rows = []
+    for kind, (model, title, body) in DOCUMENTS.items():
+        for instance in model.objects.only('pk', title, *body).iterator():
+            rows.append([document_rowid(kind, instance.pk), kind, instance.pk, *_document(kind, instance)])
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, kind, object_id, title, body) VALUES (%s, %s, %s, %s, %s)", rows
+        )
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+    return len(rows)
+
+
+def match_expression(text):
+    """
+    Turn free text into an FTS5 query: every word must match, the last one
+    as a prefix so results update while typing. Words are quoted, so FTS5
+    operators in user input are matched literally.
+    """
+    tokens = _TOKEN.findall(text)
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"' for token in tokens) + '*'
+
+
+def search(text, kind=None, limit=None):
+    """
+    Ranked matches for text, best first, as dicts with kind, id, rank and
+    an HTML snippet (matches wrapped in <mark>, everything else escaped).
+    """
+    expression = match_expression(text)
+    if expression is None or not search_available():
+        return []
+    limit = limit or getattr(settings, 'SEARCH_MAX_RESULTS', 500)
+    sql = (
+        f"SELECT kind, object_id, bm25({SEARCH_TABLE}, {_BM25_WEIGHTS}) AS rank, "
+        f"snippet({SEARCH_TABLE}, -1, '{_MARK_START}', '{_MARK_END}', '...', 16) "
+        f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s"
+    )
+    params = [expression]
+    if kind is not None:
+        sql += " AND kind = %s"
+        params.append(kind)
+    sql += " ORDER BY rank LIMIT %s"
+    params.append(limit)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    logger.debug("Search %r matched %d documents", expression, len(rows))
+    return [
+        {
+            'kind': row_kind,
+            'id': int(object_id),
+            'rank': rank,
+            'snippet': escape(snippet).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>'),
+        }
+        for row_kind, object_id, rank, snippet in rows
+    ]
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    SearchFilter answered from the FTS5 index for views that set
+    `search_kind`: `?search=` keeps the matching rows of the view's
+    queryset, most relevant first. Other views and backends keep the
+    LIKE-based search over `search_fields`.
+
+    The MATCH is a subquery of the view's already filtered queryset, so
+    the visibility filters and pagination run in the same query and no
+    match is cut off by SEARCH_MAX_RESULTS.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        kind = getattr(view, 'search_kind', None)
+        text = request.query_params.get(self.search_param, '')
+        if kind is None or not search_available():
+            return super().filter_queryset(request, queryset, view)
+        expression = match_expression(text)
+        if expression is None:
+            return queryset
+
+        quote = connection.ops.quote_name
+        meta = queryset.model._meta
+        matches = RawSQL(
+            f"SELECT object_id FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND kind = %s",
+            (expression, kind)
+        )
+        # Ranks only the rows left after filtering, each looked up by its rowid
+        rank = RawSQL(
+            f"SELECT bm25({SEARCH_TABLE}, {_BM25_WEIGHTS}) FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s AND rowid = "
+            f"{quote(meta.db_table)}.{quote(meta.pk.column)} * {ROWID_STRIDE} + {KIND_CODES[kind]}",
+            (expression,)
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank).order_by('search_rank', 'pk')
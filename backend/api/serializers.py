@@ -2,68 +2,157 @@ import logging
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from django.utils.module_loading import import_string
 from .models import (
     User, Course, Enrollment, WeeklyDetail, StudyMaterial, 
     Exam, Question, QuestionOption, ExamAttempt, FeeTransaction,
     TeacherSalary, StudentProgress, FileUpload
 )
+from .timing import add_serializer_time
 
 # Get logger for serializers
 logger = logging.getLogger('api.serializers')
 
 
-class UserSerializer(serializers.ModelSerializer):
+class EagerLoadingMixin:
+    """
+    Lets a serializer declare the relations it reads through `source=`.
+
+    Set `select_related` and/or `prefetch_related` on Meta; views pass their
+    querysets through setup_eager_loading() so list endpoints load those
+    relations up front instead of issuing one query per row. Time spent in
+    to_representation() is charged to the request's serializer phase.
+    """
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        meta = getattr(cls, 'Meta', None)
+        select_related = getattr(meta, 'select_related', None)
+        prefetch_related = getattr(meta, 'prefetch_related', None)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    def to_representation(self, instance):
+        return add_serializer_time(super().to_representation, instance)
+
+
+def select_fields(names, fields=None, omit=None):
+    """The names kept by a `fields` allow-list and an `omit` deny-list, in order."""
+    return [
+        name for name in names
+        if (fields is None or name in fields) and (omit is None or name not in omit)
+    ]
+
+
+class SparseFieldsMixin:
+    """
+    Lets a request pick the fields it needs.
+
+    Serializers accept `fields` and `omit` (lists of field names) to prune
+    their output, and `expand` to replace a related field's primary key by
+    the nested object. Meta declares what takes part:
+
+    - `deferrable_fields`: large columns read for nothing but their own
+      output field. setup_eager_loading() defers the ones a request does
+      not output, so they are never read from the database.
+    - `expandable_fields`: field name -> (serializer class, extra
+      select_related the nested serializer needs). A dotted path string is
+      imported on first use, for serializers defined later or elsewhere.
+
+    Views pass the `?fields=`, `?omit=` and `?expand=` query parameters
+    of read requests through (see SparseFieldsViewMixin).
+    """
+
+    def __init__(self, *args, fields=None, omit=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not (fields or omit or expand):
+            return
+        expandable = getattr(self.Meta, 'expandable_fields', {})
+        for name in expand or ():
+            if name in expandable and name in self.fields:
+                serializer_class, select_related = expandable[name]
+                if isinstance(serializer_class, str):
+                    serializer_class = import_string(serializer_class)
+                self.fields[name] = serializer_class(read_only=True)
+        kept = set(select_fields(self.fields, fields, omit))
+        for name in list(self.fields):
+            if name not in kept:
+                self.fields.pop(name)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None, omit=None, expand=None):
+        queryset = super().setup_eager_loading(queryset)
+        expandable = getattr(cls.Meta, 'expandable_fields', {})
+        select_related = [
+            relation for name in expand or () if name in expandable
+            for relation in expandable[name][1]
+        ]
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if fields or omit:
+            deferrable = getattr(cls.Meta, 'deferrable_fields', [])
+            deferred = set(deferrable) - set(select_fields(deferrable, fields, omit))
+            if deferred:
+                queryset = queryset.defer(*deferred)
+        return queryset
+
+
+class UserSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """User serializer for general user operations."""
+    full_name = serializers.CharField(read_only=True)
     
     class Meta:
         model = User
         fields = [
             'id', 'username', 'email', 'first_name', 'last_name', 'role',
             'phone', 'address', 'date_of_birth', 'bio', 'is_active',
-            'created_at', 'updated_at'
+            'created_at', 'updated_at', 'full_name'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
         extra_kwargs = {
             'password': {'write_only': True}
         }
+        deferrable_fields = ['address', 'bio']
 
     def to_representation(self, instance):
-        logger.debug(f"UserSerializer.to_representation called for user_id: {instance.id}")
+        logger.debug("UserSerializer.to_representation called for user_id: %s", instance.id)
         data = super().to_representation(instance)
-        data['full_name'] = instance.full_name
-        logger.debug(f"User representation created for: {instance.username}")
+        logger.debug("User representation created for: %s", instance.username)
         return data
 
     def create(self, validated_data):
-        logger.info(f"UserSerializer.create called with data: {validated_data}")
+        logger.info("UserSerializer.create called with data: %s", validated_data)
         password = validated_data.pop('password', None)
         user = super().create(validated_data)
         
         if password:
-            logger.debug(f"Setting password for user: {user.username}")
+            logger.debug("Setting password for user: %s", user.username)
             user.set_password(password)
             user.save()
         
-        logger.info(f"User created successfully: {user.username} (ID: {user.id})")
+        logger.info("User created successfully: %s (ID: %s)", user.username, user.id)
         return user
 
     def update(self, instance, validated_data):
-        logger.info(f"UserSerializer.update called for user_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("UserSerializer.update called for user_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         
         password = validated_data.pop('password', None)
         user = super().update(instance, validated_data)
         
         if password:
-            logger.debug(f"Updating password for user: {user.username}")
+            logger.debug("Updating password for user: %s", user.username)
             user.set_password(password)
             user.save()
         
-        logger.info(f"User updated successfully: {user.username}")
+        logger.info("User updated successfully: %s", user.username)
         return user
 
     def validate_username(self, value):
-        logger.debug(f"UserSerializer.validate_username called with value: {value}")
+        logger.debug("UserSerializer.validate_username called with value: %s", value)
         # Get the current instance (for updates) or None (for creates)
         instance = getattr(self, 'instance', None)
         
@@ -71,18 +160,18 @@ class UserSerializer(serializers.ModelSerializer):
         if instance:
             # Update case - exclude current user
             if User.objects.filter(username=value).exclude(pk=instance.pk).exists():
-                logger.warning(f"Username already exists: {value}")
+                logger.warning("Username already exists: %s", value)
                 raise serializers.ValidationError("Username already exists.")
         else:
             # Create case - check if username exists
             if User.objects.filter(username=value).exists():
-                logger.warning(f"Username already exists: {value}")
+                logger.warning("Username already exists: %s", value)
                 raise serializers.ValidationError("Username already exists.")
         
         return value
 
     def validate_email(self, value):
-        logger.debug(f"UserSerializer.validate_email called with value: {value}")
+        logger.debug("UserSerializer.validate_email called with value: %s", value)
         # Get the current instance (for updates) or None (for creates)
         instance = getattr(self, 'instance', None)
         
@@ -90,41 +179,51 @@ class UserSerializer(serializers.ModelSerializer):
         if instance:
             # Update case - exclude current user
             if User.objects.filter(email=value).exclude(pk=instance.pk).exists():
-                logger.warning(f"Email already exists: {value}")
+                logger.warning("Email already exists: %s", value)
                 raise serializers.ValidationError("Email already exists.")
         else:
             # Create case - check if email exists
             if User.objects.filter(email=value).exists():
-                logger.warning(f"Email already exists: {value}")
+                logger.warning("Email already exists: %s", value)
                 raise serializers.ValidationError("Email already exists.")
         
         return value
 
 
+class UserSummarySerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    """Public profile of a user, used when another object expands a user field."""
+    full_name = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'first_name', 'last_name', 'full_name', 'role']
+        read_only_fields = fields
+
+
 class LoginSerializer(serializers.Serializer):
     """Serializer for user login."""
     username = serializers.CharField()
     password = serializers.CharField(write_only=True)
 
     def validate(self, attrs):
-        logger.info(f"LoginSerializer.validate called for username: {attrs.get('username')}")
+        logger.info("LoginSerializer.validate called for username: %s", attrs.get('username'))
         
         username = attrs.get('username')
         password = attrs.get('password')
         
         if username and password:
-            logger.debug(f"Attempting authentication for user: {username}")
+            logger.debug("Attempting authentication for user: %s", username)
             user = authenticate(username=username, password=password)
             
             if user:
-                logger.info(f"Authentication successful for user: {username}")
+                logger.info("Authentication successful for user: %s", username)
                 if not user.is_active:
-                    logger.warning(f"Login attempt for inactive user: {username}")
+                    logger.warning("Login attempt for inactive user: %s", username)
                     raise serializers.ValidationError("User account is disabled.")
                 attrs['user'] = user
                 return attrs
             else:
-                logger.warning(f"Authentication failed for user: {username}")
+                logger.warning("Authentication failed for user: %s", username)
                 raise serializers.ValidationError("Invalid credentials.")
         else:
             logger.warning("Login attempt with missing credentials")
@@ -133,7 +232,7 @@ class LoginSerializer(serializers.Serializer):
         return attrs
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Course serializer."""
     teacher_name = serializers.CharField(source='teacher.full_name', read_only=True)
     enrolled_students_count = serializers.IntegerField(read_only=True)
@@ -147,28 +246,31 @@ class CourseSerializer(serializers.ModelSerializer):
             'is_active', 'enrolled_students_count', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        select_related = ['teacher']
+        deferrable_fields = ['description', 'syllabus', 'prerequisites', 'schedule_info']
+        expandable_fields = {'teacher': (UserSummarySerializer, [])}
 
     def to_representation(self, instance):
-        logger.debug(f"CourseSerializer.to_representation called for course_id: {instance.id}")
+        logger.debug("CourseSerializer.to_representation called for course_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Course representation created for: {instance.title}")
+        logger.debug("Course representation created for: %s", instance.title)
         return data
 
     def create(self, validated_data):
-        logger.info(f"CourseSerializer.create called with data: {validated_data}")
+        logger.info("CourseSerializer.create called with data: %s", validated_data)
         course = super().create(validated_data)
-        logger.info(f"Course created successfully: {course.title} (ID: {course.id})")
+        logger.info("Course created successfully: %s (ID: %s)", course.title, course.id)
         return course
 
     def update(self, instance, validated_data):
-        logger.info(f"CourseSerializer.update called for course_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("CourseSerializer.update called for course_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         course = super().update(instance, validated_data)
-        logger.info(f"Course updated successfully: {course.title}")
+        logger.info("Course updated successfully: %s", course.title)
         return course
 
 
-class EnrollmentSerializer(serializers.ModelSerializer):
+class EnrollmentSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Enrollment serializer."""
     student_name = serializers.CharField(source='student.full_name', read_only=True)
     course_title = serializers.CharField(source='course.title', read_only=True)
@@ -181,28 +283,33 @@ class EnrollmentSerializer(serializers.ModelSerializer):
             'completed_at'
         ]
         read_only_fields = ['id', 'enrolled_at', 'completed_at']
+        select_related = ['student', 'course']
+        expandable_fields = {
+            'student': (UserSummarySerializer, []),
+            'course': (CourseSerializer, ['course__teacher']),
+        }
 
     def to_representation(self, instance):
-        logger.debug(f"EnrollmentSerializer.to_representation called for enrollment_id: {instance.id}")
+        logger.debug("EnrollmentSerializer.to_representation called for enrollment_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Enrollment representation created for: {instance}")
+        logger.debug("Enrollment representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"EnrollmentSerializer.create called with data: {validated_data}")
+        logger.info("EnrollmentSerializer.create called with data: %s", validated_data)
         enrollment = super().create(validated_data)
-        logger.info(f"Enrollment created successfully: {enrollment}")
+        logger.info("Enrollment created successfully: %s", enrollment)
         return enrollment
 
     def update(self, instance, validated_data):
-        logger.info(f"EnrollmentSerializer.update called for enrollment_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("EnrollmentSerializer.update called for enrollment_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         enrollment = super().update(instance, validated_data)
-        logger.info(f"Enrollment updated successfully: {enrollment}")
+        logger.info("Enrollment updated successfully: %s", enrollment)
         return enrollment
 
 
-class WeeklyDetailSerializer(serializers.ModelSerializer):
+class WeeklyDetailSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Weekly detail serializer."""
     course_title = serializers.CharField(source='course.title', read_only=True)
 
@@ -213,28 +320,31 @@ class WeeklyDetailSerializer(serializers.ModelSerializer):
             'description', 'topics_covered', 'assignments', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+        select_related = ['course']
+        deferrable_fields = ['description', 'topics_covered', 'assignments']
+        expandable_fields = {'course': (CourseSerializer, ['course__teacher'])}
 
     def to_representation(self, instance):
-        logger.debug(f"WeeklyDetailSerializer.to_representation called for weekly_detail_id: {instance.id}")
+        logger.debug("WeeklyDetailSerializer.to_representation called for weekly_detail_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Weekly detail representation created for: {instance}")
+        logger.debug("Weekly detail representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"WeeklyDetailSerializer.create called with data: {validated_data}")
+        logger.info("WeeklyDetailSerializer.create called with data: %s", validated_data)
         weekly_detail = super().create(validated_data)
-        logger.info(f"Weekly detail created successfully: {weekly_detail}")
+        logger.info("Weekly detail created successfully: %s", weekly_detail)
         return weekly_detail
 
     def update(self, instance, validated_data):
-        logger.info(f"WeeklyDetailSerializer.update called for weekly_detail_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("WeeklyDetailSerializer.update called for weekly_detail_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         weekly_detail = super().update(instance, validated_data)
-        logger.info(f"Weekly detail updated successfully: {weekly_detail}")
+        logger.info("Weekly detail updated successfully: %s", weekly_detail)
         return weekly_detail
 
 
-class StudyMaterialSerializer(serializers.ModelSerializer):
+class StudyMaterialSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Study material serializer."""
     course_title = serializers.CharField(source='course.title', read_only=True)
     uploaded_by_name = serializers.CharField(source='uploaded_by.full_name', read_only=True)
@@ -247,28 +357,34 @@ class StudyMaterialSerializer(serializers.ModelSerializer):
             'uploaded_by', 'uploaded_by_name', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+        select_related = ['course', 'uploaded_by']
+        deferrable_fields = ['description']
+        expandable_fields = {
+            'course': (CourseSerializer, ['course__teacher']),
+            'uploaded_by': (UserSummarySerializer, []),
+        }
 
     def to_representation(self, instance):
-        logger.debug(f"StudyMaterialSerializer.to_representation called for study_material_id: {instance.id}")
+        logger.debug("StudyMaterialSerializer.to_representation called for study_material_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Study material representation created for: {instance}")
+        logger.debug("Study material representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"StudyMaterialSerializer.create called with data: {validated_data}")
+        logger.info("StudyMaterialSerializer.create called with data: %s", validated_data)
         study_material = super().create(validated_data)
-        logger.info(f"Study material created successfully: {study_material}")
+        logger.info("Study material created successfully: %s", study_material)
         return study_material
 
     def update(self, instance, validated_data):
-        logger.info(f"StudyMaterialSerializer.update called for study_material_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("StudyMaterialSerializer.update called for study_material_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         study_material = super().update(instance, validated_data)
-        logger.info(f"Study material updated successfully: {study_material}")
+        logger.info("Study material updated successfully: %s", study_material)
         return study_material
 
 
-class ExamSerializer(serializers.ModelSerializer):
+class ExamSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Exam serializer."""
     course_title = serializers.CharField(source='course.title', read_only=True)
     created_by_name = serializers.CharField(source='created_by.full_name', read_only=True)
@@ -282,28 +398,34 @@ class ExamSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+        select_related = ['course', 'created_by']
+        deferrable_fields = ['description']
+        expandable_fields = {
+            'course': (CourseSerializer, ['course__teacher']),
+            'created_by': (UserSummarySerializer, []),
+        }
 
     def to_representation(self, instance):
-        logger.debug(f"ExamSerializer.to_representation called for exam_id: {instance.id}")
+        logger.debug("ExamSerializer.to_representation called for exam_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Exam representation created for: {instance}")
+        logger.debug("Exam representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"ExamSerializer.create called with data: {validated_data}")
+        logger.info("ExamSerializer.create called with data: %s", validated_data)
         exam = super().create(validated_data)
-        logger.info(f"Exam created successfully: {exam}")
+        logger.info("Exam created successfully: %s", exam)
         return exam
 
     def update(self, instance, validated_data):
-        logger.info(f"ExamSerializer.update called for exam_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("ExamSerializer.update called for exam_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         exam = super().update(instance, validated_data)
-        logger.info(f"Exam updated successfully: {exam}")
+        logger.info("Exam updated successfully: %s", exam)
         return exam
 
 
-class QuestionSerializer(serializers.ModelSerializer):
+class QuestionSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Question serializer."""
     exam_title = serializers.CharField(source='exam.title', read_only=True)
 
@@ -314,28 +436,29 @@ class QuestionSerializer(serializers.ModelSerializer):
             'marks', 'order', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+        select_related = ['exam']
 
     def to_representation(self, instance):
-        logger.debug(f"QuestionSerializer.to_representation called for question_id: {instance.id}")
+        logger.debug("QuestionSerializer.to_representation called for question_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Question representation created for: {instance}")
+        logger.debug("Question representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"QuestionSerializer.create called with data: {validated_data}")
+        logger.info("QuestionSerializer.create called with data: %s", validated_data)
         question = super().create(validated_data)
-        logger.info(f"Question created successfully: {question}")
+        logger.info("Question created successfully: %s", question)
         return question
 
     def update(self, instance, validated_data):
-        logger.info(f"QuestionSerializer.update called for question_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("QuestionSerializer.update called for question_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         question = super().update(instance, validated_data)
-        logger.info(f"Question updated successfully: {question}")
+        logger.info("Question updated successfully: %s", question)
         return question
 
 
-class QuestionOptionSerializer(serializers.ModelSerializer):
+class QuestionOptionSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Question option serializer."""
     question_text = serializers.CharField(source='question.text', read_only=True)
 
@@ -345,28 +468,29 @@ class QuestionOptionSerializer(serializers.ModelSerializer):
             'id', 'question', 'question_text', 'text', 'is_correct', 'order'
         ]
         read_only_fields = ['id']
+        select_related = ['question']
 
     def to_representation(self, instance):
-        logger.debug(f"QuestionOptionSerializer.to_representation called for option_id: {instance.id}")
+        logger.debug("QuestionOptionSerializer.to_representation called for option_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Question option representation created for: {instance}")
+        logger.debug("Question option representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"QuestionOptionSerializer.create called with data: {validated_data}")
+        logger.info("QuestionOptionSerializer.create called with data: %s", validated_data)
         option = super().create(validated_data)
-        logger.info(f"Question option created successfully: {option}")
+        logger.info("Question option created successfully: %s", option)
         return option
 
     def update(self, instance, validated_data):
-        logger.info(f"QuestionOptionSerializer.update called for option_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("QuestionOptionSerializer.update called for option_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         option = super().update(instance, validated_data)
-        logger.info(f"Question option updated successfully: {option}")
+        logger.info("Question option updated successfully: %s", option)
         return option
 
 
-class ExamAttemptSerializer(serializers.ModelSerializer):
+class ExamAttemptSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Exam attempt serializer."""
     student_name = serializers.CharField(source='student.full_name', read_only=True)
     exam_title = serializers.CharField(source='exam.title', read_only=True)
@@ -378,28 +502,33 @@ class ExamAttemptSerializer(serializers.ModelSerializer):
             'started_at', 'completed_at', 'score', 'is_passed', 'status'
         ]
         read_only_fields = ['id', 'started_at', 'completed_at']
+        select_related = ['student', 'exam']
+        expandable_fields = {
+            'exam': (ExamSerializer, ['exam__course', 'exam__created_by']),
+            'student': (UserSummarySerializer, []),
+        }
 
     def to_representation(self, instance):
-        logger.debug(f"ExamAttemptSerializer.to_representation called for attempt_id: {instance.id}")
+        logger.debug("ExamAttemptSerializer.to_representation called for attempt_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Exam attempt representation created for: {instance}")
+        logger.debug("Exam attempt representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"ExamAttemptSerializer.create called with data: {validated_data}")
+        logger.info("ExamAttemptSerializer.create called with data: %s", validated_data)
         attempt = super().create(validated_data)
-        logger.info(f"Exam attempt created successfully: {attempt}")
+        logger.info("Exam attempt created successfully: %s", attempt)
         return attempt
 
     def update(self, instance, validated_data):
-        logger.info(f"ExamAttemptSerializer.update called for attempt_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("ExamAttemptSerializer.update called for attempt_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         attempt = super().update(instance, validated_data)
-        logger.info(f"Exam attempt updated successfully: {attempt}")
+        logger.info("Exam attempt updated successfully: %s", attempt)
         return attempt
 
 
-class FeeTransactionSerializer(serializers.ModelSerializer):
+class FeeTransactionSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Fee transaction serializer."""
     student_name = serializers.CharField(source='student.full_name', read_only=True)
     course_title = serializers.CharField(source='course.title', read_only=True)
@@ -412,28 +541,34 @@ class FeeTransactionSerializer(serializers.ModelSerializer):
             'description'
         ]
         read_only_fields = ['id', 'transaction_date']
+        select_related = ['student', 'course']
+        deferrable_fields = ['description']
+        expandable_fields = {
+            'student': (UserSummarySerializer, []),
+            'course': (CourseSerializer, ['course__teacher']),
+        }
 
     def to_representation(self, instance):
-        logger.debug(f"FeeTransactionSerializer.to_representation called for transaction_id: {instance.id}")
+        logger.debug("FeeTransactionSerializer.to_representation called for transaction_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Fee transaction representation created for: {instance}")
+        logger.debug("Fee transaction representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"FeeTransactionSerializer.create called with data: {validated_data}")
+        logger.info("FeeTransactionSerializer.create called with data: %s", validated_data)
         transaction = super().create(validated_data)
-        logger.info(f"Fee transaction created successfully: {transaction}")
+        logger.info("Fee transaction created successfully: %s", transaction)
         return transaction
 
     def update(self, instance, validated_data):
-        logger.info(f"FeeTransactionSerializer.update called for transaction_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("FeeTransactionSerializer.update called for transaction_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         transaction = super().update(instance, validated_data)
-        logger.info(f"Fee transaction updated successfully: {transaction}")
+        logger.info("Fee transaction updated successfully: %s", transaction)
         return transaction
 
 
-class TeacherSalarySerializer(serializers.ModelSerializer):
+class TeacherSalarySerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Teacher salary serializer."""
     teacher_name = serializers.CharField(source='teacher.full_name', read_only=True)
 
@@ -445,28 +580,31 @@ class TeacherSalarySerializer(serializers.ModelSerializer):
             'payment_date', 'notes', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+        select_related = ['teacher']
+        deferrable_fields = ['notes']
+        expandable_fields = {'teacher': (UserSummarySerializer, [])}
 
     def to_representation(self, instance):
-        logger.debug(f"TeacherSalarySerializer.to_representation called for salary_id: {instance.id}")
+        logger.debug("TeacherSalarySerializer.to_representation called for salary_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Teacher salary representation created for: {instance}")
+        logger.debug("Teacher salary representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"TeacherSalarySerializer.create called with data: {validated_data}")
+        logger.info("TeacherSalarySerializer.create called with data: %s", validated_data)
         salary = super().create(validated_data)
-        logger.info(f"Teacher salary created successfully: {salary}")
+        logger.info("Teacher salary created successfully: %s", salary)
         return salary
 
     def update(self, instance, validated_data):
-        logger.info(f"TeacherSalarySerializer.update called for salary_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("TeacherSalarySerializer.update called for salary_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         salary = super().update(instance, validated_data)
-        logger.info(f"Teacher salary updated successfully: {salary}")
+        logger.info("Teacher salary updated successfully: %s", salary)
         return salary
 
 
-class StudentProgressSerializer(serializers.ModelSerializer):
+class StudentProgressSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """Student progress serializer."""
     student_name = serializers.CharField(source='student.full_name', read_only=True)
     course_title = serializers.CharField(source='course.title', read_only=True)
@@ -476,31 +614,37 @@ class StudentProgressSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'student', 'student_name', 'course', 'course_title',
             'week_number', 'attendance_percentage', 'assignment_score',
-            'quiz_score', 'overall_score', 'notes', 'created_at', 'updated_at'
+            'quiz_score', 'overall_score', 'teacher_notes', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        select_related = ['student', 'course']
+        deferrable_fields = ['teacher_notes']
+        expandable_fields = {
+            'student': (UserSummarySerializer, []),
+            'course': (CourseSerializer, ['course__teacher']),
+        }
 
     def to_representation(self, instance):
-        logger.debug(f"StudentProgressSerializer.to_representation called for progress_id: {instance.id}")
+        logger.debug("StudentProgressSerializer.to_representation called for progress_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"Student progress representation created for: {instance}")
+        logger.debug("Student progress representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"StudentProgressSerializer.create called with data: {validated_data}")
+        logger.info("StudentProgressSerializer.create called with data: %s", validated_data)
         progress = super().create(validated_data)
-        logger.info(f"Student progress created successfully: {progress}")
+        logger.info("Student progress created successfully: %s", progress)
         return progress
 
     def update(self, instance, validated_data):
-        logger.info(f"StudentProgressSerializer.update called for progress_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("StudentProgressSerializer.update called for progress_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         progress = super().update(instance, validated_data)
-        logger.info(f"Student progress updated successfully: {progress}")
+        logger.info("Student progress updated successfully: %s", progress)
         return progress
 
 
-class FileUploadSerializer(serializers.ModelSerializer):
+class FileUploadSerializer(SparseFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """File upload serializer."""
     uploaded_by_name = serializers.CharField(source='uploaded_by.full_name', read_only=True)
 
@@ -511,22 +655,24 @@ class FileUploadSerializer(serializers.ModelSerializer):
             'uploaded_by', 'uploaded_by_name', 'related_model', 'related_id', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+        select_related = ['uploaded_by']
+        expandable_fields = {'uploaded_by': (UserSummarySerializer, [])}
 
     def to_representation(self, instance):
-        logger.debug(f"FileUploadSerializer.to_representation called for file_id: {instance.id}")
+        logger.debug("FileUploadSerializer.to_representation called for file_id: %s", instance.id)
         data = super().to_representation(instance)
-        logger.debug(f"File upload representation created for: {instance}")
+        logger.debug("File upload representation created for: %s", instance)
         return data
 
     def create(self, validated_data):
-        logger.info(f"FileUploadSerializer.create called with data: {validated_data}")
+        logger.info("FileUploadSerializer.create called with data: %s", validated_data)
         file_upload = super().create(validated_data)
-        logger.info(f"File upload created successfully: {file_upload}")
+        logger.info("File upload created successfully: %s", file_upload)
         return file_upload
 
     def update(self, instance, validated_data):
-        logger.info(f"FileUploadSerializer.update called for file_id: {instance.id}")
-        logger.debug(f"Update data: {validated_data}")
+        logger.info("FileUploadSerializer.update called for file_id: %s", instance.id)
+        logger.debug("Update data: %s", validated_data)
         file_upload = super().update(instance, validated_data)
-        logger.info(f"File upload updated successfully: {file_upload}")
+        logger.info("File upload updated successfully: %s", file_upload)
         return file_upload 
\ No newline at end of file
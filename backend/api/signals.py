@@ -0,0 +1,132 @@
+import logging
+from django.core.signals import request_started
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import (
+    Course, Enrollment, Exam, FeeTransaction, Question, QuestionOption, StudentProgress, StudyMaterial,
+    TeacherSalary, User, WeeklyDetail
+)
+from .grading import invalidate_answer_key
+from .db_routers import start_request
+from .search import INDEXED_FIELDS, SEARCH_KINDS, index_object, remove_object
+from .response_cache import response_cache
+
+# Get logger for signals
+logger = logging.getLogger('api.signals')
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def invalidate_question_answer_key(sender, instance, **kwargs):
+    """Invalidate the exam's answer key when a question changes."""
+    invalidate_answer_key(instance.exam_id)
+
+
+@receiver(post_save, sender=QuestionOption)
+@receiver(post_delete, sender=QuestionOption)
+def invalidate_option_answer_key(sender, instance, **kwargs):
+    """Invalidate the exam's answer key when an option changes."""
+    try:
+        exam_id = instance.question.exam_id
+    except Question.DoesNotExist:
+        # The question is being deleted too and invalidates the key itself
+        logger.debug("Question %s already deleted for option %s", instance.question_id, instance.id)
+        return
+    invalidate_answer_key(exam_id)
+
+
+@receiver(post_delete, sender=Enrollment)
+def release_enrollment_counters(sender, instance, **kwargs):
+    """Remove a deleted enrollment from its course counters, including cascades."""
+    Enrollment.update_course_counters(instance.counter_state(loaded=True), None)
+
+
+@receiver(post_delete, sender=Enrollment)
+@receiver(post_delete, sender=FeeTransaction)
+@receiver(post_delete, sender=User)
+def release_daily_rollups(sender, instance, **kwargs):
+    """Remove a deleted row from the daily rollup tables, including cascades."""
+    sender.update_rollups(instance.rollup_state(loaded=True), None)
+
+
+@receiver(request_started)
+def reset_database_routing(sender, **kwargs):
+    """Forget the previous request's writes so analytics reads may use the replica again."""
+    start_request()
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=StudyMaterial)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    """Re-index a saved course or material, unless no indexed field was written."""
+    if update_fields is not None and not INDEXED_FIELDS[sender] & set(update_fields):
+        return
+    index_object(SEARCH_KINDS[sender], instance)
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=StudyMaterial)
+def remove_from_search_index(sender, instance, **kwargs):
+    """Drop a deleted course or material from the search index, including cascades."""
+    remove_object(SEARCH_KINDS[sender], instance.pk)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_responses(sender, instance, **kwargs):
+    """Course fields appear in the course list, its weekly details, public materials and exams."""
+    response_cache.invalidate_on_commit('courses', f'course:{instance.pk}', 'materials:public', 'exams')
+
+
+@receiver(post_save, sender=WeeklyDetail)
+@receiver(post_delete, sender=WeeklyDetail)
+def invalidate_weekly_detail_responses(sender, instance, **kwargs):
+    response_cache.invalidate_on_commit(f'course:{instance.course_id}')
+
+
+@receiver(post_save, sender=StudyMaterial)
+@receiver(post_delete, sender=StudyMaterial)
+def invalidate_material_responses(sender, instance, **kwargs):
+    response_cache.invalidate_on_commit('materials:public')
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def invalidate_enrollment_responses(sender, instance, **kwargs):
+    """Enrollment counts appear in the course list; enrollments in the student's dashboard."""
+    response_cache.invalidate_on_commit('courses', f'user:{instance.student_id}')
+
+
+@receiver(post_save, sender=Exam)
+@receiver(post_delete, sender=Exam)
+def invalidate_exam_responses(sender, instance, **kwargs):
+    response_cache.invalidate_on_commit('exams')
+
+
+@receiver(post_save, sender=FeeTransaction)
+@receiver(post_delete, sender=FeeTransaction)
+@receiver(post_save, sender=StudentProgress)
+@receiver(post_delete, sender=StudentProgress)
+def invalidate_student_record_responses(sender, instance, **kwargs):
+    """Transactions and progress appear in the student's dashboard."""
+    response_cache.invalidate_on_commit(f'user:{instance.student_id}')
+
+
+@receiver(post_save, sender=TeacherSalary)
+@receiver(post_delete, sender=TeacherSalary)
+def invalidate_salary_responses(sender, instance, **kwargs):
+    response_cache.invalidate_on_commit(f'user:{instance.teacher_id}')
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_name_responses(sender, instance, update_fields=None, **kwargs):
+    """
+    Teacher and uploader names appear in the course list, public materials
+    and exams; a user's own name in their dashboard.
+    """
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+    if kwargs.get('created'):
+        return
+    response_cache.invalidate_on_commit('courses', 'materials:public', 'exams', f'user:{instance.pk}')
@@ -0,0 +1,1102 @@
+import contextvars
+import json
+import logging
+import logging.config
+import tempfile
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db.models.signals import post_save
+from django.db import connection
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from eduportal.sqlite_backend.base import DatabaseWrapper as ProductionDatabaseWrapper
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from .analytics import compute_admin_stats
+from .compiled_serializers import compiled_serializer
+from .db_routers import ANALYTICS_DB, AnalyticsReplicaRouter, analytics_reads, start_request
+from .grading import get_answer_key, regrade_exam
+from .log_handlers import AsyncQueueHandler
+from .middleware import QueryStats, endpoint_db_summary, get_loaded_user_id
+from .models import (
+    Answer, Course, DailyEnrollmentStat, DailyRevenueStat, DailyStudentStat, Enrollment, Exam, ExamAttempt,
+    FeeTransaction, Question, QuestionOption, StudentProgress, StudyMaterial, TeacherSalary, User, WeeklyDetail
+)
+from .pagination import KeysetPagination
+from .renderers import FastJSONParser, FastJSONRenderer
+from .response_cache import response_cache
+from .search import SEARCH_TABLE, document_rowid
+from .timing import RequestTimings, add_serializer_time, current_timings
+from .serializers import (
+    CourseSerializer, EnrollmentSerializer, ExamAttemptSerializer, FeeTransactionSerializer, StudentProgressSerializer,
+    TeacherSalarySerializer
+)
+
+
+def create_user(username, role, **extra):
+    return User.objects.create_user(username, f'{username}@example.com', 'password', role=role, **extra)
+
+
+def create_course(teacher, title='Algorithms'):
+    return Course.objects.create(title=title, description='Course description', teacher=teacher, fee=Decimal('100.00'))
+
+
+def create_exam(course, questions=3):
+    """An ongoing exam with one correct and one wrong option per question, one mark each."""
+    now = timezone.now()
+    exam = Exam.objects.create(
+        title='Midterm', description='Exam description', course=course, created_by=course.teacher,
+        start_time=now - timedelta(hours=1), end_time=now + timedelta(hours=1), passing_marks=2,
+    )
+    for number in range(questions):
+        question = Question.objects.create(exam=exam, question_text=f'Question {number}', marks=1, order=number)
+        QuestionOption.objects.create(question=question, option_text='Right', is_correct=True, order=1)
+        QuestionOption.objects.create(question=question, option_text='Wrong', is_correct=False, order=2)
+    return exam
+
+
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+class GradingTests(TestCase):
+    def setUp(self):
+        self.teacher = create_user('teacher', 'teacher')
+        self.student = create_user('student', 'student')
+        course = create_course(self.teacher)
+        Enrollment.objects.create(student=self.student, course=course)
+        self.exam = create_exam(course)
+        self.questions = list(self.exam.questions.order_by('order'))
+        self.client = api_client(self.student)
+
+    def option(self, question, is_correct):
+        return question.options.get(is_correct=is_correct)
+
+    def submit(self, answers):
+        self.client.post(f'/api/exams/{self.exam.id}/start_exam/')
+        return self.client.post(f'/api/exams/{self.exam.id}/submit_exam/', {'answers': answers}, format='json')
+
+    def test_submission_is_scored_against_the_answer_key(self):
+        response = self.submit([
+            {'question_id': self.questions[0].id, 'selected_option_id': self.option(self.questions[0], True).id},
+            {'question_id': self.questions[1].id, 'selected_option_id': self.option(self.questions[1], True).id},
+            {'question_id': self.questions[2].id, 'selected_option_id': self.option(self.questions[2], False).id},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['score'], 2)
+        self.assertTrue(response.data['is_passed'])
+        self.assertEqual(Answer.objects.filter(exam_attempt_id=response.data['id'], is_correct=True).count(), 2)
+
+    def test_last_answer_to_a_question_wins(self):
+        question = self.questions[0]
+        response = self.submit([
+            {'question_id': question.id, 'selected_option_id': self.option(question, True).id},
+            {'question_id': question.id, 'selected_option_id': self.option(question, False).id},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['score'], 0)
+        self.assertEqual(Answer.objects.filter(exam_attempt_id=response.data['id']).count(), 1)
+
+    def test_option_of_another_question_is_rejected(self):
+        response = self.submit([
+            {'question_id': self.questions[0].id, 'selected_option_id': self.option(self.questions[1], True).id},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Answer.objects.exists())
+
+    def test_submitting_twice_is_rejected(self):
+        answers = [{'question_id': self.questions[0].id, 'selected_option_id': self.option(self.questions[0], True).id}]
+        self.assertEqual(self.submit(answers).status_code, 200)
+        self.assertEqual(self.submit(answers).status_code, 400)
+
+    def test_regrade_applies_corrected_options(self):
+        question = self.questions[0]
+        self.submit([{'question_id': question.id, 'selected_option_id': self.option(question, False).id}])
+        attempt = ExamAttempt.objects.get(exam=self.exam, student=self.student)
+        self.assertEqual(attempt.score, 0)
+
+        # The teacher fixes the key: the option the student picked was right after all
+        wrong = self.option(question, False)
+        wrong.is_correct = True
+        wrong.save()
+
+        self.assertEqual(regrade_exam(self.exam), 1)
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.score, 1)
+        self.assertTrue(Answer.objects.get(exam_attempt=attempt).is_correct)
+        self.assertEqual(regrade_exam(self.exam), 0)
+
+    def test_results_match_the_attempt_serializer(self):
+        self.submit([{'question_id': self.questions[0].id, 'selected_option_id': self.option(self.questions[0], True).id}])
+        response = api_client(self.teacher).get(f'/api/exams/{self.exam.id}/results/')
+        self.assertEqual(response.status_code, 200)
+        expected = ExamAttemptSerializer(ExamAttempt.objects.filter(exam=self.exam), many=True).data
+        self.assertEqual(response.content, JSONRenderer().render(expected))
+
+    def test_answers_must_be_objects(self):
+        self.assertEqual(self.submit(['x']).status_code, 400)
+        self.assertEqual(self.submit('x').status_code, 400)
+
+    def test_cached_answer_key_follows_option_changes(self):
+        question = self.questions[0]
+        wrong = self.option(question, False)
+        self.assertNotIn(wrong.id, get_answer_key(self.exam.id)[question.id][2])
+
+        wrong.is_correct = True
+        wrong.save()
+        self.assertIn(wrong.id, get_answer_key(self.exam.id)[question.id][2])
+
+        # Saving an exam loaded before the change keeps the new version
+        self.exam.title = 'Final'
+        self.exam.save()
+        self.assertIn(wrong.id, get_answer_key(self.exam.id)[question.id][2])
+
+
+class DirtyFieldsTests(TestCase):
+    def setUp(self):
+        self.student = create_user('student', 'student')
+        self.course = create_course(create_user('teacher', 'teacher'))
+        self.saved = []
+        post_save.connect(self.record_save, sender=Enrollment)
+        self.addCleanup(post_save.disconnect, self.record_save, sender=Enrollment)
+
+    def record_save(self, sender, instance, update_fields=None, **kwargs):
+        self.saved.append(update_fields)
+
+    def test_only_changed_columns_are_written(self):
+        Enrollment.objects.create(student=self.student, course=self.course)
+        enrollment = Enrollment.objects.get()
+        enrollment.completion_percentage = 50
+        enrollment.save()
+        self.assertEqual(self.saved[-1], frozenset({'completion_percentage', 'updated_at'}))
+
+    def test_unchanged_save_still_sends_post_save(self):
+        Enrollment.objects.create(student=self.student, course=self.course)
+        enrollment = Enrollment.objects.get()
+        enrollment.save()
+        self.assertEqual(len(self.saved), 2)
+        self.assertEqual(self.saved[-1], frozenset({'updated_at'}))
+
+
+class EnrollmentCounterTests(TestCase):
+    def setUp(self):
+        self.course = create_course(create_user('teacher', 'teacher'))
+        self.students = [create_user(f'student{number}', 'student') for number in range(3)]
+
+    def test_counters_follow_enrollments(self):
+        enrollments = [Enrollment.objects.create(student=student, course=self.course) for student in self.students]
+        enrollments[0].rating = 4
+        enrollments[0].save()
+        enrollments[1].rating = 2
+        enrollments[1].save()
+        enrollments[1].is_active = False
+        enrollments[1].save()
+        enrollments[2].delete()
+
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.enrolled_students_count, 1)
+        self.assertEqual(self.course.average_rating, 4)
+        self.assertEqual(Course.rebuild_enrollment_counters(), 0)
+
+        Course.objects.filter(pk=self.course.pk).update(active_enrollment_count=5, rating_sum=0)
+        stale_updated_at = Course.objects.get(pk=self.course.pk).updated_at
+        self.assertEqual(Course.rebuild_enrollment_counters(), 1)
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.active_enrollment_count, self.course.rating_count, self.course.rating_sum), (1, 1, 4))
+        self.assertGreater(self.course.updated_at, stale_updated_at)
+
+    def test_rebuild_command_invalidates_cached_course_lists(self):
+        Enrollment.objects.create(student=self.students[0], course=self.course)
+        Course.objects.filter(pk=self.course.pk).update(active_enrollment_count=0)
+        generations = response_cache.generations(['courses'])
+        call_command('rebuild_course_counters', stdout=StringIO())
+        self.assertNotEqual(response_cache.generations(['courses']), generations)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.active_enrollment_count, 1)
+
+    def test_saving_a_stale_course_keeps_the_counters(self):
+        stale = Course.objects.get(pk=self.course.pk)
+        Enrollment.objects.create(student=self.students[0], course=self.course)
+
+        stale.title = 'Renamed'
+        stale.save()
+
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.title, 'Renamed')
+        self.assertEqual(self.course.active_enrollment_count, 1)
+
+
+class ListQueryCountTests(TestCase):
+    """List endpoints must not issue per-row queries for related objects."""
+
+    ENDPOINTS = [
+        '/api/users/', '/api/courses/', '/api/weekly-details/', '/api/enrollments/', '/api/study-materials/',
+        '/api/exams/', '/api/exam-attempts/', '/api/fee-transactions/',
+        '/api/teacher-salaries/', '/api/student-progress/',
+    ]
+    ROWS = 6
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = create_user('admin', 'admin', is_staff=True)
+        # Every row gets its own related objects, so a missing join shows up as extra queries
+        for number in range(cls.ROWS):
+            teacher = create_user(f'teacher{number}', 'teacher', first_name='Teacher', last_name=str(number))
+            student = create_user(f'student{number}', 'student', first_name='Student', last_name=str(number))
+            course = create_course(teacher, title=f'Course {number}')
+            exam = create_exam(course, questions=1)
+            Enrollment.objects.create(student=student, course=course)
+            ExamAttempt.objects.create(student=student, exam=exam)
+            WeeklyDetail.objects.create(course=course, week_number=1, title='Week 1', description='', topics_covered='')
+            StudyMaterial.objects.create(course=course, title='Notes', description='', uploaded_by=teacher)
+            FeeTransaction.objects.create(student=student, course=course, amount=Decimal('100.00'))
+            TeacherSalary.objects.create(
+                teacher=teacher, month=date(2026, 1, 1), base_salary=Decimal('1000.00'), total_salary=Decimal('1000.00')
+            )
+            StudentProgress.objects.create(student=student, course=course, week_number=1)
+
+    def setUp(self):
+        response_cache.local.clear()
+        self.client = api_client(self.admin)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return len(queries), response
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        for endpoint in self.ENDPOINTS:
+            with self.subTest(endpoint=endpoint):
+                with mock.patch.object(KeysetPagination, 'page_size', 2):
+                    small, response = self.count_queries(endpoint)
+                self.assertEqual(len(response.data['results']), 2)
+                response_cache.local.clear()
+                with mock.patch.object(KeysetPagination, 'page_size', self.ROWS), self.assertNumQueries(small):
+                    response = self.client.get(endpoint)
+                self.assertGreaterEqual(len(response.data['results']), self.ROWS)
+
+
+class QueryInstrumentationTests(TestCase):
+    def setUp(self):
+        endpoint_db_summary.reset()
+        self.addCleanup(endpoint_db_summary.reset)
+        self.client.force_login(create_user('admin', 'admin', is_staff=True))
+
+    def test_responses_carry_the_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/users/')
+        self.assertEqual(response['X-DB-Queries'], str(len(queries)))
+        self.assertIn('db;dur=', response['Server-Timing'])
+
+    def test_unresolved_paths_share_one_summary_entry(self):
+        for number in range(3):
+            self.assertEqual(self.client.get(f'/api/missing-{number}/').status_code, 404)
+        self.client.generic('BREW', '/api/users/')
+        summary = endpoint_db_summary.snapshot()
+        self.assertEqual(summary['GET <unresolved>']['requests'], 3)
+        self.assertEqual(sorted(summary), ['GET <unresolved>', 'OTHER user-list'])
+
+    def test_repeated_statements_are_flagged(self):
+        stats = QueryStats()
+        for number in range(5):
+            stats.record(f"SELECT * FROM api_user WHERE id = {number}", 0.001)
+        stats.record("SELECT * FROM api_user WHERE id IN (1, 2)", 0.001)
+        self.assertEqual(stats.duplicates(5), {'SELECT * FROM api_user WHERE id = ?': 5})
+
+
+@override_settings(REQUEST_LOG_MODE='structured', REQUEST_LOG_SAMPLE_RATES={'2xx': 0.0, '4xx': 1.0})
+class StructuredRequestLogTests(TestCase):
+    def setUp(self):
+        # The middleware reads its settings when the client's handler loads it
+        self.client = Client()
+        self.client.force_login(create_user('admin', 'admin', is_staff=True))
+
+    def logged(self, *urls):
+        with self.assertLogs('api.requests', level='INFO') as logs:
+            for url in urls:
+                self.client.get(url)
+        return [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_requests_are_sampled_per_status_class(self):
+        entries = self.logged('/api/users/', '/api/missing/')
+        self.assertEqual([(entry['status'], entry['sample_rate']) for entry in entries], [(404, 1.0)])
+        self.assertIsNone(entries[0]['view'])
+
+    @override_settings(REQUEST_LOG_SLOW_THRESHOLD=0)
+    def test_slow_requests_are_always_logged(self):
+        self.client = Client()
+        self.client.force_login(User.objects.get(username='admin'))
+        entry, = self.logged('/api/users/')
+        self.assertEqual((entry['status'], entry['view']), (200, 'user-list'))
+        self.assertGreater(entry['db_queries'], 0)
+        self.assertIn('view', entry['phases_ms'])
+
+
+class RequestTimingTests(TestCase):
+    def test_phases_split_the_total(self):
+        timings = RequestTimings()
+        timings.start, timings.view_start, timings.view_end, timings.render_end, timings.end = 0, 0.01, 0.05, 0.06, 0.07
+        timings.serializer = 0.03
+        phases = {name: round(value, 3) for name, value in timings.phases().items()}
+        self.assertEqual(phases, {'middleware': 0.02, 'view': 0.01, 'serializer': 0.03, 'render': 0.01})
+        self.assertAlmostEqual(sum(timings.phases().values()), timings.total)
+
+    def test_nested_serializer_time_is_counted_once(self):
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        clock = iter([1.0, 1.5])
+        try:
+            with mock.patch('api.timing.time.perf_counter', lambda: next(clock)):
+                add_serializer_time(add_serializer_time, lambda: None)
+        finally:
+            current_timings.reset(token)
+        self.assertEqual(timings.serializer, 0.5)
+        # Outside a request nothing is charged
+        self.assertIsNone(add_serializer_time(lambda: None))
+
+    def test_serializer_time_is_charged_to_the_current_request(self):
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            data = CourseSerializer(create_course(create_user('teacher', 'teacher'))).data
+        finally:
+            current_timings.reset(token)
+        self.assertEqual(data['title'], 'Algorithms')
+        self.assertGreater(timings.serializer, 0)
+        self.assertFalse(timings.in_serializer)
+
+    def test_responses_carry_server_timing(self):
+        self.client.force_login(create_user('admin', 'admin', is_staff=True))
+        response = self.client.get('/api/courses/')
+        phases = [entry.split(';')[0] for entry in response['Server-Timing'].split(', ')]
+        self.assertEqual(phases, ['total', 'middleware', 'view', 'serializer', 'render', 'db'])
+
+    def test_logging_does_not_load_the_user(self):
+        request = RequestFactory().get('/')
+        request.user = SimpleLazyObject(lambda: self.fail('user loaded'))
+        self.assertIsNone(get_loaded_user_id(request))
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, name):
+        super().__init__()
+        self.records = []
+        self.set_name(name)
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class AsyncQueueHandlerTests(SimpleTestCase):
+    def setUp(self):
+        self.target = RecordingHandler('test_target')
+        self.handler = AsyncQueueHandler(['test_target'], maxsize=10)
+        self.addCleanup(self.handler.close)
+        self.logger = logging.getLogger('api.tests.async_queue')
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def messages(self):
+        return [record.getMessage() for record in self.target.records]
+
+    def test_settings_logging_configures(self):
+        # Python 3.12+ hands a 'class' QueueHandler a queue instead of its handler list
+        logging.config.dictConfig(settings.LOGGING)
+        handler = logging.getLogger('api').handlers[0]
+        self.assertIsInstance(handler, AsyncQueueHandler)
+        self.assertEqual(handler.queue.maxsize, settings.LOG_QUEUE_SIZE)
+        self.assertEqual([target.name for target in handler.targets], ['console', 'api_file'])
+
+    def test_stop_flushes_and_later_records_are_written_through(self):
+        self.logger.warning('queued %s', 1)
+        self.handler.stop()
+        self.assertEqual(self.messages(), ['queued 1'])
+        self.logger.warning('after stop')
+        self.assertIsNone(self.handler._thread)
+        self.assertEqual(self.messages(), ['queued 1', 'after stop'])
+
+    def test_full_queue_drops_are_counted_and_reported(self):
+        # Pretend the writer is running so records pile up in the queue
+        self.handler._thread = threading.current_thread()
+        for number in range(12):
+            self.logger.warning('record %s', number)
+        self.assertEqual(self.handler.dropped, {'WARNING': 2})
+
+        self.handler._thread = None
+        self.handler.start()
+        self.handler.stop()
+        self.assertEqual(len(self.messages()), 11)
+        self.assertEqual(self.messages()[-1], 'Log queue full, dropped 2 records (WARNING: 2)')
+
+
+class AdminStatsTests(TestCase):
+    def test_popular_courses_count_all_enrollments(self):
+        teacher = create_user('teacher', 'teacher')
+        busy, quiet = create_course(teacher, 'Busy'), create_course(teacher, 'Quiet')
+        for number in range(3):
+            Enrollment.objects.create(student=create_user(f'student{number}', 'student'), course=busy, is_active=False)
+        Enrollment.objects.create(student=create_user('active', 'student'), course=quiet)
+
+        popular = compute_admin_stats()['popular_courses']
+        self.assertEqual(
+            [(course['title'], course['enrollment_count']) for course in popular],
+            [('Busy', 3), ('Quiet', 1)]
+        )
+
+
+class DailyRollupTests(TestCase):
+    ROLLUPS = [
+        (DailyEnrollmentStat, ('date', 'course_id', 'enrollments')),
+        (DailyRevenueStat, ('date', 'transaction_type', 'amount', 'transactions')),
+        (DailyStudentStat, ('date', 'new_students')),
+    ]
+
+    def rollup_rows(self):
+        # Rows that dropped to zero are kept by the incremental path, not by rebuild()
+        return {
+            model.__name__: sorted(row for row in model.objects.values_list(*fields) if row[-1])
+            for model, fields in self.ROLLUPS
+        }
+
+    def test_incremental_rollups_match_a_rebuild(self):
+        teacher = create_user('teacher', 'teacher')
+        course = create_course(teacher)
+        students = [create_user(f'student{number}', 'student') for number in range(3)]
+        create_user('other_teacher', 'teacher')
+        students[2].role = 'teacher'
+        students[2].save()
+
+        enrollments = [Enrollment.objects.create(student=student, course=course) for student in students]
+        enrollments[1].delete()
+
+        transactions = [
+            FeeTransaction.objects.create(student=students[0], course=course, amount=Decimal('100.00'))
+            for _ in range(3)
+        ]
+        for fee in transactions:
+            fee.payment_status = 'completed'
+            fee.save()
+        transactions[0].amount = Decimal('150.00')
+        transactions[0].save()
+        transactions[1].payment_status = 'refunded'
+        transactions[1].save()
+        transactions[2].delete()
+
+        incremental = self.rollup_rows()
+        self.assertEqual(incremental['DailyRevenueStat'][0][2:], (Decimal('150.00'), 1))
+        self.assertEqual(incremental['DailyStudentStat'][0][1], 2)
+        for model, fields in self.ROLLUPS:
+            model.rebuild()
+        self.assertEqual(self.rollup_rows(), incremental)
+
+    def test_period_analytics_sum_the_rollups(self):
+        today = timezone.localdate()
+        DailyStudentStat.objects.create(date=today, new_students=3)
+        DailyStudentStat.objects.create(date=today - timedelta(days=40), new_students=2)
+        DailyStudentStat.objects.create(date=today - timedelta(days=90), new_students=5)
+
+        data = api_client(create_user('admin', 'admin', is_staff=True)).get('/api/admin/analytics/?days=30').json()
+        self.assertEqual(data['new_students'], 3)
+        self.assertEqual(data['new_student_change'], 50.0)
+
+
+class TimeseriesTests(TestCase):
+    def setUp(self):
+        self.client = api_client(create_user('admin', 'admin', is_staff=True))
+
+    def timeseries(self, query):
+        return self.client.get(f'/api/admin/analytics/timeseries/{query}')
+
+    def test_buckets_align_to_weeks_and_months(self):
+        course = create_course(create_user('teacher', 'teacher'))
+        student = create_user('student', 'student')
+        User.objects.filter(pk=student.pk).update(created_at=timezone.make_aware(datetime(2026, 1, 6, 12)))
+        DailyEnrollmentStat.objects.create(date=date(2026, 1, 7), course=course, enrollments=2)
+        DailyEnrollmentStat.objects.create(date=date(2026, 1, 14), course=course, enrollments=1)
+        DailyRevenueStat.objects.create(
+            date=date(2026, 2, 3), transaction_type='course', amount=Decimal('50.00'), transactions=1
+        )
+        DailyStudentStat.objects.create(date=date(2026, 1, 13), new_students=3)
+
+        # Wednesday 7 January starts in the week of Monday 5 January
+        data = self.timeseries('?start=2026-01-07&end=2026-01-20&bucket=week').json()
+        self.assertEqual(data['timestamps'], ['2026-01-05', '2026-01-12', '2026-01-19'])
+        self.assertEqual(data['enrollments'], [2, 1, 0])
+        self.assertEqual(data['new_users'], [1, 0, 0])
+        self.assertEqual(data['new_students'], [0, 3, 0])
+
+        data = self.timeseries('?start=2026-01-15&end=2026-03-02&bucket=month').json()
+        self.assertEqual(data['timestamps'], ['2026-01-01', '2026-02-01', '2026-03-01'])
+        self.assertEqual(data['enrollments'], [3, 0, 0])
+        self.assertEqual(data['revenue'], [0.0, 50.0, 0.0])
+
+    def test_invalid_ranges_are_rejected(self):
+        for query in ('?bucket=year', '?start=2026-02-01&end=2026-01-01', '?start=yesterday',
+                      '?start=2020-01-01&end=2026-01-01&bucket=day'):
+            with self.subTest(query=query):
+                self.assertEqual(self.timeseries(query).status_code, 400)
+        self.assertEqual(self.timeseries('?start=2020-01-01&end=2026-01-01&bucket=month').status_code, 200)
+
+
+class CursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = create_user('admin', 'admin', is_staff=True)
+        student = create_user('student', 'student')
+        for _ in range(7):
+            FeeTransaction.objects.create(student=student, amount=Decimal('10.00'))
+        # Ties on the ordering column are broken by id
+        FeeTransaction.objects.filter(pk__lte=4).update(transaction_date=timezone.now() - timedelta(days=1))
+        cls.expected = list(FeeTransaction.objects.order_by('-transaction_date', '-id').values_list('id', flat=True))
+
+    def setUp(self):
+        self.client = api_client(self.admin)
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_pages_cover_every_row_once_in_both_directions(self):
+        pages = [self.get('/api/fee-transactions/?pagination=cursor&page_size=3')]
+        self.assertIsNone(pages[0]['previous'])
+        self.assertNotIn('count', pages[0])
+        while pages[-1]['next']:
+            pages.append(self.get(pages[-1]['next']))
+        self.assertEqual([row['id'] for page in pages for row in page['results']], self.expected)
+        self.assertEqual([len(page['results']) for page in pages], [3, 3, 1])
+
+        backwards = [pages[-1]]
+        while backwards[-1]['previous']:
+            backwards.append(self.get(backwards[-1]['previous']))
+        self.assertEqual([row['id'] for page in reversed(backwards) for row in page['results']], self.expected)
+
+    def test_later_pages_cost_the_same_as_the_first(self):
+        with CaptureQueriesContext(connection) as first:
+            page = self.get('/api/fee-transactions/?pagination=cursor&page_size=2')
+        # Read now: the next request resets the connection's query log
+        first_page_queries = len(first)
+        third_page_url = self.get(page['next'])['next']
+        with self.assertNumQueries(first_page_queries):
+            self.get(third_page_url)
+
+    def test_count_is_opt_in(self):
+        self.assertEqual(self.get('/api/fee-transactions/?pagination=cursor&count=true')['count'], 7)
+
+    def test_invalid_cursor_is_not_found(self):
+        self.assertEqual(self.client.get('/api/fee-transactions/?cursor=garbage').status_code, 404)
+
+    def test_page_numbers_stay_the_default(self):
+        with mock.patch.object(KeysetPagination, 'page_size', 3):
+            data = self.get('/api/fee-transactions/?page=2')
+        self.assertEqual(data['count'], 7)
+        self.assertEqual([row['id'] for row in data['results']], self.expected[3:6])
+        # Clients only pick the page size in cursor mode
+        self.assertEqual(len(self.get('/api/fee-transactions/?page_size=3')['results']), 7)
+
+
+class HotQueryPlanTests(TestCase):
+    def test_hot_queries_use_an_index(self):
+        # Raises CommandError naming every query that scans a whole table
+        call_command('explain_hot_queries', stdout=StringIO())
+
+
+class SQLiteProductionProfileTests(SimpleTestCase):
+    def connect(self, **options):
+        database = tempfile.NamedTemporaryFile(suffix='.sqlite3')
+        self.addCleanup(database.close)
+        wrapper = ProductionDatabaseWrapper({
+            **connection.settings_dict, 'NAME': database.name, 'ENGINE': 'eduportal.sqlite_backend',
+            'OPTIONS': options,
+        }, alias='profile_test')
+        self.addCleanup(wrapper.close)
+        wrapper.ensure_connection()
+        return wrapper
+
+    def pragma(self, wrapper, name):
+        return wrapper.connection.execute(f'PRAGMA {name}').fetchone()[0]
+
+    def test_init_command_runs_on_connect(self):
+        wrapper = self.connect(init_command=';'.join(settings.SQLITE_PRODUCTION_PRAGMAS))
+        self.assertEqual(self.pragma(wrapper, 'journal_mode'), 'wal')
+        self.assertEqual(self.pragma(wrapper, 'synchronous'), 1)
+        self.assertEqual(self.pragma(wrapper, 'busy_timeout'), settings.SQLITE_BUSY_TIMEOUT)
+
+    def test_atomic_blocks_begin_immediate(self):
+        wrapper = self.connect(transaction_mode='immediate')
+        statements = []
+        wrapper.connection.set_trace_callback(statements.append)
+        wrapper._start_transaction_under_autocommit()
+        self.assertEqual(statements, ['BEGIN IMMEDIATE'])
+        wrapper.connection.rollback()
+
+    def test_unknown_transaction_mode_is_rejected(self):
+        wrapper = self.connect(transaction_mode='lazy')
+        with self.assertRaises(ImproperlyConfigured):
+            wrapper._start_transaction_under_autocommit()
+
+
+class AnalyticsReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = AnalyticsReplicaRouter()
+        replica = tempfile.NamedTemporaryFile(suffix='.sqlite3')
+        self.addCleanup(replica.close)
+        databases = {**settings.DATABASES, ANALYTICS_DB: {**settings.DATABASES['default'], 'NAME': replica.name}}
+        patcher = mock.patch.dict(settings.DATABASES, databases)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Routing state lives in context variables; keep each test's changes to itself
+        self.context = contextvars.copy_context()
+
+    def read_db(self, replica_reads=True):
+        def route():
+            if not replica_reads:
+                return self.router.db_for_read(Course)
+            with analytics_reads():
+                return self.router.db_for_read(Course)
+        return self.context.run(route)
+
+    def test_only_marked_reads_use_the_replica(self):
+        self.assertEqual(self.read_db(), ANALYTICS_DB)
+        self.assertIsNone(self.read_db(replica_reads=False))
+        self.assertIsNone(self.context.run(self.router.db_for_write, Course))
+
+    def test_reads_after_a_write_are_pinned_to_default(self):
+        self.context.run(start_request)
+        self.assertEqual(self.read_db(), ANALYTICS_DB)
+        self.context.run(self.router.db_for_write, Enrollment)
+        self.assertIsNone(self.read_db())
+        # The next request starts unpinned
+        self.context.run(start_request)
+        self.assertEqual(self.read_db(), ANALYTICS_DB)
+
+    def test_missing_replica_falls_back_to_default(self):
+        settings.DATABASES[ANALYTICS_DB]['NAME'] = '/nonexistent/replica.sqlite3'
+        self.assertIsNone(self.read_db())
+        del settings.DATABASES[ANALYTICS_DB]
+        self.assertIsNone(self.read_db())
+
+    def test_replica_is_never_migrated(self):
+        self.assertIs(self.router.allow_migrate(ANALYTICS_DB, 'api'), False)
+        self.assertIsNone(self.router.allow_migrate('default', 'api'))
+
+
+class FullTextSearchTests(TestCase):
+    def setUp(self):
+        response_cache.local.clear()
+        self.teacher = create_user('teacher', 'teacher')
+        self.student = create_user('student', 'student')
+
+    def indexed_titles(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT rowid, kind, object_id, title FROM {SEARCH_TABLE} ORDER BY rowid")
+            return cursor.fetchall()
+
+    def test_index_follows_saves_and_deletes(self):
+        course = create_course(self.teacher, 'Graph Theory')
+        material = StudyMaterial.objects.create(course=course, title='Graph notes', description='', uploaded_by=self.teacher)
+        course.title = 'Graph Algorithms'
+        course.save()
+        self.assertEqual(self.indexed_titles(), sorted([
+            (document_rowid('course', course.pk), 'course', course.pk, 'Graph Algorithms'),
+            (document_rowid('material', material.pk), 'material', material.pk, 'Graph notes'),
+        ]))
+        material.delete()
+        self.assertEqual([row[1:] for row in self.indexed_titles()], [('course', course.pk, 'Graph Algorithms')])
+
+    @override_settings(SEARCH_MAX_RESULTS=2)
+    def test_search_filter_keeps_every_visible_match(self):
+        # Inactive courses rank first but are hidden from students
+        for number in range(3):
+            course = create_course(self.teacher, f'Python Python {number}')
+            course.is_active = False
+            course.save()
+        visible = [create_course(self.teacher, f'Intro {number}') for number in range(3)]
+        for course in visible:
+            course.description = 'Uses Python'
+            course.save()
+        create_course(self.teacher, 'Java')
+
+        with mock.patch.object(KeysetPagination, 'page_size', 2):
+            response = api_client(self.student).get('/api/courses/?search=pyth')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 2)
+
+        response = api_client(self.teacher).get('/api/courses/?search=python')
+        titles = [course['title'] for course in response.data['results']]
+        self.assertEqual(len(titles), 6)
+        # Title matches outrank description matches
+        self.assertTrue(all(title.startswith('Python') for title in titles[:3]))
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        response_cache.local.clear()
+        self.course = create_course(create_user('teacher', 'teacher'), 'Before')
+        self.student = create_user('student', 'student')
+        self.client = api_client(self.student)
+
+    def titles(self):
+        # Cache hits are pre-rendered HttpResponses
+        return [course['title'] for course in self.client.get('/api/courses/').json()['results']]
+
+    def test_invalidation_waits_for_commit(self):
+        self.assertEqual(self.titles(), ['Before'])
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.course.title = 'After'
+            self.course.save()
+            # Not committed yet: the generation is unchanged, so nothing
+            # read inside the transaction can be cached under a new one
+            self.assertEqual(self.titles(), ['Before'])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.titles(), ['After'])
+
+    def test_callers_sharing_an_entry_share_its_etag(self):
+        etag = self.client.get('/api/courses/')['ETag']
+        # Same (empty) enrollment set, so a hit on the entry the first student filled
+        response = api_client(create_user('other', 'student')).get('/api/courses/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_hits_do_not_query_the_enrollments(self):
+        self.titles()
+        with self.assertNumQueries(0):
+            self.titles()
+        # The test transaction never commits, so bump the enrollment's tag by hand
+        Enrollment.objects.create(student=self.student, course=self.course)
+        response_cache.invalidate(f'user:{self.student.pk}')
+        with CaptureQueriesContext(connection) as queries:
+            self.titles()
+        self.assertTrue(any('"enrollments"' in query['sql'] for query in queries.captured_queries))
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        response_cache.local.clear()
+        self.teacher = create_user('teacher', 'teacher', first_name='Ada', last_name='Lovelace')
+        self.course = create_course(self.teacher)
+        self.client = api_client(create_user('admin', 'admin', is_staff=True))
+
+    def revalidate(self, url):
+        etag = self.client.get(url)['ETag']
+        return etag, self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_responses_are_not_modified(self):
+        for url in ('/api/courses/', f'/api/courses/{self.course.pk}/'):
+            with self.subTest(url=url):
+                etag, response = self.revalidate(url)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response['ETag'], etag)
+
+    def test_polled_record_lists_are_validated(self):
+        student = create_user('student', 'student')
+        enrollment = Enrollment.objects.create(student=student, course=self.course)
+        attempt = ExamAttempt.objects.create(student=student, exam=create_exam(self.course, questions=1))
+        fee = FeeTransaction.objects.create(student=student, course=self.course, amount=Decimal('100.00'))
+        edits = [
+            ('/api/enrollments/', enrollment, 'completion_percentage', 50),
+            ('/api/exam-attempts/', attempt, 'status', 'abandoned'),
+            ('/api/fee-transactions/', fee, 'payment_status', 'completed'),
+        ]
+        for url, instance, field, value in edits:
+            with self.subTest(url=url):
+                etag, response = self.revalidate(url)
+                self.assertEqual(response.status_code, 304)
+                setattr(instance, field, value)
+                instance.save()
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etag)
+
+    def test_renaming_a_related_object_changes_the_etag(self):
+        for url in ('/api/courses/', f'/api/courses/{self.course.pk}/'):
+            with self.subTest(url=url):
+                response_cache.local.clear()
+                etag = self.client.get(url)['ETag']
+                self.teacher.first_name = f'Augusta {url}'
+                self.teacher.save()
+                response_cache.local.clear()
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etag)
+                self.assertIn('Augusta', response.content.decode())
+
+
+class FastJSONTests(SimpleTestCase):
+    PAYLOAD = {
+        'decimal': Decimal('99.90'),
+        'utc': datetime(2026, 1, 5, 9, 30, 15, 120000, tzinfo=dt_timezone.utc),
+        'offset': datetime(2026, 1, 5, 9, 30, tzinfo=dt_timezone(timedelta(hours=5, minutes=30))),
+        'naive': datetime(2026, 1, 5, 9, 30),
+        'date': date(2026, 1, 5),
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'lazy': gettext_lazy('Not found.'),
+        'text': 'Grüße \u2028 "quoted" </script>',
+        'numbers': [0, -1, 2 ** 40, 1.5, True, False, None],
+        'nested': [{'id': 1, 'tags': ('a', 'b')}, {}],
+        7: 'integer key',
+    }
+
+    def test_output_matches_the_stock_renderer(self):
+        for data in (self.PAYLOAD, [self.PAYLOAD] * 3, [], 'text'):
+            with self.subTest(data=data):
+                # Encoded by orjson, not by falling back to the stock renderer
+                with mock.patch.object(JSONRenderer, 'render', side_effect=AssertionError('fell back')):
+                    fast = FastJSONRenderer().render(data)
+                self.assertEqual(fast, JSONRenderer().render(data))
+
+    def test_unencodable_payloads_fall_back(self):
+        for data in ({'big': 2 ** 70}, None):
+            with self.subTest(data=data):
+                self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indented_output_uses_the_stock_renderer(self):
+        context = {'indent': 2}
+        self.assertEqual(FastJSONRenderer().render(self.PAYLOAD, renderer_context=context),
+                         JSONRenderer().render(self.PAYLOAD, renderer_context=context))
+
+    def test_parser_matches_the_stock_parser(self):
+        body = '{"title": "Grüße", "ids": [1, 2.5, null], "ok": true}'.encode()
+        self.assertEqual(FastJSONParser().parse(BytesIO(body)), JSONParser().parse(BytesIO(body)))
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(BytesIO(b'{"title": '))
+
+
+class CompiledSerializerTests(TestCase):
+    SERIALIZERS = [
+        CourseSerializer, EnrollmentSerializer, ExamAttemptSerializer, FeeTransactionSerializer,
+        StudentProgressSerializer, TeacherSalarySerializer,
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        teacher = create_user('teacher', 'teacher', first_name='Ada', last_name='Lovelace')
+        student = create_user('student', 'student', first_name='Grace')
+        course = create_course(teacher)
+        course.syllabus = 'Week 1: sorting'
+        course.save()
+        enrollment = Enrollment.objects.create(student=student, course=course)
+        enrollment.rating = 5
+        enrollment.save()
+        ExamAttempt.objects.create(student=student, exam=create_exam(course, questions=1), score=3)
+        FeeTransaction.objects.create(student=student, course=course, amount=Decimal('99.90'), description='Fee')
+        # A null foreign key along a followed source
+        FeeTransaction.objects.create(student=student, transaction_type='other', amount=Decimal('5.00'))
+        StudentProgress.objects.create(student=student, course=course, week_number=1, quiz_score=80)
+        TeacherSalary.objects.create(
+            teacher=teacher, month=date(2026, 1, 1), base_salary=Decimal('1000.00'), total_salary=Decimal('1100.00')
+        )
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_compiled_output_matches_the_serializer(self):
+        for serializer_class in self.SERIALIZERS:
+            with self.subTest(serializer=serializer_class.__name__):
+                queryset = serializer_class.Meta.model.objects.order_by('pk')
+                expected = serializer_class(serializer_class.setup_eager_loading(queryset), many=True).data
+                self.assertTrue(expected)
+                self.assertEqual(
+                    self.render(compiled_serializer(serializer_class).serialize(queryset)), self.render(expected)
+                )
+
+    def test_field_subsets_match_the_serializer(self):
+        queryset = FeeTransaction.objects.order_by('pk')
+        fields = ['id', 'course_title', 'amount']
+        expected = FeeTransactionSerializer(queryset, many=True, fields=fields).data
+        self.assertEqual(self.render(compiled_serializer(FeeTransactionSerializer, fields).serialize(queryset)),
+                         self.render(expected))
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        response_cache.local.clear()
+        self.teacher = create_user('teacher', 'teacher', first_name='Ada')
+        self.course = create_course(self.teacher)
+        self.client = api_client(create_user('admin', 'admin', is_staff=True))
+
+    def first_course(self, query):
+        response = self.client.get(f'/api/courses/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.data['results'][0]
+
+    def test_fields_and_omit_prune_the_output(self):
+        self.assertEqual(sorted(self.first_course('?fields=id,title')), ['id', 'title'])
+        course = self.first_course('?omit=description,syllabus')
+        self.assertNotIn('description', course)
+        self.assertIn('teacher_name', course)
+
+    def test_unrequested_large_columns_are_not_read(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.first_course('?fields=id,title')
+        course_queries = [query['sql'] for query in queries if 'FROM "courses"' in query['sql']]
+        self.assertTrue(course_queries)
+        self.assertTrue(all('"syllabus"' not in sql for sql in course_queries))
+
+    def test_expand_nests_the_related_object(self):
+        teacher = self.first_course('?expand=teacher')['teacher']
+        self.assertEqual(teacher['id'], self.teacher.id)
+        self.assertEqual(teacher['first_name'], 'Ada')
+        self.assertNotIn('email', teacher)
+
+    def test_expandable_serializers_can_be_named_by_path(self):
+        expandable = {'teacher': ('api.serializers.UserSummarySerializer', [])}
+        with mock.patch.object(CourseSerializer.Meta, 'expandable_fields', expandable):
+            data = CourseSerializer(self.course, expand=['teacher']).data
+        self.assertEqual(data['teacher']['username'], 'teacher')
+
+    def test_writes_see_every_field(self):
+        response = api_client(self.teacher).patch(
+            f'/api/courses/{self.course.pk}/?fields=id', {'title': 'Renamed'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], 'Renamed')
+
+
+class DashboardTests(TestCase):
+    def setUp(self):
+        response_cache.local.clear()
+        self.teacher = create_user('teacher', 'teacher')
+        self.student = create_user('student', 'student')
+        self.admin = create_user('admin', 'admin', is_staff=True)
+        course = create_course(self.teacher)
+        Enrollment.objects.create(student=self.student, course=course)
+        self.exam = create_exam(course, questions=1)
+
+    def dashboard(self, user, query=''):
+        response = api_client(user).get(f'/api/dashboard/{query}')
+        return response.status_code, response.json()
+
+    def test_sections_follow_the_role_and_include(self):
+        expected = [
+            (self.student, '', ['courses', 'enrollments', 'ongoing_exams', 'role', 'upcoming_exams']),
+            (self.student, '?include=progress,transactions',
+             ['courses', 'enrollments', 'ongoing_exams', 'progress', 'role', 'transactions', 'upcoming_exams']),
+            (self.teacher, '?include=salaries', ['courses', 'ongoing_exams', 'role', 'salaries', 'upcoming_exams']),
+            (self.admin, '?include=analytics', ['analytics', 'ongoing_exams', 'role', 'stats', 'upcoming_exams']),
+        ]
+        for user, query, sections in expected:
+            with self.subTest(role=user.role, query=query):
+                status_code, data = self.dashboard(user, query)
+                self.assertEqual(status_code, 200)
+                self.assertEqual(sorted(data), sections)
+                self.assertEqual([exam['id'] for exam in data['ongoing_exams']], [self.exam.id])
+
+    def test_unknown_include_is_rejected(self):
+        self.assertEqual(self.dashboard(self.student, '?include=salaries')[0], 400)
+        self.assertEqual(self.dashboard(self.teacher, '?include=progress,bogus')[0], 400)
+
+    def test_cached_dashboard_expires_when_an_exam_starts(self):
+        self.exam.start_time = timezone.now() + timedelta(seconds=30)
+        self.exam.save()
+        status_code, data = self.dashboard(self.student)
+        self.assertEqual([exam['id'] for exam in data['upcoming_exams']], [self.exam.id])
+        (_, expires), = response_cache.local._entries.values()
+        self.assertLessEqual(expires - time.monotonic(), 30)
+
+        # An exam about to start is not cached at all
+        response_cache.local.clear()
+        self.exam.start_time = timezone.now() + timedelta(milliseconds=500)
+        self.exam.save()
+        self.dashboard(self.student)
+        self.assertEqual(len(response_cache.local), 0)
+
+    @override_settings(ADMIN_STATS_CACHE_TIMEOUT=10)
+    def test_cached_admin_dashboard_expires_with_its_stats(self):
+        self.assertEqual(self.dashboard(self.admin, '?include=analytics')[0], 200)
+        (_, expires), = response_cache.local._entries.values()
+        self.assertLessEqual(expires - time.monotonic(), 10)
+
+
+class BatchTests(TestCase):
+    def setUp(self):
+        response_cache.local.clear()
+        self.teacher = create_user('teacher', 'teacher')
+        self.student = create_user('student', 'student')
+        self.course = create_course(self.teacher)
+        Enrollment.objects.create(student=self.student, course=self.course)
+
+    def batch(self, user, requests):
+        response = api_client(user).post('/api/batch/', {'requests': requests}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.data['responses']
+
+    def test_sub_responses_match_separate_requests(self):
+        urls = ['/api/courses/', f'/api/courses/{self.course.pk}/', '/api/enrollments/my_enrollments/', '/api/missing/']
+        responses = self.batch(self.student, [{'id': number, 'url': url} for number, url in enumerate(urls)])
+        self.assertEqual([response['id'] for response in responses], [0, 1, 2, 3])
+        for url, response in zip(urls[:3], responses):
+            separate = api_client(self.student).get(url)
+            self.assertEqual(response['status'], separate.status_code)
+            self.assertEqual(JSONRenderer().render(response['body']), separate.content)
+        self.assertEqual(responses[3]['status'], 404)
+
+    def test_sub_requests_keep_the_callers_permissions(self):
+        responses = self.batch(self.student, [{'url': '/api/admin/stats/'}, {'url': '/api/dashboard/'}])
+        self.assertEqual([response['status'] for response in responses], [403, 200])
+
+    def test_writes_run_in_order(self):
+        responses = self.batch(self.teacher, [
+            {'method': 'PATCH', 'url': f'/api/courses/{self.course.pk}/', 'body': {'title': 'Renamed'}},
+            {'url': f'/api/courses/{self.course.pk}/?fields=title'},
+        ])
+        self.assertEqual(responses[0]['status'], 200)
+        self.assertEqual(responses[1]['body'], {'title': 'Renamed'})
+
+    def test_invalid_batches_are_rejected(self):
+        client = api_client(self.student)
+        for payload in ({'requests': []}, {'requests': 'x'}, {'requests': [{'url': 'http://example.com/'}]},
+                        {'requests': [{'url': '/api/courses/', 'method': 'TRACE'}]},
+                        {'requests': [{'url': '/admin/'}]}, {'requests': [{'url': '/'}]},
+                        {'requests': [{'url': '/api/auth/logout/', 'method': 'POST'}]},
+                        {'requests': [{'url': '/api/auth/login/', 'method': 'POST',
+                                       'body': {'username': 'student', 'password': 'password'}}]},
+                        {'requests': [{'url': '/api/courses/'}] * 21}):
+            with self.subTest(payload=payload):
+                self.assertEqual(client.post('/api/batch/', payload, format='json').status_code, 400)
+        nested = self.batch(self.student, [{'method': 'POST', 'url': '/api/batch/', 'body': {'requests': []}}])
+        self.assertEqual(nested[0]['status'], 400)
+
+
+class ParallelBatchTests(TransactionTestCase):
+    """Parallel workers use their own connections, so the data has to be committed."""
+
+    def setUp(self):
+        response_cache.local.clear()
+        self.student = create_user('student', 'student')
+        self.course = create_course(create_user('teacher', 'teacher'))
+        Enrollment.objects.create(student=self.student, course=self.course)
+
+    def post(self, parallel):
+        urls = ['/api/courses/', f'/api/courses/{self.course.pk}/', '/api/enrollments/my_enrollments/']
+        response_cache.local.clear()
+        return api_client(self.student).post(
+            '/api/batch/', {'requests': [{'url': url} for url in urls], 'parallel': parallel}, format='json'
+        )
+
+    def test_parallel_batches_match_and_count_worker_queries(self):
+        sequential, parallel = self.post(False), self.post(True)
+        self.assertEqual(parallel.status_code, 200)
+        self.assertEqual([entry['status'] for entry in parallel.data['responses']], [200, 200, 200])
+        self.assertEqual(parallel.data['responses'], sequential.data['responses'])
+        self.assertEqual(parallel['X-DB-Queries'], sequential['X-DB-Queries'])
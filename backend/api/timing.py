@@ -0,0 +1,74 @@
+import time
+from contextvars import ContextVar
+
+# Timings of the request being handled, set by ObservabilityMiddleware
+current_timings = ContextVar('current_timings', default=None)
+
+
+class RequestTimings:
+    """
+    Phase timings for one request, taken from a single monotonic clock.
+
+    ObservabilityMiddleware stamps the start and end of the request and of
+    the view and render phases; serializers add their own time while the
+    view runs. phases() turns the stamps into exclusive durations in seconds:
+    middleware (everything outside the view and render), view (excluding
+    serialization), serializer and render.
+    """
+    __slots__ = ('start', 'view_start', 'view_end', 'render_end', 'end', 'serializer', 'in_serializer')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.view_start = None
+        self.view_end = None
+        self.render_end = None
+        self.end = None
+        self.serializer = 0.0
+        self.in_serializer = False
+
+    def mark(self, name):
+        setattr(self, name, time.perf_counter())
+
+    def rendered(self, response):
+        """Post-render callback for template responses."""
+        self.mark('render_end')
+
+    @property
+    def total(self):
+        return (self.end or time.perf_counter()) - self.start
+
+    def phases(self):
+        end = self.end or time.perf_counter()
+        # Fall back gracefully when a phase never happened, e.g. a
+        # middleware short-circuited the view or nothing was rendered
+        view_start = self.view_start or end
+        view_end = self.view_end or end
+        render_end = self.render_end or view_end
+        return {
+            'middleware': (view_start - self.start) + (end - render_end),
+            'view': max(view_end - view_start - self.serializer, 0.0),
+            'serializer': self.serializer,
+            'render': render_end - view_end,
+        }
+
+    def server_timing(self, **extra):
+        """Format the phases (plus any extra durations) as a Server-Timing header."""
+        durations = {'total': self.total, **self.phases(), **extra}
+        return ', '.join(f"{name};dur={duration * 1000:.2f}" for name, duration in durations.items())
+
+
+def add_serializer_time(func, *args):
+    """
+    Call func, charging its duration to the current request's serializer
+    phase. Nested calls (e.g. nested serializers) are only counted once.
+    """
+    timings = current_timings.get()
+    if timings is None or timings.in_serializer:
+        return func(*args)
+    timings.in_serializer = True
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        timings.serializer += time.perf_counter() - start
+        timings.in_serializer = False
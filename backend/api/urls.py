@@ -4,7 +4,7 @@ from .views import (
     AuthViewSet, UserViewSet, CourseViewSet, WeeklyDetailViewSet, EnrollmentViewSet,
     StudyMaterialViewSet, ExamViewSet, QuestionViewSet, QuestionOptionViewSet,
     ExamAttemptViewSet, FeeTransactionViewSet, TeacherSalaryViewSet, StudentProgressViewSet,
-    AdminViewSet, FileUploadViewSet
+    AdminViewSet, FileUploadViewSet, SearchViewSet, DashboardViewSet, BatchViewSet
 )
 
 router = DefaultRouter()
@@ -23,6 +23,9 @@ router.register(r'teacher-salaries', TeacherSalaryViewSet, basename='teacher-sal
 router.register(r'student-progress', StudentProgressViewSet, basename='student-progress')
 router.register(r'file-uploads', FileUploadViewSet, basename='file-upload')
 router.register(r'admin', AdminViewSet, basename='admin')
+router.register(r'search', SearchViewSet, basename='search')
+router.register(r'dashboard', DashboardViewSet, basename='dashboard')
+router.register(r'batch', BatchViewSet, basename='batch')
 
 urlpatterns = [
     path('', include(router.urls)),
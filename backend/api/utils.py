@@ -8,6 +8,25 @@ from rest_framework import status
 logger = logging.getLogger('api.utils')
 
 
+class lazy:
+    """
+    Defer an expensive log argument until the record is actually formatted.
+
+    Pair it with %-style logger calls so nothing is computed when the level
+    is disabled:
+
+        logger.debug("Payload: %s", lazy(safe_serialize, data))
+    """
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
+
 def safe_serialize(obj):
     """
     Safely serialize an object for logging purposes.
@@ -31,6 +50,8 @@ def safe_log_data(data, prefix="Data"):
     """
     Safely log data without causing serialization errors.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     try:
         if isinstance(data, dict):
             # Filter out sensitive fields
@@ -41,38 +62,38 @@ def safe_log_data(data, prefix="Data"):
                     filtered_data[key] = '[REDACTED]'
                 else:
                     filtered_data[key] = value
-            logger.debug(f"{prefix}: {safe_serialize(filtered_data)}")
+            logger.debug("%s: %s", prefix, lazy(safe_serialize, filtered_data))
         elif isinstance(data, (list, tuple)):
-            logger.debug(f"{prefix}: {safe_serialize(data)}")
+            logger.debug("%s: %s", prefix, lazy(safe_serialize, data))
         else:
-            logger.debug(f"{prefix}: {str(data)}")
+            logger.debug("%s: %s", prefix, data)
     except Exception as e:
-        logger.debug(f"Could not log {prefix.lower()}: {str(e)}")
+        logger.debug("Could not log %s: %s", prefix.lower(), e)
 
 
 def safe_log_request(request, method_name):
     """Safely log request information."""
     try:
-        logger.info(f"Request to {method_name}: {request.method} {request.path}")
-        logger.debug(f"User: {request.user.username if request.user.is_authenticated else 'Anonymous'}")
+        logger.info("Request to %s: %s %s", method_name, request.method, request.path)
+        logger.debug("User: %s", request.user.username if request.user.is_authenticated else 'Anonymous')
     except Exception as e:
-        logger.warning(f"Could not log request: {str(e)}")
+        logger.warning("Could not log request: %s", e)
 
 
 def safe_log_response(response_data, method_name):
     """Safely log response information."""
     try:
-        logger.info(f"Response from {method_name}: {type(response_data)}")
+        logger.info("Response from %s: %s", method_name, type(response_data))
     except Exception as e:
-        logger.warning(f"Could not log response: {str(e)}")
+        logger.warning("Could not log response: %s", e)
 
 
 def safe_log_error(error, method_name):
     """Safely log error information."""
     try:
-        logger.error(f"Error in {method_name}: {str(error)}")
+        logger.error("Error in %s: %s", method_name, error)
     except Exception as e:
-        logger.warning(f"Could not log error: {str(e)}")
+        logger.warning("Could not log error: %s", e)
 
 
 def custom_exception_handler(exc, context):
@@ -84,8 +105,8 @@ def custom_exception_handler(exc, context):
     
     if response is not None:
         # Log the exception
-        logger.error(f"DRF Exception: {type(exc).__name__}: {str(exc)}")
-        logger.error(f"Context: {context}")
+        logger.error("DRF Exception: %s: %s", type(exc).__name__, exc)
+        logger.error("Context: %s", context)
         
         # Add custom error details if needed
         if hasattr(exc, 'detail'):
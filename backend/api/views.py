@@ -1,5 +1,5 @@
 import logging
-from django.db.models import Q, Avg, Count, Sum
+from django.db.models import Q, Avg, Sum, QuerySet
 from django.utils import timezone
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
@@ -7,7 +7,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import json
 
 from .models import (
@@ -19,15 +19,103 @@ from .serializers import (
     UserSerializer, CourseSerializer, EnrollmentSerializer, WeeklyDetailSerializer,
     StudyMaterialSerializer, ExamSerializer, QuestionSerializer, QuestionOptionSerializer,
     ExamAttemptSerializer, FeeTransactionSerializer, TeacherSalarySerializer,
-    StudentProgressSerializer, FileUploadSerializer, LoginSerializer
+    StudentProgressSerializer, FileUploadSerializer, LoginSerializer,
+    SparseFieldsMixin, select_fields
 )
 from .permissions import IsTeacherOrAdmin, IsEnrolledStudentOrTeacher, IsCourseTeacherOrAdmin, IsOwnerOrAdmin
 from .utils import safe_log_request, safe_log_response, safe_log_error
+from .grading import grade_submission, regrade_exam
+from .middleware import endpoint_db_summary
+from .db_routers import analytics_replica
+from .search import FullTextSearchFilter, search
+from .response_cache import cached_response, response_cache
+from .conditional import ConditionalGetMixin
+from .compiled_serializers import compiled_serializer
+from .dashboard import DASHBOARD_SECTIONS, build_dashboard
+from .batch import execute_batch, parse_batch
+from .analytics import get_admin_stats, compute_period_analytics, compute_financial_summary, compute_timeseries
 
 # Get logger for views
 logger = logging.getLogger('api.views')
 
 
+class EagerLoadingViewMixin:
+    """
+    Applies the serializer's declared select_related/prefetch_related to
+    every queryset the viewset filters or serializes, so list endpoints
+    cost the same number of queries regardless of page size.
+    """
+
+    def sparse_fieldset(self, serializer_class):
+        """Serializer options narrowing the output; see SparseFieldsViewMixin."""
+        return {}
+
+    def eager_load(self, queryset, serializer_class=None):
+        serializer_class = serializer_class or self.get_serializer_class()
+        setup_eager_loading = getattr(serializer_class, 'setup_eager_loading', None)
+        if setup_eager_loading is None or not isinstance(queryset, QuerySet):
+            return queryset
+        return setup_eager_loading(queryset, **self.sparse_fieldset(serializer_class))
+
+    def filter_queryset(self, queryset):
+        return self.eager_load(super().filter_queryset(queryset))
+
+    def get_serializer(self, *args, **kwargs):
+        if args and isinstance(args[0], QuerySet):
+            args = (self.eager_load(args[0]),) + args[1:]
+        return super().get_serializer(*args, **kwargs)
+
+    def serialize_values(self, queryset, serializer_class=None):
+        """
+        Read-only list serialization through the compiled path: same output
+        as get_serializer(queryset, many=True).data, without building model
+        instances. See compiled_serializers.CompiledSerializer. `?fields=`
+        and `?omit=` narrow the columns read; `?expand=` needs nested
+        serializers, so it takes the regular path.
+        """
+        serializer_class = serializer_class or self.get_serializer_class()
+        context = self.get_serializer_context()
+        options = self.sparse_fieldset(serializer_class)
+        if options.get('expand'):
+            queryset = self.eager_load(queryset, serializer_class)
+            return serializer_class(queryset, many=True, context=context, **options).data
+        compiled = compiled_serializer(serializer_class)
+        if options:
+            compiled = compiled_serializer(serializer_class, select_fields(compiled.field_names, **options))
+        return compiled.serialize(queryset, context)
+
+
+class SparseFieldsViewMixin:
+    """
+    Passes the `?fields=`, `?omit=` and `?expand=` query parameters of read
+    requests to SparseFieldsMixin serializers, and to their eager loading
+    when combined with EagerLoadingViewMixin (list this mixin first).
+    """
+
+    def sparse_fieldset(self, serializer_class):
+        """
+        The `?fields=`, `?omit=` and `?expand=` query parameters of a read
+        request as keyword arguments for serializer_class, comma-separated
+        values split into lists. Empty for writes, so validation always
+        sees every field.
+        """
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in ('GET', 'HEAD') \
+                or not issubclass(serializer_class, SparseFieldsMixin):
+            return {}
+        options = {}
+        for name in ('fields', 'omit', 'expand'):
+            value = request.query_params.get(name)
+            if value:
+                options[name] = [item.strip() for item in value.split(',') if item.strip()]
+        return options
+
+    def get_serializer(self, *args, **kwargs):
+        for name, value in self.sparse_fieldset(self.get_serializer_class()).items():
+            kwargs.setdefault(name, value)
+        return super().get_serializer(*args, **kwargs)
+
+
 class AuthViewSet(viewsets.ViewSet):
     """
     Authentication endpoints for registration and login.
@@ -57,18 +145,18 @@ class AuthViewSet(viewsets.ViewSet):
             
             # Check if user already exists
             if User.objects.filter(username=username).exists():
-                logger.warning(f"Registration failed - username already exists: {username}")
+                logger.warning("Registration failed - username already exists: %s", username)
                 return Response({'error': 'Username already exists'}, status=status.HTTP_400_BAD_REQUEST)
             
             if User.objects.filter(email=email).exists():
-                logger.warning(f"Registration failed - email already exists: {email}")
+                logger.warning("Registration failed - email already exists: %s", email)
                 return Response({'error': 'Email already exists'}, status=status.HTTP_400_BAD_REQUEST)
             
             # Validate password
             try:
                 validate_password(password)
             except Exception as e:
-                logger.warning(f"Registration failed - invalid password: {str(e)}")
+                logger.warning("Registration failed - invalid password: %s", e)
                 return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
             
             # Create user
@@ -81,11 +169,11 @@ class AuthViewSet(viewsets.ViewSet):
                 role=role
             )
             
-            logger.info(f"User registered successfully: {user.username} (ID: {user.id})")
+            logger.info("User registered successfully: %s (ID: %s)", user.username, user.id)
             
             # Ensure superusers have admin role
             if user.is_superuser and user.role != 'admin':
-                logger.info(f"Setting admin role for superuser: {user.username}")
+                logger.info("Setting admin role for superuser: %s", user.username)
                 user.role = 'admin'
                 user.save()
             
@@ -97,7 +185,7 @@ class AuthViewSet(viewsets.ViewSet):
                 'message': 'Registration successful'
             }
             safe_log_response(response_data, "Registration")
-            logger.info(f"Registration successful for user: {user.username}")
+            logger.info("Registration successful for user: %s", user.username)
             return Response(response_data, status=status.HTTP_201_CREATED)
         except Exception as e:
             safe_log_error(e, "Registration")
@@ -120,30 +208,30 @@ class AuthViewSet(viewsets.ViewSet):
             user = authenticate(username=username, password=password)
             
             if user is None:
-                logger.warning(f"Login failed - invalid credentials for username: {username}")
+                logger.warning("Login failed - invalid credentials for username: %s", username)
                 return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
             
             if not user.is_active:
-                logger.warning(f"Login failed - inactive user: {username}")
+                logger.warning("Login failed - inactive user: %s", username)
                 return Response({'error': 'User account is disabled'}, status=status.HTTP_401_UNAUTHORIZED)
             
             # Ensure superusers have admin role
             if user.is_superuser and user.role != 'admin':
-                logger.info(f"Setting admin role for superuser: {user.username}")
+                logger.info("Setting admin role for superuser: %s", user.username)
                 user.role = 'admin'
                 user.save()
             
             # Log the user in using Django's session
             login(request, user)
             
-            logger.info(f"Login successful for user: {user.username} (ID: {user.id})")
+            logger.info("Login successful for user: %s (ID: %s)", user.username, user.id)
             
             response_data = {
                 'user': UserSerializer(user).data,
                 'message': 'Login successful'
             }
             safe_log_response(response_data, "Login")
-            logger.info(f"Login successful for user: {user.username}")
+            logger.info("Login successful for user: %s", user.username)
             return Response(response_data)
         except Exception as e:
             safe_log_error(e, "Login")
@@ -159,7 +247,7 @@ class AuthViewSet(viewsets.ViewSet):
             from django.contrib.auth import logout
             logout(request)
             
-            logger.info(f"User logged out successfully: {request.user.username if request.user.is_authenticated else 'Anonymous'}")
+            logger.info("User logged out successfully: %s", request.user.username if request.user.is_authenticated else 'Anonymous')
             safe_log_response({'message': 'Logout successful'}, "Logout")
             return Response({'message': 'Logout successful'}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -167,7 +255,7 @@ class AuthViewSet(viewsets.ViewSet):
             return Response({'error': 'Logout failed'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     User management endpoints.
     """
@@ -179,41 +267,41 @@ class UserViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'username']
 
     def get_permissions(self):
-        logger.debug(f"UserViewSet.get_permissions called for action: {self.action}")
+        logger.debug("UserViewSet.get_permissions called for action: %s", self.action)
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             permission_classes = [IsAdminUser]
         else:
             permission_classes = [permissions.IsAuthenticated]
-        logger.debug(f"Permissions for action {self.action}: {permission_classes}")
+        logger.debug("Permissions for action %s: %s", self.action, permission_classes)
         return [permission() for permission in permission_classes]
 
     def get_queryset(self):
-        logger.debug(f"UserViewSet.get_queryset called by user: {self.request.user.username}")
+        logger.debug("UserViewSet.get_queryset called by user: %s", self.request.user.username)
         user = self.request.user
         if user.role == 'admin':
             logger.debug("Admin user - returning all users")
             return User.objects.all()
         else:
-            logger.debug(f"Non-admin user - returning only self: {user.username}")
+            logger.debug("Non-admin user - returning only self: %s", user.username)
             return User.objects.filter(id=user.id)
 
     @action(detail=False, methods=['get'])
     def profile(self, request):
         """Get current user's profile."""
-        logger.info(f"UserViewSet.profile called for user: {request.user.username}")
+        logger.info("UserViewSet.profile called for user: %s", request.user.username)
         
         try:
             # Ensure superusers have admin role
             if request.user.is_superuser and request.user.role != 'admin':
-                logger.info(f"Setting admin role for superuser: {request.user.username}")
+                logger.info("Setting admin role for superuser: %s", request.user.username)
                 request.user.role = 'admin'
                 request.user.save()
             
             serializer = UserSerializer(request.user)
-            logger.info(f"Profile retrieved successfully for user: {request.user.username}")
+            logger.info("Profile retrieved successfully for user: %s", request.user.username)
             return Response(serializer.data)
         except Exception as e:
-            logger.error(f"Profile retrieval error: {str(e)}")
+            logger.error("Profile retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve profile'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['put', 'patch'])
@@ -225,11 +313,11 @@ class UserViewSet(viewsets.ModelViewSet):
             serializer = UserSerializer(request.user, data=request.data, partial=True)
             if serializer.is_valid():
                 user = serializer.save()
-                logger.info(f"Profile updated successfully for user: {user.username}")
+                logger.info("Profile updated successfully for user: %s", user.username)
                 safe_log_response(serializer.data, "Profile Update")
                 return Response(serializer.data)
             else:
-                logger.warning(f"Profile update failed - validation errors: {serializer.errors}")
+                logger.warning("Profile update failed - validation errors: %s", serializer.errors)
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             safe_log_error(e, "Profile Update")
@@ -243,10 +331,10 @@ class UserViewSet(viewsets.ModelViewSet):
         try:
             teachers = User.objects.filter(role='teacher', is_active=True)
             serializer = UserSerializer(teachers, many=True)
-            logger.info(f"Retrieved {len(teachers)} teachers")
+            logger.info("Retrieved %s teachers", len(teachers))
             return Response(serializer.data)
         except Exception as e:
-            logger.error(f"Teachers retrieval error: {str(e)}")
+            logger.error("Teachers retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve teachers'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['get'])
@@ -257,25 +345,25 @@ class UserViewSet(viewsets.ModelViewSet):
         try:
             students = User.objects.filter(role='student', is_active=True)
             serializer = UserSerializer(students, many=True)
-            logger.info(f"Retrieved {len(students)} students")
+            logger.info("Retrieved %s students", len(students))
             return Response(serializer.data)
         except Exception as e:
-            logger.error(f"Students retrieval error: {str(e)}")
+            logger.error("Students retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve students'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=True, methods=['post'])
     def toggle_active(self, request, pk=None):
         """Toggle user's active status."""
-        logger.info(f"UserViewSet.toggle_active called for user_id: {pk}")
+        logger.info("UserViewSet.toggle_active called for user_id: %s", pk)
         
         try:
             user = self.get_object()
             user.is_active = not user.is_active
             user.save()
-            logger.info(f"User {user.username} active status toggled to: {user.is_active}")
+            logger.info("User %s active status toggled to: %s", user.username, user.is_active)
             return Response({'is_active': user.is_active})
         except Exception as e:
-            logger.error(f"Toggle active error: {str(e)}")
+            logger.error("Toggle active error: %s", e)
             return Response({'error': 'Failed to toggle user status'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['get'])
@@ -286,14 +374,14 @@ class UserViewSet(viewsets.ModelViewSet):
         try:
             active_users = User.objects.filter(is_active=True)
             serializer = UserSerializer(active_users, many=True)
-            logger.info(f"Retrieved {len(active_users)} active users")
+            logger.info("Retrieved %s active users", len(active_users))
             return Response(serializer.data)
         except Exception as e:
-            logger.error(f"Active users retrieval error: {str(e)}")
+            logger.error("Active users retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve active users'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class WeeklyDetailViewSet(viewsets.ModelViewSet):
+class WeeklyDetailViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Weekly detail management endpoints.
     """
@@ -304,25 +392,25 @@ class WeeklyDetailViewSet(viewsets.ModelViewSet):
     ordering_fields = ['week_number', 'created_at']
 
     def get_permissions(self):
-        logger.debug(f"WeeklyDetailViewSet.get_permissions called for action: {self.action}")
+        logger.debug("WeeklyDetailViewSet.get_permissions called for action: %s", self.action)
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             permission_classes = [IsTeacherOrAdmin]
         else:
             permission_classes = [permissions.IsAuthenticated]
-        logger.debug(f"Permissions for action {self.action}: {permission_classes}")
+        logger.debug("Permissions for action %s: %s", self.action, permission_classes)
         return [permission() for permission in permission_classes]
 
     def get_queryset(self):
-        logger.debug(f"WeeklyDetailViewSet.get_queryset called by user: {self.request.user.username}")
+        logger.debug("WeeklyDetailViewSet.get_queryset called by user: %s", self.request.user.username)
         user = self.request.user
         if user.role == 'admin':
             logger.debug("Admin user - returning all weekly details")
             return WeeklyDetail.objects.all()
         elif user.role == 'teacher':
-            logger.debug(f"Teacher user - returning weekly details for their courses")
+            logger.debug("Teacher user - returning weekly details for their courses")
             return WeeklyDetail.objects.filter(course__teacher=user)
         else:
-            logger.debug(f"Student user - returning weekly details for enrolled courses")
+            logger.debug("Student user - returning weekly details for enrolled courses")
             enrolled_courses = Course.objects.filter(
                 enrollments__student=user, 
                 enrollments__is_active=True
@@ -330,108 +418,120 @@ class WeeklyDetailViewSet(viewsets.ModelViewSet):
             return WeeklyDetail.objects.filter(course__in=enrolled_courses)
 
     @action(detail=False, methods=['get'])
+    @cached_response('weekly-details', tags=lambda request: [f"course:{request.query_params.get('course')}"])
     def course_weekly_details(self, request):
         """Get weekly details for a specific course."""
         course_id = request.query_params.get('course')
-        logger.info(f"WeeklyDetailViewSet.course_weekly_details called for course_id: {course_id}")
+        logger.info("WeeklyDetailViewSet.course_weekly_details called for course_id: %s", course_id)
         
         try:
             if course_id:
                 weekly_details = WeeklyDetail.objects.filter(course_id=course_id).order_by('week_number')
                 serializer = self.get_serializer(weekly_details, many=True)
-                logger.info(f"Retrieved {len(weekly_details)} weekly details for course {course_id}")
+                logger.info("Retrieved %s weekly details for course %s", len(weekly_details), course_id)
                 return Response(serializer.data)
             else:
                 logger.warning("No course_id provided")
                 return Response({'error': 'Course ID is required'}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            logger.error(f"Course weekly details retrieval error: {str(e)}")
+            logger.error("Course weekly details retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve weekly details'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Course management endpoints.
     """
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
     filterset_fields = ['difficulty_level', 'is_active', 'teacher']
     search_fields = ['title', 'description']
+    search_kind = 'course'
     ordering_fields = ['created_at', 'title', 'fee']
 
     def get_permissions(self):
-        logger.debug(f"CourseViewSet.get_permissions called for action: {self.action}")
+        logger.debug("CourseViewSet.get_permissions called for action: %s", self.action)
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             permission_classes = [IsTeacherOrAdmin]
         elif self.action in ['enroll', 'unenroll']:
             permission_classes = [permissions.IsAuthenticated]
         else:
             permission_classes = [permissions.IsAuthenticated]
-        logger.debug(f"Permissions for action {self.action}: {permission_classes}")
+        logger.debug("Permissions for action %s: %s", self.action, permission_classes)
         return [permission() for permission in permission_classes]
 
     def get_queryset(self):
-        logger.debug(f"CourseViewSet.get_queryset called by user: {self.request.user.username}")
+        logger.debug("CourseViewSet.get_queryset called by user: %s", self.request.user.username)
         user = self.request.user
         if user.role == 'teacher':
-            logger.debug(f"Teacher user - returning courses taught by: {user.username}")
+            logger.debug("Teacher user - returning courses taught by: %s", user.username)
             return Course.objects.filter(teacher=user)
         elif user.role == 'student':
-            logger.debug(f"Student user - returning active courses")
+            logger.debug("Student user - returning active courses")
             return Course.objects.filter(is_active=True)
         else:
-            logger.debug(f"Admin user - returning all courses")
+            logger.debug("Admin user - returning all courses")
             return Course.objects.all()
 
+    @cached_response('courses', tags=lambda request: ['courses'])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def perform_create(self, serializer):
-        logger.info(f"CourseViewSet.perform_create called by user: {self.request.user.username}")
+        logger.info("CourseViewSet.perform_create called by user: %s", self.request.user.username)
         course = serializer.save(teacher=self.request.user)
-        logger.info(f"Course created successfully: {course.title} (ID: {course.id})")
+        logger.info("Course created successfully: %s (ID: %s)", course.title, course.id)
 
     @action(detail=True, methods=['get'])
     def detail(self, request, pk=None):
         """Get detailed course information."""
-        logger.info(f"CourseViewSet.detail called for course_id: {pk}")
+        logger.info("CourseViewSet.detail called for course_id: %s", pk)
         
         try:
             course = self.get_object()
             serializer = self.get_serializer(course)
-            logger.info(f"Course detail retrieved successfully: {course.title}")
+            logger.info("Course detail retrieved successfully: %s", course.title)
             return Response(serializer.data)
         except Exception as e:
-            logger.error(f"Course detail retrieval error: {str(e)}")
+            logger.error("Course detail retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve course details'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=True, methods=['post'])
     def enroll(self, request, pk=None):
         """Enroll a student in a course."""
-        logger.info(f"CourseViewSet.enroll called for course_id: {pk} by user: {request.user.username}")
+        logger.info("CourseViewSet.enroll called for course_id: %s by user: %s", pk, request.user.username)
         
         try:
             course = self.get_object()
             student = request.user
             
             # Check if already enrolled
-            existing_enrollment = Enrollment.objects.filter(student=student, course=course, is_active=True).first()
-            if existing_enrollment:
-                logger.warning(f"Student {student.username} already enrolled in course {course.title}")
+            existing_enrollment = Enrollment.objects.filter(student=student, course=course).first()
+            if existing_enrollment and existing_enrollment.is_active:
+                logger.warning("Student %s already enrolled in course %s", student.username, course.title)
                 return Response({'error': 'Already enrolled in this course'}, status=status.HTTP_400_BAD_REQUEST)
             
-            # Create enrollment
-            enrollment = Enrollment.objects.create(student=student, course=course)
-            logger.info(f"Student {student.username} enrolled successfully in course {course.title}")
+            if existing_enrollment:
+                # Reactivate a previous enrollment (student/course is unique)
+                enrollment = existing_enrollment
+                enrollment.is_active = True
+                enrollment.save()
+            else:
+                # Create enrollment
+                enrollment = Enrollment.objects.create(student=student, course=course)
+            logger.info("Student %s enrolled successfully in course %s", student.username, course.title)
             
             serializer = EnrollmentSerializer(enrollment)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         except Exception as e:
-            logger.error(f"Enrollment error: {str(e)}")
+            logger.error("Enrollment error: %s", e)
             return Response({'error': 'Failed to enroll in course'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=True, methods=['post'])
     def unenroll(self, request, pk=None):
         """Unenroll a student from a course."""
-        logger.info(f"CourseViewSet.unenroll called for course_id: {pk} by user: {request.user.username}")
+        logger.info("CourseViewSet.unenroll called for course_id: %s by user: %s", pk, request.user.username)
         
         try:
             course = self.get_object()
@@ -439,61 +539,62 @@ class CourseViewSet(viewsets.ModelViewSet):
             
             enrollment = course.enrollments.filter(student=student, is_active=True).first()
             if not enrollment:
-                logger.warning(f"Student {student.username} not enrolled in course {course.title}")
+                logger.warning("Student %s not enrolled in course %s", student.username, course.title)
                 return Response({'error': 'Not enrolled in this course'}, status=status.HTTP_400_BAD_REQUEST)
             
             enrollment.is_active = False
             enrollment.save()
-            logger.info(f"Student {student.username} unenrolled successfully from course {course.title}")
+            logger.info("Student %s unenrolled successfully from course %s", student.username, course.title)
             return Response({'message': 'Successfully unenrolled'})
         except Exception as e:
-            logger.error(f"Unenrollment error: {str(e)}")
+            logger.error("Unenrollment error: %s", e)
             return Response({'error': 'Failed to unenroll from course'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['get'])
     def my_courses(self, request):
         """Get courses for the current user."""
-        logger.info(f"CourseViewSet.my_courses called for user: {request.user.username}")
+        logger.info("CourseViewSet.my_courses called for user: %s", request.user.username)
         
         try:
             user = request.user
             if user.role == 'teacher':
-                logger.debug(f"Teacher user - returning courses taught by: {user.username}")
+                logger.debug("Teacher user - returning courses taught by: %s", user.username)
                 courses = Course.objects.filter(teacher=user)
             elif user.role == 'student':
-                logger.debug(f"Student user - returning enrolled courses")
+                logger.debug("Student user - returning enrolled courses")
                 enrollments = Enrollment.objects.filter(student=user, is_active=True)
                 courses = Course.objects.filter(enrollments__in=enrollments)
             else:
-                logger.debug(f"Admin user - returning all courses")
+                logger.debug("Admin user - returning all courses")
                 courses = Course.objects.all()
             
-            serializer = self.get_serializer(courses, many=True)
-            logger.info(f"Retrieved {len(courses)} courses for user {user.username}")
-            return Response(serializer.data)
+            data = self.serialize_values(courses)
+            logger.info("Retrieved %s courses for user %s", len(data), user.username)
+            return Response(data)
         except Exception as e:
-            logger.error(f"My courses retrieval error: {str(e)}")
+            logger.error("My courses retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve courses'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=True, methods=['get'])
     def students(self, request, pk=None):
         """Get students enrolled in a course."""
-        logger.info(f"CourseViewSet.students called for course_id: {pk}")
+        logger.info("CourseViewSet.students called for course_id: %s", pk)
         
         try:
             course = self.get_object()
-            enrollments = course.enrollments.filter(is_active=True)
+            enrollments = self.eager_load(course.enrollments.filter(is_active=True), EnrollmentSerializer)
             serializer = EnrollmentSerializer(enrollments, many=True)
-            logger.info(f"Retrieved {len(enrollments)} enrolled students for course {course.title}")
+            logger.info("Retrieved %s enrolled students for course %s", len(enrollments), course.title)
             return Response(serializer.data)
         except Exception as e:
-            logger.error(f"Course students retrieval error: {str(e)}")
+            logger.error("Course students retrieval error: %s", e)
             return Response({'error': 'Failed to retrieve course students'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=True, methods=['get'])
+    @analytics_replica
     def progress_summary(self, request, pk=None):
         """Get course progress summary."""
-        logger.info(f"CourseViewSet.progress_summary called for course_id: {pk}")
+        logger.info("CourseViewSet.progress_summary called for course_id: %s", pk)
         
         try:
             course = self.get_object()
@@ -510,10 +611,10 @@ class CourseViewSet(viewsets.ModelViewSet):
                 'completion_rate': round((completed_students / total_students * 100) if total_students > 0 else 0, 2)
             }
             
-            logger.info(f"Progress summary for course {course.title}: {summary}")
+            logger.info("Progress summary for course %s: %s", course.title, summary)
             return Response(summary)
         except Exception as e:
-            logger.error(f"Progress summary error: {str(e)}")
+            logger.error("Progress summary error: %s", e)
             return Response({'error': 'Failed to retrieve progress summary'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=True, methods=['post'])
@@ -528,7 +629,7 @@ class CourseViewSet(viewsets.ModelViewSet):
             if schedule_info is not None:
                 course.schedule_info = schedule_info
                 course.save()
-                logger.info(f"Schedule updated for course {course.title}")
+                logger.info("Schedule updated for course %s", course.title)
             
             serializer = self.get_serializer(course)
             safe_log_response(serializer.data, "Schedule Update")
@@ -538,7 +639,7 @@ class CourseViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Failed to update schedule'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class EnrollmentViewSet(viewsets.ModelViewSet):
+class EnrollmentViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Enrollment management endpoints.
     """
@@ -547,6 +648,7 @@ class EnrollmentViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ['is_active', 'course', 'student']
     ordering_fields = ['enrolled_at']
+    cursor_ordering = ('-enrolled_at', '-id')
 
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
@@ -563,8 +665,7 @@ class EnrollmentViewSet(viewsets.ModelViewSet):
                           status=status.HTTP_400_BAD_REQUEST)
         
         enrollments = Enrollment.objects.filter(student=request.user, is_active=True)
-        serializer = self.get_serializer(enrollments, many=True)
-        return Response(serializer.data)
+        return Response(self.serialize_values(enrollments))
 
     @action(detail=True, methods=['put', 'patch'])
     def update_progress(self, request, pk=None):
@@ -582,7 +683,7 @@ class EnrollmentViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class FileUploadViewSet(viewsets.ModelViewSet):
+class FileUploadViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     File upload management endpoints.
     """
@@ -591,6 +692,7 @@ class FileUploadViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ['file_type', 'uploaded_by']
     ordering_fields = ['created_at']
+    cursor_ordering = ('-created_at', '-id')
 
     def get_permissions(self):
         permission_classes = [permissions.IsAuthenticated]
@@ -615,15 +717,16 @@ class FileUploadViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class StudyMaterialViewSet(viewsets.ModelViewSet):
+class StudyMaterialViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Study material management endpoints.
     """
     queryset = StudyMaterial.objects.all()
     serializer_class = StudyMaterialSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
     filterset_fields = ['course', 'material_type', 'is_public', 'uploaded_by']
     search_fields = ['title', 'description']
+    search_kind = 'material'
     ordering_fields = ['created_at', 'title']
 
     def get_permissions(self):
@@ -668,6 +771,7 @@ class StudyMaterialViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @cached_response('public-materials', tags=lambda request: ['materials:public'])
     def public_materials(self, request):
         """Get public study materials."""
         materials = StudyMaterial.objects.filter(is_public=True)
@@ -675,7 +779,7 @@ class StudyMaterialViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ExamViewSet(viewsets.ModelViewSet):
+class ExamViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Exam management endpoints.
     """
@@ -687,7 +791,7 @@ class ExamViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'start_time', 'end_time']
 
     def get_permissions(self):
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
+        if self.action in ['create', 'update', 'partial_update', 'destroy', 'regrade']:
             permission_classes = [IsCourseTeacherOrAdmin]
         else:
             permission_classes = [IsEnrolledStudentOrTeacher]
@@ -759,37 +863,13 @@ class ExamViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Exam already submitted'}, 
                           status=status.HTTP_400_BAD_REQUEST)
         
-        # Process answers and calculate score
-        total_score = 0
-        for answer_data in answers_data:
-            question_id = answer_data.get('question_id')
-            selected_option_id = answer_data.get('selected_option_id')
-            text_answer = answer_data.get('text_answer', '')
-            
-            question = Question.objects.get(id=question_id)
-            answer = Answer.objects.create(
-                exam_attempt=attempt,
-                question=question,
-                text_answer=text_answer
-            )
-            
-            if selected_option_id:
-                selected_option = QuestionOption.objects.get(id=selected_option_id)
-                answer.selected_option = selected_option
-                
-                # Calculate marks for multiple choice questions
-                if question.question_type == 'multiple_choice' and selected_option.is_correct:
-                    answer.marks_obtained = question.marks
-                    total_score += question.marks
-                
-                answer.save()
-        
-        # Update attempt
-        attempt.completed_at = timezone.now()
-        attempt.score = total_score
-        attempt.is_passed = total_score >= exam.passing_marks
-        attempt.status = 'completed'
-        attempt.save()
+        # Grade the whole payload in one pass against the exam's answer key
+        try:
+            attempt = grade_submission(attempt, answers_data)
+        except ValueError as e:
+            logger.warning("Exam submission rejected for attempt %s: %s", attempt.id, e)
+            return Response({'error': str(e)}, 
+                          status=status.HTTP_400_BAD_REQUEST)
         
         serializer = ExamAttemptSerializer(attempt)
         return Response(serializer.data)
@@ -798,9 +878,15 @@ class ExamViewSet(viewsets.ModelViewSet):
     def results(self, request, pk=None):
         """Get exam results."""
         exam = self.get_object()
-        attempts = exam.attempts.all()
-        serializer = ExamAttemptSerializer(attempts, many=True)
-        return Response(serializer.data)
+        return Response(self.serialize_values(exam.attempts.all(), ExamAttemptSerializer))
+
+    @action(detail=True, methods=['post'])
+    def regrade(self, request, pk=None):
+        """Re-score completed attempts against the current answer key."""
+        exam = self.get_object()
+        updated_attempts = regrade_exam(exam)
+        logger.info("Exam %s regraded by %s: %s attempts updated", exam.id, request.user.username, updated_attempts)
+        return Response({'updated_attempts': updated_attempts})
 
     @action(detail=False, methods=['get'])
     def upcoming_exams(self, request):
@@ -866,7 +952,7 @@ class ExamViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class QuestionViewSet(viewsets.ModelViewSet):
+class QuestionViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Question management endpoints.
     """
@@ -884,7 +970,7 @@ class QuestionViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
 
-class QuestionOptionViewSet(viewsets.ModelViewSet):
+class QuestionOptionViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Question option management endpoints.
     """
@@ -902,7 +988,8 @@ class QuestionOptionViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
 
-class ExamAttemptViewSet(viewsets.ReadOnlyModelViewSet):
+class ExamAttemptViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin,
+                         viewsets.ReadOnlyModelViewSet):
     """
     Exam attempt view endpoints.
     """
@@ -911,6 +998,7 @@ class ExamAttemptViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ['exam', 'student', 'is_passed', 'status']
     ordering_fields = ['started_at', 'completed_at', 'score']
+    cursor_ordering = ('-started_at', '-id')
 
     def get_permissions(self):
         permission_classes = [IsOwnerOrAdmin]
@@ -939,7 +1027,7 @@ class ExamAttemptViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
-class FeeTransactionViewSet(viewsets.ModelViewSet):
+class FeeTransactionViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Fee transaction management endpoints.
     """
@@ -948,6 +1036,7 @@ class FeeTransactionViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ['student', 'course', 'transaction_type', 'payment_status']
     ordering_fields = ['transaction_date', 'amount']
+    cursor_ordering = ('-transaction_date', '-id')
 
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
@@ -972,6 +1061,7 @@ class FeeTransactionViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @analytics_replica
     def payment_summary(self, request):
         """Get payment summary for admin."""
         if request.user.role != 'admin':
@@ -1014,7 +1104,7 @@ class FeeTransactionViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class TeacherSalaryViewSet(viewsets.ModelViewSet):
+class TeacherSalaryViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Teacher salary management endpoints.
     """
@@ -1082,7 +1172,7 @@ class TeacherSalaryViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class StudentProgressViewSet(viewsets.ModelViewSet):
+class StudentProgressViewSet(ConditionalGetMixin, SparseFieldsViewMixin, EagerLoadingViewMixin, viewsets.ModelViewSet):
     """
     Student progress management endpoints.
     """
@@ -1159,6 +1249,129 @@ class StudentProgressViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
+class SearchViewSet(viewsets.ViewSet):
+    """
+    Ranked full-text search over courses and study materials.
+    """
+    permission_classes = [IsAuthenticated]
+    # Visibility of each kind is whatever the owning endpoint would list
+    visible_querysets = {
+        'course': CourseViewSet,
+        'material': StudyMaterialViewSet,
+    }
+
+    def list(self, request):
+        """
+        Query params: `q` (required), `type` (course or material) and
+        `limit` (default 20, at most 100). Results are best first and
+        carry an HTML snippet with the matched words in <mark>.
+        """
+        text = request.query_params.get('q', '').strip()
+        kind = request.query_params.get('type')
+        if not text:
+            return Response({'error': 'q parameter required'}, status=status.HTTP_400_BAD_REQUEST)
+        if kind is not None and kind not in self.visible_querysets:
+            return Response({'error': f"type must be one of {', '.join(self.visible_querysets)}"},
+                          status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        hits = search(text, kind)
+        titles = {}
+        for hit_kind, viewset in self.visible_querysets.items():
+            ids = [hit['id'] for hit in hits if hit['kind'] == hit_kind]
+            if ids:
+                queryset = viewset(request=request, format_kwarg=None, action='list').get_queryset()
+                titles[hit_kind] = dict(queryset.filter(pk__in=ids).values_list('pk', 'title'))
+
+        results = []
+        for hit in hits:
+            title = titles.get(hit['kind'], {}).get(hit['id'])
+            if title is None:
+                continue
+            results.append({
+                'type': hit['kind'],
+                'id': hit['id'],
+                'title': title,
+                'snippet': hit['snippet'],
+                'rank': hit['rank'],
+            })
+            if len(results) == limit:
+                break
+        return Response({'query': text, 'results': results})
+
+
+def dashboard_tags(request):
+    """
+    A user's dashboard changes with their own records, courses and exams.
+    Admin dashboards are only tagged with exams; build_dashboard() expires
+    them with the stats snapshot instead.
+    """
+    if request.user.role == 'admin':
+        return ['exams']
+    return [f'user:{request.user.pk}', 'courses', 'exams']
+
+
+class DashboardViewSet(viewsets.ViewSet):
+    """
+    Everything a role's dashboard shows in one request.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @cached_response('dashboard', tags=dashboard_tags, per_user=True)
+    def list(self, request):
+        """
+        Query params: `include`, a comma-separated list of optional
+        sections (progress and transactions for students, salaries for
+        teachers, analytics for admins).
+        """
+        role = request.user.role
+        if role not in DASHBOARD_SECTIONS:
+            return Response({'error': f'No dashboard for role {role}'}, status=status.HTTP_400_BAD_REQUEST)
+        optional = DASHBOARD_SECTIONS[role][1]
+        include = [name.strip() for name in request.query_params.get('include', '').split(',') if name.strip()]
+        unknown = [name for name in include if name not in optional]
+        if unknown:
+            return Response({'error': f"include must be among: {', '.join(optional)}"},
+                          status=status.HTTP_400_BAD_REQUEST)
+        context = {'request': request, 'format': self.format_kwarg, 'view': self}
+        data, changes_at = build_dashboard(request.user, include, context)
+        response = Response(data)
+        if changes_at is not None:
+            # An exam starting or ending, or stale admin stats, changes the sections; expire with it
+            response.cache_timeout = (changes_at - timezone.now()).total_seconds()
+        return response
+
+
+class BatchViewSet(viewsets.ViewSet):
+    """
+    Several API requests in one round trip.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def create(self, request):
+        """
+        Body: {"requests": [{"method": "GET", "url": "/api/...", "body": {...},
+        "id": ...}], "parallel": false}. Returns {"responses": [...]} in
+        request order, each with the sub-request's id, status, ETag /
+        Last-Modified / Location headers and body. With "parallel": true,
+        a batch of read-only requests runs concurrently.
+        """
+        if getattr(request._request, 'is_batch_subrequest', False):
+            return Response({'error': 'Batch requests cannot be nested'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            subrequests = parse_batch(request.data)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        parallel = request.data.get('parallel') is True
+        results = execute_batch(request, subrequests, parallel=parallel)
+        logger.info("Batch of %s requests by %s (parallel=%s)", len(subrequests), request.user.username, parallel)
+        return Response({'responses': results})
+
+
 class AdminViewSet(viewsets.ViewSet):
     """
     Admin-specific endpoints for dashboard and statistics.
@@ -1166,128 +1379,46 @@ class AdminViewSet(viewsets.ViewSet):
     permission_classes = [IsAdminUser]
 
     @action(detail=False, methods=['get'])
+    @analytics_replica
     def stats(self, request):
-        """Get admin dashboard statistics."""
-        # Get basic counts
-        total_users = User.objects.count()
-        total_students = User.objects.filter(role='student').count()
-        total_teachers = User.objects.filter(role='teacher').count()
-        total_courses = Course.objects.count()
-        active_courses = Course.objects.filter(is_active=True).count()
-        
-        # Get revenue data
-        total_revenue = FeeTransaction.objects.filter(
-            payment_status='completed'
-        ).aggregate(
-            total=Sum('amount')
-        )['total'] or 0
-        
-        # Get recent activity
-        recent_enrollments = Enrollment.objects.filter(
-            enrolled_at__gte=datetime.now() - timedelta(days=7)
-        ).count()
-        
-        recent_transactions = FeeTransaction.objects.filter(
-            transaction_date__gte=datetime.now() - timedelta(days=7)
-        ).count()
-        
-        # Get course statistics
-        popular_courses = Course.objects.annotate(
-            enrollment_count=Count('enrollments')
-        ).order_by('-enrollment_count')[:5]
-        
-        return Response({
-            'total_users': total_users,
-            'total_students': total_students,
-            'total_teachers': total_teachers,
-            'total_courses': total_courses,
-            'active_courses': active_courses,
-            'total_revenue': float(total_revenue),
-            'recent_enrollments': recent_enrollments,
-            'recent_transactions': recent_transactions,
-            'popular_courses': [
-                {
-                    'id': course.id,
-                    'title': course.title,
-                    'enrollment_count': course.enrollment_count,
-                    'teacher': course.teacher.full_name
-                }
-                for course in popular_courses
-            ]
-        })
+        """Get admin dashboard statistics (cached briefly, see get_admin_stats)."""
+        return Response(get_admin_stats())
 
     @action(detail=False, methods=['get'])
+    @analytics_replica
     def analytics(self, request):
-        """Get advanced analytics data."""
+        """Get advanced analytics data (summed from the daily rollup tables)."""
         days = int(request.query_params.get('days', 30))
-        start_date = datetime.now() - timedelta(days=days)
-        
-        # Enrollment analytics
-        total_enrollments = Enrollment.objects.filter(
-            enrolled_at__gte=start_date
-        ).count()
-        
-        previous_period_enrollments = Enrollment.objects.filter(
-            enrolled_at__gte=start_date - timedelta(days=days),
-            enrolled_at__lt=start_date
-        ).count()
-        
-        enrollment_change = 0
-        if previous_period_enrollments > 0:
-            enrollment_change = ((total_enrollments - previous_period_enrollments) / previous_period_enrollments) * 100
-        
-        # Revenue analytics
-        total_revenue = FeeTransaction.objects.filter(
-            payment_status='completed',
-            transaction_date__gte=start_date
-        ).aggregate(
-            total=Sum('amount')
-        )['total'] or 0
-        
-        previous_revenue = FeeTransaction.objects.filter(
-            payment_status='completed',
-            transaction_date__gte=start_date - timedelta(days=days),
-            transaction_date__lt=start_date
-        ).aggregate(
-            total=Sum('amount')
-        )['total'] or 0
-        
-        revenue_change = 0
-        if previous_revenue > 0:
-            revenue_change = ((total_revenue - previous_revenue) / previous_revenue) * 100
-        
-        # Course analytics
-        active_courses = Course.objects.filter(is_active=True).count()
-        previous_courses = Course.objects.filter(
-            created_at__gte=start_date - timedelta(days=days),
-            created_at__lt=start_date
-        ).count()
-        
-        course_change = 0
-        if previous_courses > 0:
-            course_change = ((active_courses - previous_courses) / previous_courses) * 100
-        
-        # Retention rate calculation
-        total_students = User.objects.filter(role='student').count()
-        active_students = User.objects.filter(
-            role='student',
-            enrollments__enrolled_at__gte=start_date
-        ).distinct().count()
-        
-        retention_rate = 0
-        if total_students > 0:
-            retention_rate = (active_students / total_students) * 100
-        
-        return Response({
-            'total_enrollments': total_enrollments,
-            'enrollment_change': round(enrollment_change, 2),
-            'total_revenue': float(total_revenue),
-            'revenue_change': round(revenue_change, 2),
-            'active_courses': active_courses,
-            'course_change': round(course_change, 2),
-            'retention_rate': round(retention_rate, 2),
-            'retention_change': 0,  # Placeholder for retention change calculation
-        })
+        return Response(compute_period_analytics(days))
+
+    @action(detail=False, methods=['get'], url_path='analytics/timeseries')
+    @analytics_replica
+    def analytics_timeseries(self, request):
+        """
+        Get bucketed analytics series for charts.
+
+        Query params: `start` and `end` (YYYY-MM-DD, default the last 30
+        days) and `bucket` (day, week or month, default day).
+        """
+        try:
+            end = request.query_params.get('end')
+            end = date.fromisoformat(end) if end else timezone.localdate()
+            start = request.query_params.get('start')
+            start = date.fromisoformat(start) if start else end - timedelta(days=29)
+            data = compute_timeseries(start, end, request.query_params.get('bucket', 'day'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data)
+
+    @action(detail=False, methods=['get'])
+    def db_stats(self, request):
+        """Get the rolling per-endpoint database summary."""
+        return Response(endpoint_db_summary.snapshot())
+
+    @action(detail=False, methods=['get'])
+    def cache_stats(self, request):
+        """Get response cache hit, miss, eviction and invalidation counters."""
+        return Response(response_cache.snapshot())
 
     @action(detail=False, methods=['get'])
     def notifications(self, request):
@@ -1333,8 +1464,9 @@ class AdminViewSet(viewsets.ViewSet):
             'id': 4
         }, status=status.HTTP_201_CREATED)
 
-    @action(detail=False, methods=['get'])
-    def settings(self, request):
+    # Named system_settings so it does not shadow APIView.settings
+    @action(detail=False, methods=['get'], url_path='settings', url_name='settings')
+    def system_settings(self, request):
         """Get system settings."""
         # This would typically come from a Settings model
         # For now, returning default settings
@@ -1368,6 +1500,7 @@ class AdminViewSet(viewsets.ViewSet):
         })
 
     @action(detail=False, methods=['get'])
+    @analytics_replica
     def recent_activity(self, request):
         """Get recent activity for admin dashboard."""
         # Get recent enrollments
@@ -1421,45 +1554,7 @@ class AdminViewSet(viewsets.ViewSet):
         return Response(activities[:15])  # Return top 15 activities
 
     @action(detail=False, methods=['get'])
+    @analytics_replica
     def financial_summary(self, request):
-        """Get financial summary for admin dashboard."""
-        # Get monthly revenue
-        current_month = datetime.now().replace(day=1)
-        monthly_revenue = FeeTransaction.objects.filter(
-            payment_status='completed',
-            transaction_date__gte=current_month
-        ).aggregate(
-            total=Sum('amount')
-        )['total'] or 0
-        
-        # Get revenue by transaction type
-        revenue_by_type = FeeTransaction.objects.filter(
-            payment_status='completed'
-        ).values('transaction_type').annotate(
-            total=Sum('amount')
-        )
-        
-        # Get pending payments
-        pending_payments = FeeTransaction.objects.filter(
-            payment_status='pending'
-        ).count()
-        
-        # Get total revenue
-        total_revenue = FeeTransaction.objects.filter(
-            payment_status='completed'
-        ).aggregate(
-            total=Sum('amount')
-        )['total'] or 0
-        
-        return Response({
-            'monthly_revenue': float(monthly_revenue),
-            'total_revenue': float(total_revenue),
-            'revenue_by_type': [
-                {
-                    'type': item['transaction_type'],
-                    'total': float(item['total'])
-                }
-                for item in revenue_by_type
-            ],
-            'pending_payments': pending_payments
-        }) 
\ No newline at end of file
+        """Get financial summary for admin dashboard (summed from the daily rollup tables)."""
+        return Response(compute_financial_summary()) 
\ No newline at end of file
@@ -1,4 +1,6 @@
 import os
+import sys
+import tempfile
 from pathlib import Path
 from decouple import config
 
@@ -28,6 +30,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Outermost so every other middleware's time and queries are counted
+    'api.middleware.ObservabilityMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -36,11 +40,6 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    # Custom logging middleware
-    'api.middleware.RequestLoggingMiddleware',
-    'api.middleware.PerformanceLoggingMiddleware',
-    'api.middleware.AuthenticationLoggingMiddleware',
-    'api.middleware.APILoggingMiddleware',
     # CSRF exemption for API endpoints
     'api.middleware.CSRFExemptMiddleware',
 ]
@@ -73,6 +72,50 @@ DATABASES = {
     }
 }
 
+# SQLite production profile: WAL so readers never block the writer,
+# relaxed fsync (safe with WAL), a 64MB page cache, memory-mapped reads,
+# waiting on locks instead of failing, BEGIN IMMEDIATE for atomic blocks
+# and persistent connections. Set SQLITE_PROFILE=development for stock
+# settings.
+SQLITE_PROFILE = config('SQLITE_PROFILE', default='development' if DEBUG else 'production')
+SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int)  # milliseconds
+SQLITE_PRODUCTION_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY',
+    f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}',
+]
+
+if SQLITE_PROFILE == 'production':
+    DATABASES['default'].update({
+        'ENGINE': 'eduportal.sqlite_backend',
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(SQLITE_PRODUCTION_PRAGMAS),
+            'transaction_mode': 'IMMEDIATE',
+        },
+    })
+
+# Optional read-only copy of the database for reporting queries, refreshed
+# by `manage.py sync_analytics_replica`. Views marked with
+# api.db_routers.analytics_replica read from it once it exists.
+ANALYTICS_REPLICA_PATH = config('ANALYTICS_REPLICA_PATH', default='')
+if ANALYTICS_REPLICA_PATH:
+    DATABASES['analytics'] = {
+        **DATABASES['default'],
+        'NAME': ANALYTICS_REPLICA_PATH,
+        'OPTIONS': {
+            key: value for key, value in DATABASES['default'].get('OPTIONS', {}).items()
+            if key != 'transaction_mode'
+        },
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['api.db_routers.AnalyticsReplicaRouter']
+
 # Custom User Model
 AUTH_USER_MODEL = 'api.User'
 
@@ -107,9 +150,19 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# API renderer profile: JSON is encoded by orjson when it is installed
+# (api.renderers). The browsable API is only offered in development; set
+# API_RENDERER_PROFILE=development to keep it in production.
+API_RENDERER_PROFILE = config('API_RENDERER_PROFILE', default='development' if DEBUG else 'production')
+API_RENDERER_CLASSES = ['api.renderers.FastJSONRenderer']
+if API_RENDERER_PROFILE == 'development':
+    API_RENDERER_CLASSES.append('rest_framework.renderers.BrowsableAPIRenderer')
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        # Batch sub-requests run as the batch's user (see api.batch)
+        'api.batch.BatchSubrequestAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
@@ -119,14 +172,12 @@ REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # Page numbers by default; views with cursor_ordering also accept ?pagination=cursor
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetPagination',
     'PAGE_SIZE': 10,
-    'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
-    ],
+    'DEFAULT_RENDERER_CLASSES': API_RENDERER_CLASSES,
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'api.renderers.FastJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
@@ -142,6 +193,9 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Let browser clients read the database instrumentation headers
+CORS_EXPOSE_HEADERS = ['X-DB-Queries', 'X-DB-Time', 'Server-Timing']
+
 # CSRF settings for frontend integration
 CSRF_TRUSTED_ORIGINS = [
     "http://localhost:3000",
@@ -167,6 +221,47 @@ CORS_ALLOW_METHODS = [
     'PUT',
 ]
 
+# Database instrumentation (api.middleware.ObservabilityMiddleware)
+DB_SLOW_QUERY_LIMIT = 5  # Slowest statements kept per request
+DB_DUPLICATE_QUERY_THRESHOLD = 5  # Repeats of one statement flagged as N+1
+DB_STATS_WINDOW = 100  # Requests kept per endpoint in the rolling summary
+
+# Admin dashboard statistics are cached this many seconds (api.analytics)
+ADMIN_STATS_CACHE_TIMEOUT = 30
+
+# Seconds an opt-in approximate pagination count may be reused
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
+# Catalog response cache: entry lifetime in seconds and, without a shared
+# cache backend, the size of the in-process LRU
+RESPONSE_CACHE_TIMEOUT = 60
+RESPONSE_CACHE_MAX_ENTRIES = 1000
+
+# Most full-text matches ranked per search before visibility filtering
+SEARCH_MAX_RESULTS = 500
+
+# /api/batch/: most sub-requests per batch, and most threads running the
+# read-only sub-requests of a parallel batch
+BATCH_MAX_REQUESTS = 20
+BATCH_MAX_WORKERS = 4
+
+# Request logging (api.middleware.ObservabilityMiddleware)
+# 'structured': one sampled JSON line per request; 'verbose': full headers and bodies
+REQUEST_LOG_MODE = config('REQUEST_LOG_MODE', default='verbose' if DEBUG else 'structured')
+REQUEST_LOG_SAMPLE_RATES = {'2xx': 0.01, '3xx': 0.01, '4xx': 1.0, '5xx': 1.0}
+REQUEST_LOG_SLOW_THRESHOLD = 1.0  # Seconds; slower requests are always logged
+
+# Logging pipeline (api.log_handlers)
+LOG_QUEUE_SIZE = 10000  # Records buffered per queue; DEBUG is dropped first when it fills
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024  # Rotate log files at 10 MB
+LOG_FILE_BACKUP_COUNT = 5
+# `manage.py test` writes its log files to a temporary directory, at INFO,
+# so test runs do not fill and rotate the real logs/
+TESTING = sys.argv[1:2] == ['test']
+LOG_DIR = config('LOG_DIR', default=os.path.join(tempfile.gettempdir(), 'eduportal-test-logs') if TESTING else 'logs')
+# Level of the api.* loggers; below DEBUG, hot-path debug calls skip formatting
+API_LOG_LEVEL = config('API_LOG_LEVEL', default='DEBUG' if DEBUG and not TESTING else 'INFO')
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
@@ -186,83 +281,111 @@ LOGGING = {
         },
     },
     'handlers': {
+        # Target handlers: written to by the queue_* handlers' background
+        # threads, never attached to a logger directly
         'console': {
             'class': 'logging.StreamHandler',
             'formatter': 'detailed',
             'level': 'DEBUG',
         },
         'file': {
-            'class': 'logging.FileHandler',
-            'filename': 'logs/eduportal.log',
+            'class': 'api.log_handlers.BatchedRotatingFileHandler',
+            'filename': os.path.join(LOG_DIR, 'eduportal.log'),
             'formatter': 'detailed',
             'level': 'INFO',
+            'maxBytes': LOG_FILE_MAX_BYTES,
+            'backupCount': LOG_FILE_BACKUP_COUNT,
         },
         'error_file': {
-            'class': 'logging.FileHandler',
-            'filename': 'logs/errors.log',
+            'class': 'api.log_handlers.BatchedRotatingFileHandler',
+            'filename': os.path.join(LOG_DIR, 'errors.log'),
             'formatter': 'detailed',
             'level': 'ERROR',
+            'maxBytes': LOG_FILE_MAX_BYTES,
+            'backupCount': LOG_FILE_BACKUP_COUNT,
         },
         'api_file': {
-            'class': 'logging.FileHandler',
-            'filename': 'logs/api.log',
+            'class': 'api.log_handlers.BatchedRotatingFileHandler',
+            'filename': os.path.join(LOG_DIR, 'api.log'),
             'formatter': 'detailed',
             'level': 'DEBUG',
+            'maxBytes': LOG_FILE_MAX_BYTES,
+            'backupCount': LOG_FILE_BACKUP_COUNT,
+        },
+        # Queue handlers: request threads only enqueue records. Named so
+        # they sort after their targets, which dictConfig must build first;
+        # built with '()' so Python 3.12+ does not treat them as stock
+        # QueueHandlers and replace their `handlers` with a queue
+        'queue_default': {
+            '()': 'api.log_handlers.AsyncQueueHandler',
+            'handlers': ['console', 'file'],
+            'maxsize': LOG_QUEUE_SIZE,
+        },
+        'queue_errors': {
+            '()': 'api.log_handlers.AsyncQueueHandler',
+            'handlers': ['console', 'error_file'],
+            'maxsize': LOG_QUEUE_SIZE,
+        },
+        'queue_api': {
+            '()': 'api.log_handlers.AsyncQueueHandler',
+            'handlers': ['console', 'api_file'],
+            'maxsize': LOG_QUEUE_SIZE,
         },
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue_default'],
             'level': 'INFO',
             'propagate': False,
         },
         'django.request': {
-            'handlers': ['console', 'error_file'],
+            'handlers': ['queue_errors'],
             'level': 'ERROR',
             'propagate': False,
         },
+        # Per-request query counts and timings come from
+        # ObservabilityMiddleware; raise to DEBUG to see every statement
         'django.db.backends': {
-            'handlers': ['console'],
-            'level': 'DEBUG',
+            'handlers': ['queue_default'],
+            'level': config('DB_LOG_LEVEL', default='INFO'),
             'propagate': False,
         },
         'api': {
-            'handlers': ['console', 'api_file'],
-            'level': 'DEBUG',
+            'handlers': ['queue_api'],
+            'level': API_LOG_LEVEL,
             'propagate': False,
         },
         'api.views': {
-            'handlers': ['console', 'api_file'],
-            'level': 'DEBUG',
+            'handlers': ['queue_api'],
+            'level': API_LOG_LEVEL,
             'propagate': False,
         },
         'api.models': {
-            'handlers': ['console', 'api_file'],
-            'level': 'DEBUG',
+            'handlers': ['queue_api'],
+            'level': API_LOG_LEVEL,
             'propagate': False,
         },
         'api.serializers': {
-            'handlers': ['console', 'api_file'],
-            'level': 'DEBUG',
+            'handlers': ['queue_api'],
+            'level': API_LOG_LEVEL,
             'propagate': False,
         },
         'api.permissions': {
-            'handlers': ['console', 'api_file'],
-            'level': 'DEBUG',
+            'handlers': ['queue_api'],
+            'level': API_LOG_LEVEL,
             'propagate': False,
         },
         'api.authentication': {
-            'handlers': ['console', 'api_file'],
-            'level': 'DEBUG',
+            'handlers': ['queue_api'],
+            'level': API_LOG_LEVEL,
             'propagate': False,
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue_default'],
         'level': 'INFO',
     },
 }
 
 # Create logs directory if it doesn't exist
-import os
-os.makedirs('logs', exist_ok=True) 
\ No newline at end of file
+os.makedirs(LOG_DIR, exist_ok=True) 
\ No newline at end of file
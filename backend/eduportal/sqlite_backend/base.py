@@ -0,0 +1,56 @@
+"""
+SQLite backend with the two connection options Django 5.1 added to the
+stock backend, for use on Django 4.2:
+
+- OPTIONS['init_command']: semicolon-separated statements (typically
+  PRAGMAs) run on every new connection.
+- OPTIONS['transaction_mode']: DEFERRED, IMMEDIATE or EXCLUSIVE, used for
+  the BEGIN that starts each atomic block. IMMEDIATE takes the write lock
+  up front, so a transaction that reads and then writes waits on
+  busy_timeout instead of failing with "database is locked" when another
+  writer got there first.
+
+On Django 5.1+ the stock backend understands both options and is used as is.
+"""
+import django
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+
+if django.VERSION >= (5, 1):
+    DatabaseWrapper = base.DatabaseWrapper
+else:
+    class DatabaseWrapper(base.DatabaseWrapper):
+        def get_connection_params(self):
+            kwargs = super().get_connection_params()
+            # Not sqlite3.connect() arguments; handled below
+            kwargs.pop('init_command', None)
+            kwargs.pop('transaction_mode', None)
+            return kwargs
+
+        def get_new_connection(self, conn_params):
+            conn = super().get_new_connection(conn_params)
+            init_command = self.settings_dict['OPTIONS'].get('init_command')
+            if init_command:
+                for statement in init_command.split(';'):
+                    if statement.strip():
+                        conn.execute(statement)
+            return conn
+
+        @property
+        def transaction_mode(self):
+            mode = self.settings_dict['OPTIONS'].get('transaction_mode')
+            if mode is None:
+                return None
+            mode = mode.upper()
+            if mode not in TRANSACTION_MODES:
+                raise ImproperlyConfigured(
+                    f"settings.DATABASES['{self.alias}']['OPTIONS']['transaction_mode'] "
+                    f"must be one of {', '.join(TRANSACTION_MODES)}"
+                )
+            return mode
+
+        def _start_transaction_under_autocommit(self):
+            mode = self.transaction_mode
+            self.cursor().execute(f'BEGIN {mode}' if mode else 'BEGIN')